@@ -1 +1,45 @@
-from .quantities import SIUnits, SIDerivedUnits, ImperialUnits
+from importlib import import_module
+
+
+# Nothing is imported until it is first used (PEP 562), so `import PyUnits`
+# does not pay for the unit classes. `PyUnits.SIUnits` loads that module and
+# `PyUnits.meterUnit` looks the factory up in the factory modules.
+
+_submodules = {
+    "SIUnits": ".quantities.SIUnits",
+    "SIDerivedUnits": ".quantities.SIDerivedUnits",
+    "ImperialUnits": ".quantities.ImperialUnits",
+    "BaseQuantities": ".quantities.BaseQuantities",
+    "Conversions": ".quantities.Conversions",
+    "Registry": ".quantities.Registry",
+    "prefixes": ".prefixes",
+    "quantities": ".quantities",
+    "unitRepresentation": ".unitRepresentation",
+}
+
+_factoryModules = ("SIUnits", "SIDerivedUnits", "ImperialUnits")
+
+__all__ = ["SIUnits", "SIDerivedUnits", "ImperialUnits"]
+
+
+def __getattr__(name: str):
+    path = _submodules.get(name)
+    if path is not None:
+        value = import_module(path, __name__)
+    elif name.endswith("Unit") and not name.startswith("_"):
+        for moduleName in _factoryModules:
+            module = __getattr__(moduleName)
+            value = getattr(module, name, None)
+            # only the factories defined there, not the classes they import
+            if getattr(value, "__module__", None) == module.__name__:
+                break
+        else:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # cached, so later lookups don't come back here
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules))
@@ -9,3 +9,13 @@ def magnitudeFactor(symbol_from: str, symbol_to: str) -> int:
 
 def isValidPrefix(symbol: str) -> bool:
     return symbol == "" or symbol in si_prefixes
+
+# 10**exp for every exponent reachable by adding or subtracting two prefixes.
+_maxExponent = 2 * max(abs(exp) for exp in si_prefixes.values())
+powersOf10 = {exp: 10**exp for exp in range(-_maxExponent, _maxExponent+1)}
+
+def pow10(exp: int):
+    result = powersOf10.get(exp)
+    if result is None:
+        return 10**exp
+    return result
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from math import isclose
+from numbers import Number
+from typing import Dict, Union
+
+from ..prefixes import SIPrefixes
+from ..unitRepresentation.Units import RepresentableUnit, RepresentableValueUnit
+from ..unitRepresentation.Dimensions import Dimension, dimensionalize, toDimension
+from . import SIUnits, SIDerivedUnits, ImperialUnits
+
+
+# A value `v` of a unit is `v*factor + offset` in its coherent SI unit.
+Conversion = namedtuple("Conversion", ["unit", "factor", "offset"])
+
+
+_linearFactories = {
+    "m": SIUnits.meterUnit,
+    "cm": SIUnits.centimeterUnit,
+    "mm": SIUnits.millimeterUnit,
+    "km": SIUnits.kilometerUnit,
+    "ha": SIUnits.hectareUnit,
+    "L": SIUnits.litreUnit,
+    "g": SIUnits.gramUnit,
+    "kg": SIUnits.kilogramUnit,
+    "t": SIUnits.tonneUnit,
+    "K": SIUnits.kelvinUnit,
+    "s": SIUnits.secondUnit,
+    "min": SIUnits.minuteUnit,
+    "h": SIUnits.hourUnit,
+    "d": SIUnits.dayUnit,
+    "mol": SIUnits.molUnit,
+    "A": SIUnits.ampereUnit,
+    "cd": SIUnits.candelaUnit,
+
+    "Hz": SIDerivedUnits.hertzUnit,
+    "N": SIDerivedUnits.newtonUnit,
+    "Pa": SIDerivedUnits.pascalUnit,
+    "J": SIDerivedUnits.jouleUnit,
+    "W": SIDerivedUnits.wattUnit,
+    "C": SIDerivedUnits.coulombUnit,
+    "V": SIDerivedUnits.voltUnit,
+    "F": SIDerivedUnits.faradUnit,
+    "Ω": SIDerivedUnits.ohmUnit,
+    "S": SIDerivedUnits.siemensUnit,
+    "Wb": SIDerivedUnits.weberUnit,
+    "T": SIDerivedUnits.teslaUnit,
+    "H": SIDerivedUnits.henryUnit,
+
+    "th": ImperialUnits.thouUnit,
+    "in": ImperialUnits.inchUnit,
+    "ft": ImperialUnits.footUnit,
+    "yd": ImperialUnits.yardUnit,
+    "ch": ImperialUnits.chainUnit,
+    "fur": ImperialUnits.furlongUnit,
+    "mi": ImperialUnits.mileUnit,
+    "perch": ImperialUnits.perchUnit,
+    "rood": ImperialUnits.roodUnit,
+    "acre": ImperialUnits.acreUnit,
+    "lb": ImperialUnits.poundUnit,
+}
+
+# (factor, offset) of the units that are not proportional to kelvin.
+_affineTemperatures = {
+    "°C": (1, 273.15),
+    "°F": (5/9, 273.15 - 32*5/9),
+}
+
+
+def _buildTable() -> Dict[str, Conversion]:
+    table = dict()
+    for symbol, factory in _linearFactories.items():
+        quantity = dimensionalize(factory(1))
+        table[symbol] = Conversion(quantity.unit, float(quantity), 0)
+    kelvin = dimensionalize(SIUnits.kelvinUnit(1)).unit
+    for symbol, (factor, offset) in _affineTemperatures.items():
+        table[symbol] = Conversion(kelvin, factor, offset)
+    return table
+
+conversionTable: Dict[str, Conversion] = _buildTable()
+
+
+def getConversion(unit: Union[str, RepresentableUnit]) -> Conversion:
+    if isinstance(unit, str):
+        conversion = conversionTable.get(unit)
+        if conversion is None:
+            raise ValueError(f"Unknown unit: {unit}.")
+        return conversion
+    if isinstance(unit, RepresentableUnit):
+        dim = toDimension(unit)
+        if dim is None:
+            raise ValueError(f"{unit} can't be expressed in SI base quantities.")
+        return Conversion(Dimension(dim.exponents), SIPrefixes.pow10(dim.exp10), 0)
+    raise TypeError("Expected a unit symbol or an unit type, not an " + type(unit).__name__ + ".")
+
+def conversionFactor(fromUnit: Union[str, RepresentableUnit], toUnit: Union[str, RepresentableUnit]):
+    source = getConversion(fromUnit)
+    target = getConversion(toUnit)
+    if source.unit != target.unit:
+        raise ValueError(f"Can't convert from [{source.unit}] to [{target.unit}].")
+    scale = source.factor / target.factor
+    shift = (source.offset - target.offset) / target.factor
+    return scale, shift
+
+def convert(values, fromUnit: Union[str, RepresentableUnit], toUnit: Union[str, RepresentableUnit]):
+    scale, shift = conversionFactor(fromUnit, toUnit)
+    # quantities (QuantityArray too, without importing numpy) must be in
+    # `fromUnit`; their values are converted as plain numbers
+    if isinstance(values, RepresentableValueUnit) or (hasattr(values, "unit") and hasattr(values, "exp10")):
+        _checkUnit(values.unit, fromUnit)
+        values = values.magnitude if isinstance(values, RepresentableValueUnit) else values.toNumpy()
+    if isinstance(values, Number) or hasattr(values, "__array_ufunc__"):
+        if shift == 0:
+            return values * scale
+        return values * scale + shift
+    if shift == 0:
+        return [value * scale for value in values]
+    return [value * scale + shift for value in values]
+
+def _checkUnit(unit: RepresentableUnit, fromUnit: Union[str, RepresentableUnit]):
+    source = getConversion(fromUnit)
+    own = getConversion(unit)
+    if own.unit != source.unit or own.offset != source.offset or not isclose(own.factor, source.factor):
+        raise ValueError(f"The values are in [{unit}], not in [{fromUnit}].")
@@ -25,22 +25,13 @@ def mileUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
 
 def perchUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
     mul = 5.0292
-    result = SIUnits.meterUnit(mul, power=power)
-    result *= SIUnits.meterUnit(mul, exp10=exp10, power=power)
-    result *= value
-    return result
+    return SIUnits.meterUnit(mul*mul*value, exp10=exp10, power=2*power)
 def roodUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
     mul = 5.0292
-    result = SIUnits.meterUnit(40*mul, power=power)
-    result *= SIUnits.meterUnit(mul, exp10=exp10, power=power)
-    result *= value
-    return result
+    return SIUnits.meterUnit(40*mul*mul*value, exp10=exp10, power=2*power)
 def acreUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
     mul = 5.0292
-    result = SIUnits.meterUnit(40*mul, power=power)
-    result *= SIUnits.meterUnit(4*mul, exp10=exp10, power=power)
-    result *= value
-    return result
+    return SIUnits.meterUnit(40*mul*(4*mul)*value, exp10=exp10, power=2*power)
 
 
 def poundUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
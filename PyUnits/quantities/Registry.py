@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from collections import namedtuple
+from math import log10
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from ..prefixes import SIPrefixes
+from ..unitRepresentation.AlgebraCache import AlgebraCache
+from ..unitRepresentation.Units import RepresentableUnit, RepresentableValueUnit, Unit, ValueUnits
+from ..unitRepresentation.Dimensions import Dimension, dimensionalize, toDimension
+from . import SIDerivedUnits, ImperialUnits, Conversions
+
+
+# A value `v` of the unit is `v*factor + offset` in `dimension`, its
+# coherent SI unit.
+RegisteredUnit = namedtuple("RegisteredUnit", ["symbol", "name", "dimension", "factor", "offset", "factory"])
+
+# Reverse lookup result: `prefix + unit.symbol` names the unit, up to a
+# remaining scale of 10**exp10.
+UnitMatch = namedtuple("UnitMatch", ["unit", "prefix", "exp10"])
+
+_prefixByExponent = {exp: prefix for prefix, exp in SIPrefixes.si_prefixes.items()}
+_prefixByExponent[0] = ""
+
+def _powerOf10(factor) -> Optional[int]:
+    if not isinstance(factor, (int, float)) or factor <= 0:
+        return None
+    exp = round(log10(factor))
+    if abs(factor - SIPrefixes.pow10(exp)) > 1e-12 * factor:
+        return None
+    return exp
+
+
+class UnitRegistry:
+
+    # attributes:
+    # self._bySymbol: Dict[str, RegisteredUnit]
+    # self._byName: Dict[str, RegisteredUnit]
+    # self._byDimension: Dict[tuple, List[RegisteredUnit]]
+    # self._byScale: Dict[tuple, RegisteredUnit]
+    # self._prefixBase: Dict[tuple, Tuple[RegisteredUnit, int]]
+    # self._lookups: AlgebraCache
+
+    # Every index is keyed by what the lookup gets, so a lookup is one dict
+    # access: the exponent vector for the dimension, and the exponent vector
+    # with the power of ten of the factor for the reverse lookup. The
+    # exponent vector of a unit is cached too.
+
+    def __init__(self):
+        self._bySymbol: Dict[str, RegisteredUnit] = dict()
+        self._byName: Dict[str, RegisteredUnit] = dict()
+        self._byDimension: Dict[tuple, List[RegisteredUnit]] = dict()
+        self._byScale: Dict[tuple, RegisteredUnit] = dict()
+        self._prefixBase: Dict[tuple, Tuple[RegisteredUnit, int]] = dict()
+        self._lookups: AlgebraCache = AlgebraCache(maxsize=1024)
+
+    def register(self, symbol: str, name: str, quantity: Union[RepresentableValueUnit, RepresentableUnit], *,
+                 offset=0, factory: Optional[Callable]=None, prefixable: bool=False) -> RegisteredUnit:
+        # `quantity` is one of the new unit, e.g. register("ftlb", "footPound",
+        # ImperialUnits.footUnit(1) * ImperialUnits.poundUnit(1)).
+        # Prefixable units get SI prefixes in reverse lookups ("mN", "kL").
+        if not isinstance(symbol, str) or not symbol:
+            raise TypeError("Parameter `symbol` must be a non-empty str.")
+        if not isinstance(name, str) or not name:
+            raise TypeError("Parameter `name` must be a non-empty str.")
+        if isinstance(quantity, RepresentableUnit):
+            quantity = ValueUnits(1, quantity)
+        if not isinstance(quantity, RepresentableValueUnit):
+            raise TypeError("Parameter `quantity` must be an unit type or a value with units, not an " + type(quantity).__name__ + ".")
+        if symbol in self._bySymbol:
+            raise ValueError(f"Unit symbol {symbol!r} is already registered.")
+        if name in self._byName:
+            raise ValueError(f"Unit name {name!r} is already registered.")
+
+        quantity = dimensionalize(quantity)
+        entry = RegisteredUnit(symbol, name, quantity.unit, float(quantity), offset, factory)
+        key = entry.dimension.exponents
+        self._bySymbol[symbol] = entry
+        self._byName[name] = entry
+        self._byDimension.setdefault(key, list()).append(entry)
+        exp = _powerOf10(entry.factor) if offset == 0 else None
+        if exp is not None:
+            self._byScale.setdefault((key, exp), entry)
+            if prefixable:
+                self._prefixBase.setdefault(key, (entry, exp))
+        Conversions.conversionTable.setdefault(symbol, Conversions.Conversion(entry.dimension, entry.factor, offset))
+        self._lookups.clear()
+        return entry
+
+
+    def bySymbol(self, symbol: str) -> Optional[RegisteredUnit]:
+        return self._bySymbol.get(symbol)
+
+    def byName(self, name: str) -> Optional[RegisteredUnit]:
+        return self._byName.get(name)
+
+    def byDimension(self, unit: RepresentableUnit) -> Tuple[RegisteredUnit, ...]:
+        dim = self._dimension(unit)
+        if dim is None:
+            return ()
+        return tuple(self._byDimension.get(dim.exponents, ()))
+
+    def __getitem__(self, key: str) -> RegisteredUnit:
+        entry = self._bySymbol.get(key)
+        if entry is None:
+            entry = self._byName.get(key)
+            if entry is None:
+                raise KeyError(key)
+        return entry
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._bySymbol or key in self._byName
+
+    def __len__(self) -> int:
+        return len(self._bySymbol)
+
+    def __iter__(self) -> Iterator[RegisteredUnit]:
+        return iter(self._bySymbol.values())
+
+
+    def _dimension(self, unit: RepresentableUnit) -> Optional[Dimension]:
+        if not isinstance(unit, RepresentableUnit):
+            raise TypeError("Expected an unit type, not an " + type(unit).__name__ + ".")
+        return self._lookups.get(unit, lambda: toDimension(unit))
+
+    def lookup(self, unit: RepresentableUnit, exp10: int=0) -> Optional[UnitMatch]:
+        # kg*m/(s^2) -> N, g*m/(s^2) -> mN, (m^3)/1000 -> L; `exp10` is a
+        # scale to fold in too when a unit or prefix has it
+        dim = self._dimension(unit)
+        if dim is None:
+            return None
+        key = dim.exponents
+        base = self._prefixBase.get(key)
+        for scale, rest in ((dim.exp10 + exp10, 0), (dim.exp10, exp10)):
+            entry = self._byScale.get((key, scale))
+            if entry is not None:
+                return UnitMatch(entry, "", rest)
+            if base is not None:
+                prefix = _prefixByExponent.get(scale - base[1])
+                if prefix is not None:
+                    return UnitMatch(base[0], prefix, rest)
+        if base is not None:
+            return UnitMatch(base[0], "", dim.exp10 + exp10 - base[1])
+        entry = self._byScale.get((key, 0))
+        if entry is not None:
+            return UnitMatch(entry, "", dim.exp10 + exp10)
+        return None
+
+    def displayUnit(self, unit: RepresentableUnit) -> str:
+        match = self.lookup(unit)
+        if match is None or match.exp10 != 0:
+            return str(unit)
+        return match.prefix + match.unit.symbol
+
+    def displayQuantity(self, quantity: RepresentableValueUnit) -> str:
+        # 3e3 [g*m/(s^2)] -> 3 [N]
+        if not isinstance(quantity, RepresentableValueUnit):
+            return str(quantity)
+        match = self.lookup(quantity.unit, quantity.exp10)
+        if match is None:
+            return str(quantity)
+        return str(ValueUnits(quantity.value, Unit(match.unit.symbol, match.prefix), match.exp10))
+
+
+# Units whose name takes SI prefixes. kg is left out: its prefixed forms are
+# those of g.
+_prefixable = {
+    "m", "g", "L", "K", "s", "mol", "A", "cd",
+    "Hz", "N", "Pa", "J", "W", "C", "V", "F", "Ω", "S", "Wb", "T", "H",
+}
+
+def _buildRegistry() -> UnitRegistry:
+    units = UnitRegistry()
+    for symbol, factory in Conversions._linearFactories.items():
+        name = factory.__name__[:-len("Unit")]
+        units.register(symbol, name, factory(1), factory=factory, prefixable=symbol in _prefixable)
+    for symbol, factory in (("°C", SIDerivedUnits.celsiusUnit), ("°F", ImperialUnits.fahrenheitUnit)):
+        conversion = Conversions.conversionTable[symbol]
+        name = factory.__name__[:-len("Unit")]
+        units.register(symbol, name, ValueUnits(conversion.factor, conversion.unit), offset=conversion.offset, factory=factory)
+    return units
+
+registry: UnitRegistry = _buildRegistry()
+
+
+def register(symbol: str, name: str, quantity: Union[RepresentableValueUnit, RepresentableUnit], *,
+             offset=0, factory: Optional[Callable]=None, prefixable: bool=False) -> RegisteredUnit:
+    return registry.register(symbol, name, quantity, offset=offset, factory=factory, prefixable=prefixable)
+
+def lookup(unit: RepresentableUnit) -> Optional[UnitMatch]:
+    return registry.lookup(unit)
+
+def displayUnit(unit: RepresentableUnit) -> str:
+    return registry.displayUnit(unit)
+
+def displayQuantity(quantity: RepresentableValueUnit) -> str:
+    return registry.displayQuantity(quantity)
@@ -1,10 +1,83 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from ..TypesHelper import Number_t
-from . import SIUnits
+from . import SIUnits, BaseQuantities
+from ..unitRepresentation import Units
 from ..prefixes import SIPrefixes
 
 
+# Units of each derived quantity, built once per power. They combine the
+# base units in the same order as the ValueUnits formulas they replace,
+# so the printed units are unchanged.
+
+def _kg(power: Number_t):
+    return BaseQuantities.MassUnit(power=power)
+def _m(power: Number_t):
+    return BaseQuantities.LengthUnit(power=power)
+def _s(power: Number_t):
+    return BaseQuantities.TimeUnit(power=power)
+def _A(power: Number_t):
+    return BaseQuantities.ElectricCurrentUnit(power=power)
+def _reciprocal(unit):
+    if isinstance(unit, Units.RepresentableUnit):
+        return None / unit
+    return 1 / unit
+
+@lru_cache(maxsize=None, typed=True)
+def hertzTemplate(power: Number_t):
+    return _reciprocal(_s(power))
+
+@lru_cache(maxsize=None, typed=True)
+def newtonTemplate(power: Number_t):
+    return _kg(power) * _m(power) / _s(2*power)
+
+@lru_cache(maxsize=None, typed=True)
+def pascalTemplate(power: Number_t):
+    return _kg(power) / _m(power) / _s(2*power)
+
+@lru_cache(maxsize=None, typed=True)
+def jouleTemplate(power: Number_t):
+    return _kg(power) * _m(2*power) / _s(2*power)
+
+@lru_cache(maxsize=None, typed=True)
+def wattTemplate(power: Number_t):
+    return _kg(power) * _m(2*power) / _s(3*power)
+
+@lru_cache(maxsize=None, typed=True)
+def coulombTemplate(power: Number_t):
+    return _s(power) * _A(power)
+
+@lru_cache(maxsize=None, typed=True)
+def voltTemplate(power: Number_t):
+    return _kg(power) * _m(2*power) / (_s(3*power) * _A(power))
+
+@lru_cache(maxsize=None, typed=True)
+def faradTemplate(power: Number_t):
+    return coulombTemplate(power) / voltTemplate(power)
+
+@lru_cache(maxsize=None, typed=True)
+def ohmTemplate(power: Number_t):
+    return voltTemplate(power) / _A(power)
+
+@lru_cache(maxsize=None, typed=True)
+def siemensTemplate(power: Number_t):
+    return _reciprocal(ohmTemplate(power))
+
+@lru_cache(maxsize=None, typed=True)
+def weberTemplate(power: Number_t):
+    return jouleTemplate(power) / _A(power)
+
+@lru_cache(maxsize=None, typed=True)
+def teslaTemplate(power: Number_t):
+    return _kg(power) / _A(power) / _s(2*power)
+
+@lru_cache(maxsize=None, typed=True)
+def henryTemplate(power: Number_t):
+    return voltTemplate(power) * _s(power) / _A(power)
+
+
 def celsiusUnit(value: Number_t, *, power: Number_t=1):
     return SIUnits.kelvinUnit(value + 273.15, power=power)
 
@@ -12,95 +85,78 @@ def hertzUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return value/SIUnits.secondUnit(1, exp10=-exp, power=power)
+    return Units.ValueUnits(value/1, hertzTemplate(power), exp)
 
 def newtonUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, power=power) * SIUnits.meterUnit(1, exp10=exp, power=power)
-    result /= SIUnits.secondUnit(1, power=2*power)
-    return result
+    return Units.ValueUnits(value/1, newtonTemplate(power), exp)
 
 def pascalUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, exp10=exp, power=power) / SIUnits.meterUnit(1, power=power)
-    result /= SIUnits.secondUnit(1, power=2*power)
-    return result
+    return Units.ValueUnits(value/1, pascalTemplate(power), exp)
 
 def jouleUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, power=power) * SIUnits.meterUnit(1, exp10=exp, power=2*power)
-    result /= SIUnits.secondUnit(1, power=2*power)
-    return result
+    return Units.ValueUnits(value/1, jouleTemplate(power), exp)
 
 def wattUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, power=power) * SIUnits.meterUnit(1, exp10=exp, power=2*power)
-    result /= SIUnits.secondUnit(1, power=3*power)
-    return result
+    return Units.ValueUnits(value/1, wattTemplate(power), exp)
 
 def coulombUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.secondUnit(value, power=power) * SIUnits.ampereUnit(1, exp10=exp, power=power)
-    return result
+    return Units.ValueUnits(value*1, coulombTemplate(power), exp)
 
 def voltUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, power=power) * SIUnits.meterUnit(1, exp10=exp, power=2*power)
-    result /= SIUnits.secondUnit(1, power=3*power) * SIUnits.ampereUnit(1, power=power)
-    return result
+    return Units.ValueUnits(value/1, voltTemplate(power), exp)
 
 def faradUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = coulombUnit(value, exp10=exp, power=power) / voltUnit(1, power=power)
-    return result
+    # divided by voltUnit(1), whose value is the float 1.0
+    return Units.ValueUnits(value/1.0, faradTemplate(power), exp)
 
 def ohmUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = voltUnit(value, exp10=exp, power=power) / SIUnits.ampereUnit(1, power=power)
-    return result
+    return Units.ValueUnits(value/1, ohmTemplate(power), exp)
 
 def siemensUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = value / ohmUnit(1, exp10=-exp, power=power)
-    return result
+    # divided by ohmUnit(1), whose value is the float 1.0
+    return Units.ValueUnits(value/1.0, siemensTemplate(power), exp)
 
 def weberUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = jouleUnit(value, exp10=exp, power=power) / SIUnits.ampereUnit(1, power=power)
-    return result
+    return Units.ValueUnits(value/1, weberTemplate(power), exp)
 
 def teslaUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = SIUnits.kilogramUnit(value, exp10=exp, power=power) / SIUnits.ampereUnit(1, power=power)
-    result /= SIUnits.secondUnit(1, power=2*power)
-    return result
+    return Units.ValueUnits(value/1, teslaTemplate(power), exp)
 
 def henryUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
     exp = SIPrefixes.magnitudeFactor(prefix, "")*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    result = voltUnit(value, exp10=exp, power=power) * SIUnits.secondUnit(1, power=power)
-    result /= SIUnits.ampereUnit(1, power=power)
-    return result
+    return Units.ValueUnits(value/1, henryTemplate(power), exp)
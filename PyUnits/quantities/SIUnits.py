@@ -33,7 +33,7 @@ def gramUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
 
 def kilogramUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
     return gramUnit(value, prefix="k", exp10=exp10, power=power)
@@ -46,7 +46,7 @@ def kelvinUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
 
 
 def secondUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
@@ -54,7 +54,7 @@ def secondUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
 
 def minuteUnit(value: Number_t, *, exp10: int=0, power: Number_t=1):
     return secondUnit(value*60, exp10=exp10, power=power)
@@ -69,7 +69,7 @@ def molUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1)
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
 
 
 def ampereUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
@@ -77,7 +77,7 @@ def ampereUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
 
 
 def candelaUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_t=1):
@@ -85,4 +85,4 @@ def candelaUnit(value: Number_t, *, exp10: int=0, prefix: str="", power: Number_
     exp = SIPrefixes.magnitudeFactor(prefix, unit.defaultPrefix)*power + exp10
     if not isinstance(exp, int):
         raise RuntimeError()
-    return Units.ValueUnits(value, unit, exp10)
+    return Units.ValueUnits(value, unit, exp)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import builtins
+import math
+from typing import Iterable, Iterator, Optional, Union
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from .Units import RepresentableUnit, RepresentableValueUnit, ValueUnits, FloatValueUnits, typeKind, KIND_VALUE
+
+
+# Reductions over any iterable of quantities, generators included:
+#   Aggregations.sum(readings), Aggregations.mean(meter.samples())
+# The first quantity sets the unit and exp10 of the result. The others are
+# checked against that unit once per distinct unit, rescaled to that exp10
+# and accumulated as plain numbers; only the result is a ValueUnits.
+# Quantities must share the unit (prefixes included) and the numeric mode,
+# as they must for `+`.
+
+
+_end = object()
+
+
+class _Scaled:
+
+    # attributes:
+    # self._quantities: Iterator
+    # self.first: Optional[RepresentableValueUnit]
+    # self.unit: Optional[RepresentableUnit]
+    # self.exp10: int
+    # self.count: int
+
+    # Iterating yields the values, rescaled to the exp10 of the first
+    # quantity. It can only be iterated once.
+
+    def __init__(self, quantities: Iterable[RepresentableValueUnit]):
+        self._quantities: Iterator = iter(quantities)
+        self.first: Optional[RepresentableValueUnit] = None
+        self.unit: Optional[RepresentableUnit] = None
+        self.exp10: int = 0
+        self.count: int = 0
+
+    def __iter__(self) -> Iterator[Number_t]:
+        quantities = self._quantities
+        first = next(quantities, _end)
+        if first is _end:
+            return
+        if not typeKind(first) & KIND_VALUE:
+            raise TypeError("Expected a value with units, not an " + type(first).__name__ + ".")
+        self.first = first
+        self.unit = unit = first.unit
+        self.exp10 = exp10 = first.exp10
+        self.count = 1
+        cls = type(first)
+        checked = {unit}
+        lastUnit = unit
+        scales = dict()
+        yield first.value
+
+        for quantity in quantities:
+            if type(quantity) is not cls:
+                raise _mismatch(quantity, cls)
+            quantityUnit = quantity.unit
+            if quantityUnit is not lastUnit:
+                if quantityUnit not in checked:
+                    if not unit.hasSameUnit(quantityUnit):
+                        raise ValueError(f"Can't aggregate [{quantityUnit}] with [{unit}].")
+                    checked.add(quantityUnit)
+                lastUnit = quantityUnit
+            self.count += 1
+            if quantity.exp10 == exp10:
+                yield quantity.value
+            else:
+                delta = quantity.exp10 - exp10
+                scale = scales.get(delta)
+                if scale is None:
+                    scale = scales[delta] = SIPrefixes.pow10(delta)
+                yield quantity.value * scale
+
+    def result(self, value: Number_t, unit: Optional[RepresentableUnit]=None, exp10: Optional[int]=None) -> RepresentableValueUnit:
+        unit = self.unit if unit is None else unit
+        exp10 = self.exp10 if exp10 is None else exp10
+        if type(self.first) is FloatValueUnits:
+            return FloatValueUnits(value, unit)
+        return ValueUnits(value, unit, exp10, numeric="exact")
+
+def _mismatch(quantity, cls: type) -> TypeError:
+    if not typeKind(quantity) & KIND_VALUE:
+        return TypeError("Expected a value with units, not an " + type(quantity).__name__ + ".")
+    return TypeError("Can not mix quantities in 'exact' and 'float' modes; convert them with toFloat() or toExact().")
+
+def _empty(name: str) -> ValueError:
+    return ValueError(f"{name}() of an empty iterable of quantities.")
+
+
+def sum(quantities: Iterable[RepresentableValueUnit]) -> Union[RepresentableValueUnit, int]:
+    # 0 for no quantities, like builtins.sum
+    scaled = _Scaled(quantities)
+    total = builtins.sum(scaled)
+    if scaled.first is None:
+        return 0
+    return scaled.result(total)
+
+def fsum(quantities: Iterable[RepresentableValueUnit]) -> Union[RepresentableValueUnit, float]:
+    # math.fsum of the rescaled values: no rounding error builds up
+    scaled = _Scaled(quantities)
+    total = math.fsum(scaled)
+    if scaled.first is None:
+        return 0.0
+    return scaled.result(total)
+
+def mean(quantities: Iterable[RepresentableValueUnit]) -> RepresentableValueUnit:
+    scaled = _Scaled(quantities)
+    total = builtins.sum(scaled)
+    if scaled.first is None:
+        raise _empty("mean")
+    return scaled.result(total / scaled.count)
+
+
+def min(quantities: Iterable[RepresentableValueUnit]) -> RepresentableValueUnit:
+    scaled = _Scaled(quantities)
+    result = builtins.min(scaled, default=None)
+    if scaled.first is None:
+        raise _empty("min")
+    return scaled.result(result)
+
+def max(quantities: Iterable[RepresentableValueUnit]) -> RepresentableValueUnit:
+    scaled = _Scaled(quantities)
+    result = builtins.max(scaled, default=None)
+    if scaled.first is None:
+        raise _empty("max")
+    return scaled.result(result)
+
+
+def variance(quantities: Iterable[RepresentableValueUnit], *, ddof: int=1) -> RepresentableValueUnit:
+    # Sample variance by default; ddof=0 gives the population variance.
+    # One pass (Welford), in the squared unit.
+    if not isinstance(ddof, int) or ddof < 0:
+        raise ValueError("Parameter `ddof` must be a non-negative int.")
+    scaled = _Scaled(quantities)
+    count = 0
+    average = 0.0
+    squares = 0.0
+    for value in scaled:
+        count += 1
+        delta = value - average
+        average += delta / count
+        squares += delta * (value - average)
+    if count <= ddof:
+        raise ValueError(f"variance() needs at least {ddof + 1} quantities, got {count}.")
+    return scaled.result(squares / (count - ddof), scaled.unit**2, 2*scaled.exp10)
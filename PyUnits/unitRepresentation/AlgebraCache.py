@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class AlgebraCache:
+
+    # attributes:
+    # self._results: OrderedDict
+    # self._maxsize: int
+    # self._hits: int
+    # self._misses: int
+
+    def __init__(self, maxsize: int=1024):
+        if not isinstance(maxsize, int):
+            raise TypeError("Parameter `maxsize` must be an int, not an " + type(maxsize).__name__ + ".")
+        self._results: OrderedDict = OrderedDict()
+        self._maxsize: int = max(maxsize, 0)
+        self._hits: int = 0
+        self._misses: int = 0
+
+    def get(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        results = self._results
+        if key in results:
+            self._hits += 1
+            results.move_to_end(key)
+            return results[key]
+        self._misses += 1
+        result = compute()
+        if self._maxsize > 0:
+            results[key] = result
+            if len(results) > self._maxsize:
+                results.popitem(last=False)
+        return result
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._results))
+
+    def resize(self, maxsize: int):
+        if not isinstance(maxsize, int):
+            raise TypeError("Parameter `maxsize` must be an int, not an " + type(maxsize).__name__ + ".")
+        self._maxsize = max(maxsize, 0)
+        while len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+
+    def clear(self):
+        self._results.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# Results of unit * unit, unit / unit and unit ** exponent.
+# Keys use the type and string of each operand, so units that compare
+# equal but print differently (like m^2 and m^2.0) are kept apart.
+unitAlgebraCache = AlgebraCache()
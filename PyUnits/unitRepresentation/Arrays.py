@@ -0,0 +1,357 @@
+from __future__ import annotations
+
+import operator
+from numbers import Number, Real, Integral
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from .Units import RepresentableUnit, RepresentableValueUnit, ValueUnits
+
+
+class QuantityArray:
+    __slots__ = ("_values", "_unit", "_exp10", "_str")
+
+    # attributes:
+    # self._values: np.ndarray
+    # self._unit: RepresentableUnit
+    # self._exp10: int
+    # self._str: Optional[str]
+
+    # inmutable
+
+    __hash__ = None
+
+    def __new__(cls, values, unit: RepresentableUnit, exp10: int=0):
+        self = super(QuantityArray, cls).__new__(cls)
+
+        if not isinstance(exp10, int):
+            raise TypeError("Parameter `exp10` must be an int, not an " + type(exp10).__name__ + ".")
+
+        values = np.asarray(values)
+        if values.dtype.kind not in "biufc":
+            raise TypeError("Parameter `values` must hold numbers, not " + str(values.dtype) + ".")
+
+        if not isinstance(unit, RepresentableUnit):
+            if (isinstance(unit, Number) and unit == 1) or unit is None:
+                return values*SIPrefixes.pow10(exp10)
+            else:
+                raise TypeError("Parameter `unit` must be an unit type, not an " + type(unit).__name__ + ".")
+
+        values = values.view()
+        values.flags.writeable = False
+
+        self._values = values
+        self._unit = unit
+        self._exp10 = exp10
+        self._str = None
+
+        return self
+
+    def __init__(self, values, unit: RepresentableUnit, exp10: int=0):
+        self._values: np.ndarray = self.values
+        self._unit: RepresentableUnit = self.unit
+        self._exp10: int = self.exp10
+
+    @classmethod
+    def fromValueUnits(cls, quantities) -> QuantityArray:
+        quantities = list(quantities)
+        if len(quantities) == 0:
+            raise ValueError("Can't infer the unit of an empty sequence.")
+        first = quantities[0]
+        unit = first.unit
+        exp10 = min(quantity.exp10 for quantity in quantities)
+        values = list()
+        for quantity in quantities:
+            if not isinstance(quantity, RepresentableValueUnit):
+                raise TypeError("Expected a value with units, not an " + type(quantity).__name__ + ".")
+            if not first.hasSameUnit(quantity):
+                raise ValueError(f"Can't mix [{unit}] and [{quantity.unit}] in a QuantityArray.")
+            values.append(quantity.value*SIPrefixes.pow10(quantity.exp10 - exp10))
+        return cls(values, unit, exp10)
+
+    def __str__(self) -> str:
+        if self._str is None:
+            result = str(self.values)
+            if self.exp10 != 0:
+                result += "e"+str(self.exp10)
+            result += " ["+str(self.unit)+"]"
+            self._str = result
+        return self._str
+
+    def __repr__(self) -> str:
+        return self.__str__()
+
+    def __reduce__(self):
+        # numpy pickles the values out-of-band with protocol 5
+        return self.__class__, (self._values, self._unit, self._exp10)
+
+
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+    @property
+    def unit(self) -> RepresentableUnit:
+        return self._unit
+    @property
+    def exp10(self) -> int:
+        return self._exp10
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.values.shape
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    def hasSameUnit(self, other) -> bool:
+        if isinstance(other, (QuantityArray, RepresentableValueUnit)):
+            other = other.unit
+        return self.unit.hasSameUnit(other)
+
+    def toNumpy(self) -> np.ndarray:
+        return self.values*SIPrefixes.pow10(self.exp10)
+
+    def withExp10(self, exp10: int) -> QuantityArray:
+        if exp10 == self.exp10:
+            return self
+        return QuantityArray(self.values*SIPrefixes.pow10(self.exp10 - exp10), self.unit, exp10)
+
+
+    def __len__(self) -> int:
+        if self.values.ndim == 0:
+            raise TypeError("len() of a 0-d QuantityArray; index it with [()] to get the quantity.")
+        return len(self.values)
+
+    def __getitem__(self, index) -> Union[QuantityArray, ValueUnits]:
+        values = self.values[index]
+        if isinstance(values, np.ndarray):
+            return QuantityArray(values, self.unit, self.exp10)
+        return ValueUnits(values.item(), self.unit, self.exp10)
+
+    def __iter__(self):
+        if self.values.ndim == 0:
+            raise TypeError("Iteration over a 0-d QuantityArray; index it with [()] to get the quantity.")
+        unit = self.unit
+        exp10 = self.exp10
+        return (ValueUnits(value, unit, exp10) for value in self.values.tolist())
+
+
+    def __neg__(self) -> QuantityArray:
+        return QuantityArray(-self.values, self.unit, self.exp10)
+    def __pos__(self) -> QuantityArray:
+        return self
+    def __abs__(self) -> QuantityArray:
+        return QuantityArray(np.abs(self.values), self.unit, self.exp10)
+
+
+    def __eq__(self, other):
+        return _compare(np.equal, self, other, np.zeros)
+    def __ne__(self, other):
+        return _compare(np.not_equal, self, other, np.ones)
+    def __lt__(self, other):
+        return _compare(np.less, self, other)
+    def __le__(self, other):
+        return _compare(np.less_equal, self, other)
+    def __gt__(self, other):
+        return _compare(np.greater, self, other)
+    def __ge__(self, other):
+        return _compare(np.greater_equal, self, other)
+
+
+    def __add__(self, other):
+        return _add(np.add, self, other)
+    def __radd__(self, other):
+        return _add(np.add, other, self)
+
+    def __sub__(self, other):
+        return _add(np.subtract, self, other)
+    def __rsub__(self, other):
+        return _add(np.subtract, other, self)
+
+    def __mul__(self, other):
+        return _multiply(np.multiply, self, other)
+    def __rmul__(self, other):
+        return _multiply(np.multiply, other, self)
+
+    def __truediv__(self, other):
+        return _multiply(np.true_divide, self, other)
+    def __rtruediv__(self, other):
+        return _multiply(np.true_divide, other, self)
+
+    def __floordiv__(self, other):
+        return _multiply(np.floor_divide, self, other)
+    def __rfloordiv__(self, other):
+        return _multiply(np.floor_divide, other, self)
+
+    def __pow__(self, other: Number_t):
+        if isinstance(other, Number):
+            return _power(self, other)
+        return NotImplemented
+
+
+    def sum(self, axis=None, out=None, **kwargs) -> Union[QuantityArray, ValueUnits]:
+        return _reduce(np.sum, self, axis, out, kwargs)
+    def mean(self, axis=None, out=None, **kwargs) -> Union[QuantityArray, ValueUnits]:
+        return _reduce(np.mean, self, axis, out, kwargs)
+    def min(self, axis=None, out=None, **kwargs) -> Union[QuantityArray, ValueUnits]:
+        return _reduce(np.min, self, axis, out, kwargs)
+    def max(self, axis=None, out=None, **kwargs) -> Union[QuantityArray, ValueUnits]:
+        return _reduce(np.max, self, axis, out, kwargs)
+    def std(self, axis=None, out=None, **kwargs) -> Union[QuantityArray, ValueUnits]:
+        return _reduce(np.std, self, axis, out, kwargs)
+
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if "out" in kwargs:
+            return NotImplemented
+        if method == "__call__":
+            if ufunc in _binaryUfuncs and len(inputs) == 2:
+                return _binaryUfuncs[ufunc](ufunc, *inputs)
+            if ufunc in _unaryUfuncs and len(inputs) == 1:
+                return _unaryUfuncs[ufunc](inputs[0])
+            if ufunc is np.power and len(inputs) == 2 and isinstance(inputs[1], Number):
+                return _power(inputs[0], inputs[1])
+            if ufunc in _predicateUfuncs and len(inputs) == 1:
+                return ufunc(inputs[0].values, **kwargs)
+            return NotImplemented
+        if method == "reduce" and ufunc in _reduceUfuncs:
+            quantity = inputs[0]
+            return _wrap(ufunc.reduce(quantity.values, **kwargs), quantity.unit, quantity.exp10)
+        return NotImplemented
+
+
+def _parts(other) -> Optional[Tuple[object, Optional[RepresentableUnit], int]]:
+    if isinstance(other, QuantityArray):
+        return other.values, other.unit, other.exp10
+    if isinstance(other, RepresentableValueUnit):
+        return other.value, other.unit, other.exp10
+    if isinstance(other, RepresentableUnit):
+        return 1, other, 0
+    if isinstance(other, (Number, np.ndarray, np.generic)):
+        return other, None, 0
+    return None
+
+def _wrap(values, unit, exp10: int):
+    if not isinstance(unit, RepresentableUnit):
+        if unit is None:
+            unit = 1
+        return values*unit*SIPrefixes.pow10(exp10)
+    if isinstance(values, np.ndarray):
+        return QuantityArray(values, unit, exp10)
+    if isinstance(values, np.generic):
+        values = values.item()
+    return ValueUnits(values, unit, exp10)
+
+def _reduce(func, quantity: QuantityArray, axis, out, kwargs):
+    if out is not None:
+        raise TypeError("QuantityArray doesn't support the `out` parameter.")
+    return _wrap(func(quantity.values, axis=axis, **kwargs), quantity.unit, quantity.exp10)
+
+def _aligned(left, right):
+    leftParts = _parts(left)
+    rightParts = _parts(right)
+    if leftParts is None or rightParts is None:
+        return None
+    leftValues, leftUnit, leftExp = leftParts
+    rightValues, rightUnit, rightExp = rightParts
+    if leftUnit is None or rightUnit is None or not leftUnit.hasSameUnit(rightUnit):
+        return None
+    exp10 = min(leftExp, rightExp)
+    leftValues = leftValues*SIPrefixes.pow10(leftExp - exp10) if leftExp != exp10 else leftValues
+    rightValues = rightValues*SIPrefixes.pow10(rightExp - exp10) if rightExp != exp10 else rightValues
+    return leftValues, rightValues, leftUnit, exp10
+
+def _add(ufunc, left, right):
+    aligned = _aligned(left, right)
+    if aligned is None:
+        return NotImplemented
+    leftValues, rightValues, unit, exp10 = aligned
+    return _wrap(ufunc(leftValues, rightValues), unit, exp10)
+
+def _extreme(ufunc, left, right):
+    return _add(ufunc, left, right)
+
+def _compare(ufunc, left, right, mismatch=None):
+    aligned = _aligned(left, right)
+    if aligned is None:
+        if mismatch is not None and isinstance(left, QuantityArray):
+            return mismatch(left.shape, dtype=bool)
+        return NotImplemented
+    leftValues, rightValues, unit, exp10 = aligned
+    return ufunc(leftValues, rightValues)
+
+def _multiply(ufunc, left, right):
+    leftParts = _parts(left)
+    rightParts = _parts(right)
+    if leftParts is None or rightParts is None:
+        return NotImplemented
+    leftValues, leftUnit, leftExp = leftParts
+    rightValues, rightUnit, rightExp = rightParts
+    if ufunc is np.multiply:
+        unit = leftUnit * rightUnit if leftUnit is not None else rightUnit
+        exp10 = leftExp + rightExp
+    else:
+        if rightUnit is None:
+            unit = leftUnit
+        elif leftUnit is None:
+            unit = None / rightUnit
+        else:
+            unit = leftUnit / rightUnit
+        exp10 = leftExp - rightExp
+    return _wrap(ufunc(leftValues, rightValues), unit, exp10)
+
+def _power(quantity: QuantityArray, exponent: Number_t, func=None):
+    unit = quantity.unit ** exponent
+    exp10 = quantity.exp10 * exponent
+    if isinstance(exp10, Integral) or (isinstance(exp10, float) and exp10.is_integer()):
+        values = quantity.values
+        exp10 = int(exp10)
+    else:
+        values = quantity.toNumpy()
+        exp10 = 0
+    if func is not None:
+        values = func(values)
+    else:
+        if isinstance(exponent, Real) and exponent < 0 and values.dtype.kind in "biu":
+            values = values.astype(float)
+        values = values ** exponent
+    return _wrap(values, unit, exp10)
+
+
+_binaryUfuncs = {
+    np.add: _add,
+    np.subtract: _add,
+    np.multiply: _multiply,
+    np.true_divide: _multiply,
+    np.floor_divide: _multiply,
+    np.maximum: _extreme,
+    np.minimum: _extreme,
+    np.fmax: _extreme,
+    np.fmin: _extreme,
+    np.equal: _compare,
+    np.not_equal: _compare,
+    np.less: _compare,
+    np.less_equal: _compare,
+    np.greater: _compare,
+    np.greater_equal: _compare,
+}
+
+_unaryUfuncs = {
+    np.negative: operator.neg,
+    np.positive: operator.pos,
+    np.absolute: operator.abs,
+    np.sqrt: lambda quantity: _power(quantity, 0.5, np.sqrt),
+    np.cbrt: lambda quantity: _power(quantity, 1/3, np.cbrt),
+    np.square: lambda quantity: _power(quantity, 2, np.square),
+    np.reciprocal: lambda quantity: _power(quantity, -1, lambda values: 1/values),
+    np.rint: lambda quantity: QuantityArray(np.rint(quantity.values), quantity.unit, quantity.exp10),
+    np.floor: lambda quantity: QuantityArray(np.floor(quantity.values), quantity.unit, quantity.exp10),
+    np.ceil: lambda quantity: QuantityArray(np.ceil(quantity.values), quantity.unit, quantity.exp10),
+    np.trunc: lambda quantity: QuantityArray(np.trunc(quantity.values), quantity.unit, quantity.exp10),
+}
+
+_predicateUfuncs = {np.isnan, np.isfinite, np.isinf, np.sign, np.signbit}
+
+_reduceUfuncs = {np.add, np.maximum, np.minimum, np.fmax, np.fmin}
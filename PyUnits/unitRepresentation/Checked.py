@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import inspect
+from functools import wraps
+from numbers import Number
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from .AlgebraCache import AlgebraCache
+from .Units import RepresentableUnit, RepresentableValueUnit, ValueUnits
+from .Parser import parseUnit
+from .Dimensions import toDimension
+
+
+Unit_t = Union[RepresentableUnit, str]
+
+
+def _resolve(unit: Unit_t) -> RepresentableUnit:
+    if isinstance(unit, str):
+        unit = parseUnit(unit)
+    if not isinstance(unit, RepresentableUnit):
+        raise TypeError("Expected an unit type or an unit string, not an " + type(unit).__name__ + ".")
+    return unit
+
+def scaleBetween(fromUnit: RepresentableUnit, toUnit: RepresentableUnit) -> Optional[Number_t]:
+    # Factor that turns a value in `fromUnit` into `toUnit`, or None if the
+    # units have different dimensions.
+    if fromUnit is toUnit or fromUnit.hasSameUnit(toUnit):
+        return 1
+    fromDim = toDimension(fromUnit)
+    toDim = toDimension(toUnit)
+    if fromDim is None or toDim is None or fromDim.exponents != toDim.exponents:
+        return None
+    return SIPrefixes.pow10(fromDim.exp10 - toDim.exp10)
+
+
+def checkUnits(*argUnits: Unit_t, output: Union[Unit_t, Tuple[Unit_t, ...], None]=None, **kwargUnits: Unit_t):
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+        names = list(signature.parameters)
+        if len(argUnits) > len(names):
+            raise TypeError(f"{func.__name__}() takes {len(names)} parameters, but {len(argUnits)} units were declared.")
+        declared: Dict[str, RepresentableUnit] = dict()
+        for name, unit in zip(names, argUnits):
+            declared[name] = _resolve(unit)
+        for name, unit in kwargUnits.items():
+            if name not in names:
+                raise TypeError(f"{func.__name__}() has no parameter named {name!r}.")
+            declared[name] = _resolve(unit)
+        checked = [(name, declared[name]) for name in names if name in declared]
+        # Parameters left to a default that is None or a plain value are
+        # passed through unchecked; a quantity default is checked like an
+        # argument.
+        optional = {name for name, _ in checked
+                    if signature.parameters[name].default is not inspect.Parameter.empty
+                    and _unitOf(signature.parameters[name].default) is None}
+
+        if isinstance(output, tuple):
+            outputs = tuple(_resolve(unit) for unit in output)
+        elif output is not None:
+            outputs = _resolve(output)
+        else:
+            outputs = None
+
+        signatures = AlgebraCache(maxsize=128)
+
+        def factorsFor(key) -> List[Number_t]:
+            factors = list()
+            for (name, unit), argUnit in zip(checked, key):
+                if argUnit is _default:
+                    factors.append(None)
+                    continue
+                if argUnit is None:
+                    raise TypeError(f"{func.__name__}() expected a value in [{unit}] for {name!r}, got a plain number.")
+                factor = scaleBetween(argUnit, unit)
+                if factor is None:
+                    raise TypeError(f"{func.__name__}() expected a value in [{unit}] for {name!r}, got [{argUnit}].")
+                factors.append(factor)
+            return factors
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            passed = set(bound.arguments)
+            bound.apply_defaults()
+            arguments = bound.arguments
+            key = tuple(_default if name in optional and name not in passed else _unitOf(arguments[name])
+                        for name, _ in checked)
+            factors = signatures.get(key, lambda: factorsFor(key))
+            for (name, _), factor in zip(checked, factors):
+                if factor is not None:
+                    arguments[name] = _raw(arguments[name], factor)
+            return _attach(func(*bound.args, **bound.kwargs), outputs)
+
+        wrapper.cacheInfo = signatures.info
+        return wrapper
+    return decorator
+
+
+# key entry of a parameter left to its plain default
+_default = object()
+
+def _unitOf(value) -> Optional[RepresentableUnit]:
+    if isinstance(value, RepresentableValueUnit):
+        return value.unit
+    if hasattr(value, "unit") and hasattr(value, "exp10"):
+        return value.unit
+    return None
+
+def _raw(value, factor: Number_t):
+    if isinstance(value, RepresentableValueUnit):
+        return value.magnitude * factor
+    return value.values * (SIPrefixes.pow10(value.exp10) * factor)
+
+def _attach(result, outputs):
+    if outputs is None:
+        return result
+    if isinstance(outputs, tuple):
+        return tuple(_attach(value, unit) for value, unit in zip(result, outputs))
+    if isinstance(result, Number):
+        return ValueUnits(result, outputs)
+    from .Arrays import QuantityArray
+    return QuantityArray(result, outputs)
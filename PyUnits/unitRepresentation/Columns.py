@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import os
+import struct
+from numbers import Integral, Number
+from typing import Iterator, Optional, Union
+
+import numpy as np
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from .Units import RepresentableUnit, RepresentableValueUnit, ValueUnits
+from .Arrays import QuantityArray
+from .Serialization import encodeUnit, decodeUnit
+
+
+# File layout:
+#   fixed header: magic b"PYUC", u8 version (2: u16 unit strings), 3 pad bytes, u64 data offset,
+#                 u64 count, i64 exp10, 8-byte dtype string (e.g. "<f8"),
+#                 u32 size of the unit
+#   the unit, as written by Serialization.encodeUnit
+#   zero padding up to the data offset (a multiple of 64)
+#   count values of dtype, little-endian, back to back
+# Only the header is read when a column is opened; the values are mapped
+# and the unit is decoded the first time it is needed.
+
+_magic = b"PYUC"
+_version = 2
+_header = struct.Struct("<4sB3xQQq8sI")
+_countOffset = 16
+_alignment = 64
+
+
+def _columnDtype(dtype) -> np.dtype:
+    dtype = np.dtype(dtype)
+    if dtype.kind not in "biufc":
+        raise TypeError("A column must hold numbers, not " + str(dtype) + ".")
+    return dtype.newbyteorder("<")
+
+
+class ColumnWriter:
+
+    # attributes:
+    # self._file: BinaryIO
+    # self._unit: RepresentableUnit
+    # self._exp10: int
+    # self._dtype: np.dtype
+    # self._count: int
+
+    # with ColumnWriter(path, unit, exp10) as column:
+    #     column.append(chunk)
+    # The count in the header is written on close, so a column can be
+    # written in chunks that never fit in memory together.
+
+    def __init__(self, path: Union[str, os.PathLike], unit: RepresentableUnit, exp10: int=0, dtype="<f8"):
+        if not isinstance(unit, RepresentableUnit):
+            raise TypeError("Parameter `unit` must be an unit type, not an " + type(unit).__name__ + ".")
+        if not isinstance(exp10, int):
+            raise TypeError("Parameter `exp10` must be an int, not an " + type(exp10).__name__ + ".")
+        self._unit: RepresentableUnit = unit
+        self._exp10: int = exp10
+        self._dtype: np.dtype = _columnDtype(dtype)
+        self._count: int = 0
+
+        unitData = encodeUnit(unit)
+        offset = _header.size + len(unitData)
+        offset += -offset % _alignment
+        self._file = open(path, "wb")
+        self._file.write(_header.pack(_magic, _version, offset, 0, exp10, self._dtype.str.encode("ascii"), len(unitData)))
+        self._file.write(unitData)
+        self._file.write(b"\0" * (offset - _header.size - len(unitData)))
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def append(self, values):
+        if isinstance(values, (QuantityArray, RepresentableValueUnit)):
+            values = self._rescaled(values)
+        elif not isinstance(values, (np.ndarray, Number)):
+            values = list(values)
+            if len(values) > 0 and isinstance(values[0], RepresentableValueUnit):
+                values = self._rescaled(QuantityArray.fromValueUnits(values))
+        data = self._cast(values)
+        self._file.write(data.tobytes())
+        self._count += len(data)
+
+    def _rescaled(self, quantity) -> np.ndarray:
+        if not quantity.unit.hasSameUnit(self._unit):
+            raise ValueError(f"Can't write [{quantity.unit}] to a column of [{self._unit}].")
+        values = np.asarray(quantity.values if isinstance(quantity, QuantityArray) else quantity.value)
+        if quantity.exp10 != self._exp10:
+            values = values * SIPrefixes.pow10(quantity.exp10 - self._exp10)
+        return values
+
+    def _cast(self, values) -> np.ndarray:
+        # Rounding to a narrower float is fine; anything else that changes a
+        # value (15e-2 into an int column, overflow, imaginary parts) raises.
+        data = np.asarray(values).reshape(-1)
+        dtype = self._dtype
+        if np.can_cast(data.dtype, dtype, "safe"):
+            return data.astype(dtype, copy=False)
+        if data.dtype.kind == "c" and dtype.kind != "c":
+            if np.any(data.imag != 0):
+                raise ValueError(f"Can't write complex values to a column of {dtype}.")
+            data = data.real
+        with np.errstate(invalid="ignore", over="ignore"):
+            result = data.astype(dtype)
+        if dtype.kind in "biu":
+            lossy = not np.array_equal(result, data)
+        else:
+            lossy = bool(np.any(np.isinf(result) & np.isfinite(data)))
+        if lossy:
+            raise ValueError(f"Can't write {data.dtype} values to a column of {dtype} without losing data.")
+        return result
+
+    def close(self):
+        if self._file.closed:
+            return
+        self._file.seek(_countOffset)
+        self._file.write(struct.pack("<Q", self._count))
+        self._file.close()
+
+    def __enter__(self) -> ColumnWriter:
+        return self
+    def __exit__(self, *exc) -> bool:
+        self.close()
+        return False
+
+
+def writeColumn(path: Union[str, os.PathLike], values, unit: Optional[RepresentableUnit]=None, exp10: int=0, dtype="<f8"):
+    # Without `unit`, values must be a QuantityArray or quantities, and the
+    # column takes their unit and exp10.
+    if unit is None:
+        if not isinstance(values, QuantityArray):
+            values = QuantityArray.fromValueUnits(values)
+        unit, exp10 = values.unit, values.exp10
+    with ColumnWriter(path, unit, exp10, dtype) as column:
+        column.append(values)
+
+
+class QuantityColumn:
+
+    # attributes:
+    # self._path: str
+    # self._values: np.ndarray
+    # self._exp10: int
+    # self._unitData: bytes
+    # self._unit: Optional[RepresentableUnit]
+
+    # inmutable
+
+    def __init__(self, path: Union[str, os.PathLike]):
+        self._path = os.fspath(path)
+        with open(self._path, "rb") as file:
+            fixed = file.read(_header.size)
+            if len(fixed) != _header.size:
+                raise ValueError(f"{self._path}: not a quantity column.")
+            magic, version, offset, count, exp10, dtype, unitSize = _header.unpack(fixed)
+            if magic != _magic:
+                raise ValueError(f"{self._path}: not a quantity column.")
+            if version != _version:
+                raise ValueError(f"{self._path}: unsupported column version {version}.")
+            self._unitData: bytes = file.read(unitSize)
+
+        dtype = np.dtype(dtype.rstrip(b"\0").decode("ascii"))
+        if count == 0:
+            values = np.empty(0, dtype=dtype)
+        else:
+            values = np.memmap(self._path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+        self._values: np.ndarray = values
+        self._exp10: int = exp10
+        self._unit: Optional[RepresentableUnit] = None
+
+    @property
+    def path(self) -> str:
+        return self._path
+    @property
+    def values(self) -> np.ndarray:
+        return self._values
+    @property
+    def exp10(self) -> int:
+        return self._exp10
+    @property
+    def dtype(self) -> np.dtype:
+        return self._values.dtype
+    @property
+    def unit(self) -> RepresentableUnit:
+        if self._unit is None:
+            self._unit = decodeUnit(self._unitData)
+        return self._unit
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __str__(self) -> str:
+        return f"{len(self)} values e{self._exp10} [{self.unit}] in {self._path}"
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._path!r})"
+
+
+    def __getitem__(self, index) -> Union[QuantityArray, ValueUnits, Number_t]:
+        # slices stay views over the mapped file; only what is touched is read
+        values = self._values[index]
+        if isinstance(index, Integral):
+            return ValueUnits(values.item(), self.unit, self._exp10)
+        return QuantityArray(values, self.unit, self._exp10)
+
+    def __iter__(self) -> Iterator[Union[ValueUnits, Number_t]]:
+        unit = self.unit
+        for chunk in range(0, len(self._values), 65536):
+            for value in self._values[chunk:chunk+65536].tolist():
+                yield ValueUnits(value, unit, self._exp10)
+
+    def chunks(self, size: int=65536) -> Iterator[QuantityArray]:
+        if not isinstance(size, int) or size <= 0:
+            raise ValueError("Parameter `size` must be a positive int.")
+        for start in range(0, len(self._values), size):
+            yield self[start:start+size]
+
+    def toQuantityArray(self) -> QuantityArray:
+        return self[:]
+
+
+def openColumn(path: Union[str, os.PathLike]) -> QuantityColumn:
+    return QuantityColumn(path)
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+from numbers import Number
+from collections.abc import Iterable
+from typing import List, Tuple, Optional
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from ..quantities import BaseQuantities
+from .Units import Representable, RepresentableUnit, Unit, ValueUnits, fractionToString, fractionKey, unitKey
+
+
+# The seven SI base quantities, in the order used by the exponent vectors.
+baseUnitClasses = (
+    BaseQuantities.LengthUnit,
+    BaseQuantities.MassUnit,
+    BaseQuantities.TimeUnit,
+    BaseQuantities.ElectricCurrentUnit,
+    BaseQuantities.TemperatureUnit,
+    BaseQuantities.SubstanceUnit,
+    BaseQuantities.LuminousIntensityUnit,
+)
+baseUnits = tuple(cls() for cls in baseUnitClasses)
+dimensionsCount = len(baseUnits)
+
+# unit symbol -> (index in the exponent vector, default prefix)
+_baseIndex = {unit.unit: (i, unit.defaultPrefix) for i, unit in enumerate(baseUnits)}
+
+
+class Dimension(RepresentableUnit):
+    __slots__ = ("_exponents", "_exp10", "_numerator", "_denominator", "_str", "_key", "_hash")
+
+    # attributes:
+    # self._exponents: Tuple[Number_t, ...]
+    # self._exp10: int
+    # self._numerator: Optional[List[Unit]]
+    # self._denominator: Optional[List[Unit]]
+    # self._str: Optional[str]
+    # self._key: Optional[tuple]
+    # self._hash: Optional[int]
+
+    # inmutable
+
+    # A Dimension equals the unit lists of its base units only when it has
+    # no scale: 1e3*m is neither m nor km, in either operand order. Products
+    # and quotients with unit lists that can't be expressed in base
+    # quantities are refused when the Dimension has a scale.
+
+    _exponentAlgebra = True
+
+    def __new__(cls, exponents: Iterable, exp10: int=0):
+        self = super(Dimension, cls).__new__(cls)
+
+        if not isinstance(exponents, Iterable):
+            raise TypeError("Unexpected type: " + type(exponents).__name__)
+        if not isinstance(exp10, int):
+            raise TypeError("Parameter `exp10` must be an int, not an " + type(exp10).__name__ + ".")
+
+        exponents = tuple(exponents)
+        if len(exponents) != dimensionsCount:
+            raise ValueError(f"Expected {dimensionsCount} exponents, got {len(exponents)}.")
+        for exponent in exponents:
+            if not isinstance(exponent, Number):
+                raise TypeError(f"Expected a numeral type for exponent, not {type(exponent).__name__}.")
+
+        if not any(exponents):
+            return SIPrefixes.pow10(exp10)
+
+        self._exponents = exponents
+        self._exp10 = exp10
+        self._numerator = None
+        self._denominator = None
+        self._str = None
+        self._key = None
+        self._hash = None
+
+        return self
+
+    def __init__(self, exponents: Iterable, exp10: int=0):
+        self._exponents: Tuple[Number_t, ...] = self.exponents
+        self._exp10: int = self.exp10
+
+    @classmethod
+    def fromUnit(cls, unit: RepresentableUnit) -> Dimension:
+        dim = toDimension(unit)
+        if dim is None:
+            raise ValueError(f"{unit} can't be expressed in SI base quantities.")
+        return dim
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self.canonicalKey)
+        return self._hash
+
+    def __str__(self) -> str:
+        if self._str is None:
+            aux = fractionToString(self.numeratorUnits, self.denominatorUnits)
+            if self.exp10 != 0:
+                aux = f"1e{self.exp10}*" + aux
+            self._str = aux
+        return self._str
+
+    def __reduce__(self):
+        return self.__class__, (self._exponents, self._exp10)
+
+
+    @property
+    def canonicalKey(self) -> tuple:
+        if self._key is None:
+            key = fractionKey(self.numeratorUnits, self.denominatorUnits)
+            if self.exp10 != 0:
+                key += (self.exp10,)
+            self._key = key
+        return self._key
+    @property
+    def exponents(self) -> Tuple[Number_t, ...]:
+        return self._exponents
+    @property
+    def exp10(self) -> int:
+        return self._exp10
+
+    @property
+    def numeratorUnits(self) -> List[Unit]:
+        if self._numerator is None:
+            self._buildView()
+        return list(self._numerator)
+    @property
+    def denominatorUnits(self) -> List[Unit]:
+        if self._denominator is None:
+            self._buildView()
+        return list(self._denominator)
+
+    def _buildView(self):
+        numerator = list()
+        denominator = list()
+        for cls, exponent in zip(baseUnitClasses, self.exponents):
+            if exponent == 0:
+                continue
+            if exponent.real > 0:
+                numerator.append(cls(power=exponent))
+            else:
+                denominator.append(cls(power=-exponent))
+        self._numerator = numerator
+        self._denominator = denominator
+
+
+    def hasSameUnit(self, other: Representable) -> bool:
+        if other is self:
+            return True
+        if isinstance(other, ValueUnits):
+            other = other.unit
+        if not isinstance(other, RepresentableUnit):
+            return super().hasSameUnit(other)
+        if isinstance(other, Dimension):
+            return self.exponents == other.exponents and self.exp10 == other.exp10
+        return self.canonicalKey == unitKey(other)
+
+
+    def __eq__(self, other) -> bool:
+        if other is self:
+            return True
+        if isinstance(other, Dimension):
+            return self.exponents == other.exponents and self.exp10 == other.exp10
+        if not isinstance(other, RepresentableUnit):
+            return super().__eq__(other)
+        return self.canonicalKey == other.canonicalKey
+
+
+    def __mul__(self, other):
+        if isinstance(other, RepresentableUnit):
+            dim = toDimension(other)
+            if dim is not None:
+                return Dimension(map(_add, self.exponents, dim.exponents), self.exp10 + dim.exp10)
+            if self.exp10 != 0:
+                return NotImplemented
+        return super().__mul__(other)
+
+    def __rmul__(self, other):
+        if isinstance(other, RepresentableUnit):
+            dim = toDimension(other)
+            if dim is not None:
+                return Dimension(map(_add, dim.exponents, self.exponents), dim.exp10 + self.exp10)
+            if self.exp10 != 0:
+                return NotImplemented
+        return super().__rmul__(other)
+
+
+    def __truediv__(self, other):
+        if isinstance(other, RepresentableUnit):
+            dim = toDimension(other)
+            if dim is not None:
+                return Dimension(map(_sub, self.exponents, dim.exponents), self.exp10 - dim.exp10)
+            if self.exp10 != 0:
+                return NotImplemented
+        return super().__truediv__(other)
+
+    def __rtruediv__(self, other):
+        if isinstance(other, RepresentableUnit):
+            dim = toDimension(other)
+            if dim is not None:
+                return Dimension(map(_sub, dim.exponents, self.exponents), dim.exp10 - self.exp10)
+            if self.exp10 != 0:
+                return NotImplemented
+        if other is None:
+            return Dimension(map(_neg, self.exponents), -self.exp10)
+        return super().__rtruediv__(other)
+
+
+    def __pow__(self, other: Number_t) -> RepresentableUnit:
+        if isinstance(other, Number):
+            if other == 1:
+                return self
+            exp10 = self.exp10 * other
+            if exp10 != int(exp10.real):
+                raise ValueError(f"Can't raise a scale of 1e{self.exp10} to the power of {other}.")
+            return Dimension((exponent*other for exponent in self.exponents), int(exp10.real))
+        return super().__pow__(other)
+
+
+def _add(a: Number_t, b: Number_t) -> Number_t:
+    return a + b
+
+def _sub(a: Number_t, b: Number_t) -> Number_t:
+    return a - b
+
+def _neg(a: Number_t) -> Number_t:
+    return -a
+
+
+def toDimension(unit: RepresentableUnit) -> Optional[Dimension]:
+    if isinstance(unit, Dimension):
+        return unit
+    exponents = [0] * dimensionsCount
+    exp10 = 0
+    for units, sign in ((unit.numeratorUnits, 1), (unit.denominatorUnits, -1)):
+        for u in units:
+            base = _baseIndex.get(u.unit)
+            if base is None:
+                return None
+            index, defaultPrefix = base
+            exponents[index] += sign * u.power
+            exp10 += sign * SIPrefixes.magnitudeFactor(u.defaultPrefix, defaultPrefix) * u.power
+    if exp10 != int(exp10.real):
+        return None
+    if not any(exponents):
+        return None
+    return Dimension(exponents, int(exp10.real))
+
+
+def dimensionalize(quantity: ValueUnits) -> ValueUnits:
+    dim = Dimension.fromUnit(quantity.unit)
+    return ValueUnits(quantity.value, Dimension(dim.exponents), quantity.exp10 + dim.exp10, numeric=quantity.numeric)
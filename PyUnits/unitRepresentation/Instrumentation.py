@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter_ns
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .AlgebraCache import unitAlgebraCache
+from .Units import Unit, UnitsFraction, ValueUnits
+
+
+# Nothing here is installed until `instrument()` is entered: the traced
+# methods are swapped in on the classes while at least one session is
+# open and the originals are put back afterwards, so the disabled cost is
+# zero rather than a flag check on every call.
+
+# (class, attribute, metric name)
+_targets: List[Tuple[type, str, str]] = [
+    (UnitsFraction, "__new__", "UnitsFraction.new"),
+    (UnitsFraction, "unitInNumerator", "UnitsFraction.unitInNumerator"),
+    (UnitsFraction, "unitInDenominator", "UnitsFraction.unitInDenominator"),
+    (UnitsFraction, "__hash__", "UnitsFraction.hash"),
+    (UnitsFraction, "__str__", "UnitsFraction.str"),
+    (Unit, "__hash__", "Unit.hash"),
+    (Unit, "__str__", "Unit.str"),
+    (ValueUnits, "__new__", "ValueUnits.new"),
+    (ValueUnits, "__hash__", "ValueUnits.hash"),
+    (ValueUnits, "__str__", "ValueUnits.str"),
+]
+
+def _lazyPlans():
+    from .Lazy import _plans
+    return _plans.info()
+
+def _parserCache():
+    from .Parser import parseUnit
+    return parseUnit.cache_info()
+
+# name -> callable returning an object with `hits` and `misses`
+cacheSources: Dict[str, Callable] = {
+    "algebra": unitAlgebraCache.info,
+    "parser": _parserCache,
+    "lazyPlans": _lazyPlans,
+}
+
+
+_counts: Dict[str, int] = defaultdict(int)
+_times: Dict[str, int] = defaultdict(int)
+_originals: Dict[Tuple[type, str], object] = dict()
+_sessions: int = 0
+_lock = threading.Lock()
+
+
+def _traced(name: str, func: Callable) -> Callable:
+    counts = _counts
+    times = _times
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            times[name] += perf_counter_ns() - start
+            counts[name] += 1
+    return wrapper
+
+def _install():
+    for cls, attr, name in _targets:
+        original = cls.__dict__[attr]
+        _originals[(cls, attr)] = original
+        if isinstance(original, staticmethod):
+            setattr(cls, attr, staticmethod(_traced(name, original.__func__)))
+        else:
+            setattr(cls, attr, _traced(name, original))
+
+def _uninstall():
+    for (cls, attr), original in _originals.items():
+        setattr(cls, attr, original)
+    _originals.clear()
+
+def isEnabled() -> bool:
+    return _sessions > 0
+
+
+def _cacheStats() -> Dict[str, Tuple[int, int]]:
+    stats = dict()
+    for name, info in cacheSources.items():
+        result = info()
+        stats[name] = (result.hits, result.misses)
+    return stats
+
+
+class Report:
+
+    # attributes:
+    # self._counts: Dict[str, int]
+    # self._times: Dict[str, int]
+    # self._caches: Dict[str, Tuple[int, int]]
+    # self._elapsed: int
+
+    # Times are inclusive nanoseconds: a UnitsFraction construction also
+    # contains the unitInNumerator/unitInDenominator calls it makes.
+
+    def __init__(self, counts: Dict[str, int], times: Dict[str, int], caches: Dict[str, Tuple[int, int]], elapsed: int):
+        self._counts: Dict[str, int] = counts
+        self._times: Dict[str, int] = times
+        self._caches: Dict[str, Tuple[int, int]] = caches
+        self._elapsed: int = elapsed
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        return dict(self._counts)
+    @property
+    def times(self) -> Dict[str, int]:
+        return dict(self._times)
+    @property
+    def caches(self) -> Dict[str, Tuple[int, int]]:
+        return dict(self._caches)
+    @property
+    def elapsed(self) -> int:
+        return self._elapsed
+
+    def metrics(self) -> Iterator[Tuple[str, int]]:
+        yield "elapsed_ns", self._elapsed
+        for name in sorted(self._counts):
+            yield name + ".count", self._counts[name]
+            yield name + ".ns", self._times[name]
+        for name in sorted(self._caches):
+            hits, misses = self._caches[name]
+            yield "cache." + name + ".hits", hits
+            yield "cache." + name + ".misses", misses
+
+    def export(self, callback: Callable[[str, int], object]):
+        for name, value in self.metrics():
+            callback(name, value)
+
+    def __str__(self) -> str:
+        lines = [f"{'operation':<32} {'calls':>10} {'total ms':>10} {'ns/call':>9}"]
+        for name in sorted(self._counts, key=lambda name: -self._times[name]):
+            count = self._counts[name]
+            total = self._times[name]
+            lines.append(f"{name:<32} {count:>10} {total/1e6:>10.3f} {total/max(count, 1):>9.0f}")
+        for name in sorted(self._caches):
+            hits, misses = self._caches[name]
+            lines.append(f"cache {name:<26} {hits:>10} hits {misses:>6} misses")
+        lines.append(f"elapsed: {self._elapsed/1e6:.3f} ms")
+        return "\n".join(lines)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(calls={sum(self._counts.values())}, elapsed={self._elapsed})"
+
+
+class instrument:
+
+    # attributes:
+    # self._callback: Optional[Callable[[str, int], object]]
+    # self._counts: Dict[str, int]
+    # self._times: Dict[str, int]
+    # self._caches: Dict[str, Tuple[int, int]]
+    # self._start: int
+    # self.report: Optional[Report]
+
+    # with instrument() as session: ...
+    # session.report is filled when the block exits, and `callback` receives
+    # every metric of it as (name, value).
+
+    def __init__(self, callback: Optional[Callable[[str, int], object]]=None):
+        self._callback = callback
+        self.report: Optional[Report] = None
+
+    def __enter__(self) -> instrument:
+        global _sessions
+        with _lock:
+            if _sessions == 0:
+                _install()
+            _sessions += 1
+            self._counts = dict(_counts)
+            self._times = dict(_times)
+        self._caches = _cacheStats()
+        self._start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        global _sessions
+        elapsed = perf_counter_ns() - self._start
+        caches = _cacheStats()
+        with _lock:
+            counts = {name: count - self._counts.get(name, 0) for name, count in _counts.items()}
+            times = {name: total - self._times.get(name, 0) for name, total in _times.items()}
+            _sessions -= 1
+            if _sessions == 0:
+                _uninstall()
+        counts = {name: count for name, count in counts.items() if count}
+        times = {name: times[name] for name in counts}
+        caches = {name: (hits - self._caches[name][0], misses - self._caches[name][1]) for name, (hits, misses) in caches.items()}
+        self.report = Report(counts, times, caches, elapsed)
+        if self._callback is not None:
+            self.report.export(self._callback)
+        return False
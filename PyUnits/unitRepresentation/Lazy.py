@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import operator
+from numbers import Number, Integral
+from typing import Dict, List, Optional, Tuple
+from weakref import WeakValueDictionary
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from .AlgebraCache import AlgebraCache
+from .Units import RepresentableUnit, RepresentableValueUnit, ValueUnits
+
+
+class LazyQuantity:
+    __slots__ = ("_op", "_operands", "_variables", "__weakref__")
+
+    # attributes:
+    # self._op: str
+    # self._operands: tuple
+    # self._variables: frozenset
+
+    # inmutable
+
+    # Nodes are hash-consed: building the same operation on the same
+    # operands twice returns the same node, so common subexpressions are
+    # shared and evaluated once.
+    _interned: WeakValueDictionary = WeakValueDictionary()
+
+    def __new__(cls, op: str, *operands):
+        key = (op,) + tuple(_operandKey(operand) for operand in operands)
+        self = LazyQuantity._interned.get(key)
+        if self is not None:
+            return self
+
+        self = super(LazyQuantity, cls).__new__(cls)
+        self._op = op
+        self._operands = operands
+        if op == "var":
+            self._variables = frozenset(operands)
+        else:
+            variables = frozenset()
+            for operand in operands:
+                if isinstance(operand, LazyQuantity):
+                    variables |= operand._variables
+            self._variables = variables
+
+        LazyQuantity._interned[key] = self
+        return self
+
+    @property
+    def variables(self) -> frozenset:
+        return self._variables
+
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({_describe(self)})"
+
+    def __str__(self) -> str:
+        return str(self.evaluate())
+
+    def __float__(self) -> float:
+        return float(self.evaluate())
+    def __int__(self) -> int:
+        return int(self.evaluate())
+    def __complex__(self) -> complex:
+        return complex(self.evaluate())
+
+
+    def __neg__(self) -> LazyQuantity:
+        if self._op == "neg":
+            return self._operands[0]
+        return LazyQuantity("neg", self)
+    def __pos__(self) -> LazyQuantity:
+        return self
+
+    def __add__(self, other):
+        return _binary("+", self, other)
+    def __radd__(self, other):
+        return _binary("+", other, self)
+    def __sub__(self, other):
+        return _binary("-", self, other)
+    def __rsub__(self, other):
+        return _binary("-", other, self)
+
+    def __mul__(self, other):
+        return _multiply(self, other, 1)
+    def __rmul__(self, other):
+        return _multiply(other, self, 1)
+    def __truediv__(self, other):
+        return _multiply(self, other, -1)
+    def __rtruediv__(self, other):
+        return _multiply(other, self, -1)
+    def __floordiv__(self, other):
+        return _binary("//", self, other)
+    def __rfloordiv__(self, other):
+        return _binary("//", other, self)
+
+    def __pow__(self, other: Number_t):
+        if not isinstance(other, Number):
+            return NotImplemented
+        return _power(self, other)
+
+
+    def evaluate(self, **bindings):
+        missing = self._variables.difference(bindings)
+        if missing:
+            raise TypeError("Missing values for: " + ", ".join(sorted(missing)) + ".")
+
+        batch = None
+        for name in self._variables:
+            value = bindings[name]
+            if isinstance(value, (RepresentableValueUnit, Number)):
+                continue
+            if hasattr(value, "exp10") and hasattr(value, "values"):
+                continue
+            if batch is not None and len(batch) != len(value):
+                raise ValueError("All batches bound to a graph must have the same length.")
+            batch = value
+
+        if batch is None:
+            return self._evaluateOne(bindings)
+
+        results = list()
+        for i in range(len(batch)):
+            row = dict()
+            for name in self._variables:
+                value = bindings[name]
+                if isinstance(value, (RepresentableValueUnit, Number)) or hasattr(value, "exp10"):
+                    row[name] = value
+                else:
+                    row[name] = value[i]
+            results.append(self._evaluateOne(row))
+        return results
+
+    def _evaluateOne(self, bindings: Dict[str, object]):
+        signature = tuple(sorted((name, _signature(bindings[name])) for name in self._variables))
+        plan = _plans.get((self, signature), lambda: _Plan(self, bindings))
+        return plan.run(bindings)
+
+
+def lazy(quantity) -> LazyQuantity:
+    if isinstance(quantity, LazyQuantity):
+        return quantity
+    if not isinstance(quantity, (RepresentableValueUnit, Number)):
+        raise TypeError("Expected a quantity or a number, not an " + type(quantity).__name__ + ".")
+    return LazyQuantity("const", quantity)
+
+def variable(name: str) -> LazyQuantity:
+    if not isinstance(name, str):
+        raise TypeError(f"Expected type str for 'name', not {type(name).__name__}.")
+    return LazyQuantity("var", name)
+
+
+def _operandKey(operand):
+    if isinstance(operand, LazyQuantity):
+        return id(operand)
+    if isinstance(operand, str):
+        return operand
+    # constants: numbers compare by value, quantities by identity
+    if isinstance(operand, Number):
+        return (type(operand), operand)
+    return ("id", id(operand))
+
+def _wrap(operand) -> Optional[LazyQuantity]:
+    if isinstance(operand, LazyQuantity):
+        return operand
+    if isinstance(operand, (RepresentableValueUnit, Number)):
+        return lazy(operand)
+    return None
+
+def _binary(op: str, left, right):
+    left = _wrap(left)
+    right = _wrap(right)
+    if left is None or right is None:
+        return NotImplemented
+    return LazyQuantity(op, left, right)
+
+def _asPower(node: LazyQuantity) -> Tuple[LazyQuantity, Number_t]:
+    if node._op == "**":
+        return node._operands[0], node._operands[1]
+    return node, 1
+
+def _power(node: LazyQuantity, exponent: Number_t) -> LazyQuantity:
+    # (x**a)**b is x**(a*b) only for integer exponents, and not when both
+    # are negative: (x**-1)**-1 must still fail for x = 0. (x**2)**0.5 is
+    # abs(x), not x.
+    base, current = _asPower(node)
+    if isinstance(current, Integral) and isinstance(exponent, Integral) and not (current < 0 and exponent < 0):
+        exponent = current * exponent
+        node = base
+    if exponent == 1:
+        return node
+    return LazyQuantity("**", node, exponent)
+
+def _multiply(left, right, sign: int):
+    left = _wrap(left)
+    right = _wrap(right)
+    if left is None or right is None:
+        return NotImplemented
+    if sign > 0:
+        # x**a * x**b folds into x**(a+b) for non-negative integer
+        # exponents only; divisions are kept, so x/x still fails for 0 and
+        # gives nan for nan
+        leftBase, leftExp = _asPower(left)
+        rightBase, rightExp = _asPower(right)
+        if leftBase is rightBase and all(isinstance(exp, Integral) and exp >= 0 for exp in (leftExp, rightExp)):
+            return _power(leftBase, leftExp + rightExp)
+    return LazyQuantity("*" if sign > 0 else "/", left, right)
+
+
+def _describe(node: LazyQuantity) -> str:
+    if node._op == "var":
+        return node._operands[0]
+    if node._op == "const":
+        return repr(node._operands[0])
+    if node._op == "neg":
+        return "-" + _describe(node._operands[0])
+    if node._op == "**":
+        return f"({_describe(node._operands[0])})**{node._operands[1]}"
+    left, right = node._operands
+    return f"({_describe(left)} {node._op} {_describe(right)})"
+
+
+def _signature(value) -> Tuple[type, Optional[str], int]:
+    if isinstance(value, Number):
+        return type(value), None, 0
+    return type(value), str(value.unit), value.exp10
+
+def _split(value) -> Tuple[object, Optional[RepresentableUnit], int]:
+    if isinstance(value, Number):
+        return value, None, 0
+    if isinstance(value, RepresentableValueUnit):
+        return value.value, value.unit, value.exp10
+    return value.values, value.unit, value.exp10
+
+def _combine(op, left: Optional[RepresentableUnit], right: Optional[RepresentableUnit]):
+    if op is operator.mul:
+        if left is None:
+            return right
+        if right is None:
+            return left
+        return left * right
+    if right is None:
+        return left
+    if left is None:
+        return None / right
+    return left / right
+
+def _asUnit(unit) -> Tuple[Optional[RepresentableUnit], Number_t]:
+    # Unit algebra collapses dimensionless results into plain numbers.
+    if unit is None or isinstance(unit, RepresentableUnit):
+        return unit, 1
+    return None, unit
+
+
+class _Plan:
+
+    # attributes:
+    # self._slots: List[object]
+    # self._steps: List[tuple]
+    # self._inputs: List[Tuple[str, int]]
+    # self._output: int
+    # self._unit: Optional[RepresentableUnit]
+    # self._exp10: int
+    # self._batchType: Optional[type]
+
+    # A plan resolves every unit and exp10 of the graph for one signature of
+    # input units, and keeps only the raw-number operations for `run`.
+
+    def __init__(self, root: LazyQuantity, bindings: Dict[str, object]):
+        self._slots: List[object] = list()
+        self._steps: List[tuple] = list()
+        self._inputs: List[Tuple[str, int]] = list()
+        self._batchType: Optional[type] = None
+        memo = dict()
+        self._output, self._unit, self._exp10, _ = self._visit(root, bindings, memo)
+
+    def _newSlot(self, value=None) -> int:
+        self._slots.append(value)
+        return len(self._slots) - 1
+
+    def _visit(self, node: LazyQuantity, bindings, memo):
+        found = memo.get(id(node))
+        if found is not None:
+            return found
+        result = self._build(node, bindings, memo)
+        memo[id(node)] = result
+        return result
+
+    def _build(self, node: LazyQuantity, bindings, memo):
+        op = node._op
+        if op == "var":
+            name = node._operands[0]
+            value = bindings[name]
+            _, unit, exp10 = _split(value)
+            if not isinstance(value, (Number, RepresentableValueUnit)):
+                self._batchType = type(value)
+            slot = self._newSlot()
+            self._inputs.append((name, slot))
+            return slot, unit, exp10, False
+        if op == "const":
+            value, unit, exp10 = _split(node._operands[0])
+            return self._newSlot(value), unit, exp10, True
+
+        if op == "neg":
+            slot, unit, exp10, constant = self._visit(node._operands[0], bindings, memo)
+            return self._emit(operator.neg, (slot,), constant), unit, exp10, constant
+
+        if op == "**":
+            slot, unit, exp10, constant = self._visit(node._operands[0], bindings, memo)
+            exponent = node._operands[1]
+            unit, factor = _asUnit(unit ** exponent if unit is not None else None)
+            if isinstance(exponent, Integral):
+                out = self._emit(lambda value: value ** exponent, (slot,), constant)
+                exp10 = exp10 * exponent
+            else:
+                scale = SIPrefixes.pow10(exp10)
+                out = self._emit(lambda value: (value*scale) ** exponent, (slot,), constant)
+                exp10 = 0
+            return self._scaled(out, factor, constant), unit, exp10, constant
+
+        left, leftUnit, leftExp, leftConst = self._visit(node._operands[0], bindings, memo)
+        right, rightUnit, rightExp, rightConst = self._visit(node._operands[1], bindings, memo)
+        constant = leftConst and rightConst
+
+        if op in ("+", "-"):
+            if (leftUnit is None) != (rightUnit is None) or (leftUnit is not None and not leftUnit.hasSameUnit(rightUnit)):
+                raise TypeError(f"unsupported operand units for {op}: [{leftUnit}] and [{rightUnit}]")
+            func = operator.add if op == "+" else operator.sub
+            if leftExp != rightExp:
+                scale = SIPrefixes.pow10(rightExp - leftExp)
+                out = self._emit(lambda a, b: func(a, b*scale), (left, right), constant)
+            else:
+                out = self._emit(func, (left, right), constant)
+            return out, leftUnit, leftExp, constant
+
+        if op == "*":
+            unit, factor = _asUnit(_combine(operator.mul, leftUnit, rightUnit))
+            out = self._emit(operator.mul, (left, right), constant)
+            return self._scaled(out, factor, constant), unit, leftExp + rightExp, constant
+
+        func = operator.truediv if op == "/" else operator.floordiv
+        unit, factor = _asUnit(_combine(operator.truediv, leftUnit, rightUnit))
+        out = self._emit(func, (left, right), constant)
+        return self._scaled(out, factor, constant), unit, leftExp - rightExp, constant
+
+    def _emit(self, func, args: Tuple[int, ...], constant: bool) -> int:
+        if constant:
+            # folded now, once per plan
+            return self._newSlot(func(*(self._slots[arg] for arg in args)))
+        slot = self._newSlot()
+        self._steps.append((func, args, slot))
+        return slot
+
+    def _scaled(self, slot: int, factor: Number_t, constant: bool) -> int:
+        if factor == 1:
+            return slot
+        return self._emit(lambda value: value*factor, (slot,), constant)
+
+    def run(self, bindings: Dict[str, object]):
+        slots = list(self._slots)
+        for name, slot in self._inputs:
+            slots[slot] = _split(bindings[name])[0]
+        for func, args, out in self._steps:
+            if len(args) == 1:
+                slots[out] = func(slots[args[0]])
+            else:
+                slots[out] = func(slots[args[0]], slots[args[1]])
+        value = slots[self._output]
+        unit = self._unit if self._unit is not None else 1
+        if self._batchType is not None:
+            return self._batchType(value, unit, self._exp10)
+        return ValueUnits(value, unit, self._exp10)
+
+
+# Compiled plans, keyed by (graph root, signature of the bound units).
+_plans = AlgebraCache(maxsize=256)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from .Serialization import PackedQuantities, UnitTable
+
+
+# Inputs are packed with one UnitTable shared by every chunk. The table is
+# sent to each worker once, by the pool initializer; a task then carries
+# only the run headers and the packed values of its chunk.
+
+_workerUnits: tuple = ()
+
+def _initWorker(table: bytes):
+    global _workerUnits
+    _workerUnits = UnitTable.frombytes(table).units
+
+def _runChunk(func: Callable, runs: tuple, payload: bytes, perElement: bool, units: Optional[tuple]=None):
+    quantities = PackedQuantities(units if units is not None else _workerUnits, runs, payload).unpack()
+    if perElement:
+        results = [func(quantity) for quantity in quantities]
+    else:
+        results = list(func(quantities))
+    try:
+        # results go back packed too, with a table of their own
+        return PackedQuantities.pack(results)
+    except TypeError:
+        return results
+
+
+def _chunked(inputs: Iterable, size: int) -> Iterable[list]:
+    iterator = iter(inputs)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def _pack(inputs, chunkSize: int) -> Tuple[UnitTable, List[PackedQuantities]]:
+    table = UnitTable()
+    return table, [PackedQuantities.pack(chunk, table) for chunk in _chunked(inputs, chunkSize)]
+
+def _unpack(result) -> list:
+    if isinstance(result, PackedQuantities):
+        return result.unpack()
+    return result
+
+
+def _parallel(func: Callable, inputs, workers: Optional[int], chunkSize: Optional[int], perElement: bool) -> list:
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if not isinstance(workers, int) or workers <= 0:
+        raise ValueError("Parameter `workers` must be a positive int.")
+    inputs = list(inputs)
+    if chunkSize is None:
+        # a few chunks per worker, so uneven chunks still balance
+        chunkSize = max(1, -(-len(inputs) // (workers*4)))
+    if not isinstance(chunkSize, int) or chunkSize <= 0:
+        raise ValueError("Parameter `chunkSize` must be a positive int.")
+
+    table, chunks = _pack(inputs, chunkSize)
+    if workers == 1 or len(chunks) <= 1:
+        units = table.units
+        tasks = (_runChunk(func, chunk.runs, chunk.payload, perElement, units) for chunk in chunks)
+        return [result for task in tasks for result in _unpack(task)]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker, initargs=(table.tobytes(),)) as pool:
+        futures = [pool.submit(_runChunk, func, chunk.runs, bytes(chunk.payload), perElement) for chunk in chunks]
+        results = list()
+        for future in futures:
+            results.extend(_unpack(future.result()))
+        return results
+
+
+def parallelMap(func: Callable, inputs: Iterable, *, workers: Optional[int]=None, chunkSize: Optional[int]=None) -> list:
+    # func(quantity) for every input, in order. func must be picklable,
+    # i.e. defined at module level.
+    return _parallel(func, inputs, workers, chunkSize, True)
+
+def parallelApply(func: Callable, inputs: Iterable, *, workers: Optional[int]=None, chunkSize: Optional[int]=None) -> list:
+    # func(chunk) for lists of consecutive inputs; func returns one result
+    # per input and the results are concatenated in order.
+    return _parallel(func, inputs, workers, chunkSize, False)
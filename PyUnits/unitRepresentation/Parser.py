@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import List, Tuple, Union
+
+from ..TypesHelper import Number_t
+from ..prefixes import SIPrefixes
+from ..quantities import BaseQuantities
+from .Units import RepresentableUnit, Unit, ValueUnits
+
+
+# (unit, defaultPrefix) -> class used by the SIUnits factories
+_baseClasses = {
+    (cls().unit, cls().defaultPrefix): cls for cls in (
+        BaseQuantities.DimensionLessUnit,
+        BaseQuantities.LengthUnit,
+        BaseQuantities.MassUnit,
+        BaseQuantities.TimeUnit,
+        BaseQuantities.ElectricCurrentUnit,
+        BaseQuantities.TemperatureUnit,
+        BaseQuantities.SubstanceUnit,
+        BaseQuantities.LuminousIntensityUnit,
+    )
+}
+knownSymbols = {unit for unit, _ in _baseClasses}
+
+# Longest prefixes first, so "da" is tried before "d".
+_prefixes = sorted(SIPrefixes.si_prefixes, key=len, reverse=True)
+
+_tokenRegex = re.compile(r"\s*(?:(?P<number>[-+]?\d+(?:\.\d*)?(?:[eE][-+]?\d+)?)|(?P<symbol>[^\s()*/^\d][^\s()*/^]*)|(?P<op>[()*/^]))")
+
+
+def splitPrefix(atom: str) -> Tuple[str, str]:
+    if atom in knownSymbols:
+        return "", atom
+    for prefix in _prefixes:
+        if atom.startswith(prefix) and atom[len(prefix):] in knownSymbols:
+            return prefix, atom[len(prefix):]
+    return "", atom
+
+def baseUnit(symbol: str, prefix: str="", power: Number_t=1) -> RepresentableUnit:
+    cls = _baseClasses.get((symbol, prefix))
+    if cls is not None:
+        return cls(power=power)
+    return Unit(symbol, prefix, power=power)
+
+def makeUnit(atom: str, power: Number_t=1) -> RepresentableUnit:
+    prefix, symbol = splitPrefix(atom)
+    return baseUnit(symbol, prefix, power)
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = list()
+    pos = 0
+    text = text.rstrip()
+    while pos < len(text):
+        match = _tokenRegex.match(text, pos)
+        if match is None or match.end() == pos:
+            raise ValueError(f"Invalid unit expression: {text!r}.")
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+        pos = match.end()
+    return tokens
+
+def _parseNumber(value: str) -> Number_t:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+class _Parser:
+
+    # attributes:
+    # self._text: str
+    # self._tokens: List[Tuple[str, str]]
+    # self._pos: int
+
+    def __init__(self, text: str):
+        self._text: str = text
+        self._tokens: List[Tuple[str, str]] = _tokenize(text)
+        self._pos: int = 0
+
+    def _peek(self) -> Tuple[str, str]:
+        if self._pos < len(self._tokens):
+            return self._tokens[self._pos]
+        return ("end", "")
+
+    def _next(self) -> Tuple[str, str]:
+        token = self._peek()
+        self._pos += 1
+        return token
+
+    def _expect(self, value: str):
+        kind, token = self._next()
+        if token != value:
+            self._error()
+
+    def _error(self):
+        raise ValueError(f"Invalid unit expression: {self._text!r}.")
+
+    def parse(self) -> Union[RepresentableUnit, Number_t]:
+        result = self._expression()
+        if self._peek()[0] != "end":
+            self._error()
+        return result
+
+    # expression := factor (("*" | "/") factor)*
+    def _expression(self):
+        result = self._factor()
+        while self._peek() in (("op", "*"), ("op", "/")):
+            _, op = self._next()
+            right = self._factor()
+            if op == "*":
+                result = _multiply(result, right)
+            else:
+                result = _divide(result, right)
+        return result
+
+    # factor := "1" | atom | "(" atom "^" number ")" | "(" expression ")" ("^" number)?
+    def _factor(self):
+        kind, token = self._next()
+        if kind == "number":
+            if _parseNumber(token) != 1:
+                self._error()
+            return 1
+        if kind == "symbol":
+            return makeUnit(token)
+        if token != "(":
+            self._error()
+
+        if self._peek()[0] == "symbol" and self._tokens[self._pos+1:self._pos+2] == [("op", "^")]:
+            _, atom = self._next()
+            self._next()
+            power = self._number()
+            self._expect(")")
+            return makeUnit(atom, power)
+
+        result = self._expression()
+        self._expect(")")
+        if self._peek() == ("op", "^"):
+            self._next()
+            result = result ** self._number()
+        return result
+
+    def _number(self) -> Number_t:
+        kind, token = self._next()
+        if kind != "number":
+            self._error()
+        return _parseNumber(token)
+
+
+def _multiply(left, right):
+    if not isinstance(left, RepresentableUnit):
+        return right if left == 1 else left * right
+    if not isinstance(right, RepresentableUnit):
+        return left if right == 1 else left * right
+    return left * right
+
+def _divide(left, right):
+    if not isinstance(right, RepresentableUnit):
+        return left if right == 1 else left / right
+    if not isinstance(left, RepresentableUnit):
+        if left == 1:
+            return None / right
+        return left / right
+    return left / right
+
+
+@lru_cache(maxsize=1024)
+def parseUnit(text: str) -> Union[RepresentableUnit, Number_t]:
+    if not isinstance(text, str):
+        raise TypeError(f"Expected type str for 'text', not {type(text).__name__}.")
+    return _Parser(text).parse()
+
+
+_quantityRegex = re.compile(r"^\s*(?P<value>\S+?)(?:e(?P<exp10>[-+]?\d+))?\s*\[(?P<unit>[^\]]*)\]\s*$")
+
+def parseValue(text: str) -> Number_t:
+    for numberType in (int, float, complex):
+        try:
+            return numberType(text)
+        except ValueError:
+            pass
+    raise ValueError(f"Invalid number: {text!r}.")
+
+def splitQuantity(text: str) -> Tuple[str, int, str]:
+    match = _quantityRegex.match(text)
+    if match is None:
+        raise ValueError(f"Invalid quantity: {text!r}.")
+    value = match.group("value")
+    exp10 = match.group("exp10")
+    unit = match.group("unit").strip()
+    if exp10 is None:
+        return value, 0, unit
+    # ValueUnits writes exp10 as str(int): no "+" and no padding. A float
+    # writes its exponent with a sign and at least two digits ("1e+20",
+    # "1e-05"); "1e-28" could be either and is read as the float, so the
+    # float round-trips.
+    digits = exp10.lstrip("+-")
+    if exp10[0] == "+" or (digits[0] == "0" and len(digits) > 1) or (exp10[0] == "-" and len(digits) > 1):
+        try:
+            float(value + "e" + exp10)
+        except ValueError:
+            pass
+        else:
+            return value + "e" + exp10, 0, unit
+    return value, int(exp10), unit
+
+def parseQuantity(text: str) -> Union[ValueUnits, Number_t]:
+    value, exp10, unit = splitQuantity(text)
+    return ValueUnits(parseValue(value), parseUnit(unit), exp10)
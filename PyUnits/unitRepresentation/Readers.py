@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import csv
+import os
+from collections import namedtuple
+from typing import Iterator, Union
+
+from ..TypesHelper import Number_t
+from .Units import ValueUnits
+from .Parser import parseUnit, parseValue, splitQuantity
+
+
+# A run of raw values that share the same unit and exp10.
+QuantityBatch = namedtuple("QuantityBatch", ["unit", "exp10", "values"])
+
+
+def _openLines(source) -> Iterator[str]:
+    if isinstance(source, (str, bytes, os.PathLike)):
+        with open(source, "r", encoding="utf-8", newline="") as file:
+            yield from file
+    else:
+        yield from source
+
+def _fields(lines: Iterator[str], column: Union[int, str, None], delimiter: str, header: bool) -> Iterator[str]:
+    if column is None:
+        if header:
+            next(lines, None)
+        return (line for line in lines if line.strip())
+    rows = csv.reader(lines, delimiter=delimiter)
+    index = column
+    if header or isinstance(column, str):
+        names = next(rows, None)
+        if names is None:
+            return iter(())
+        if isinstance(column, str):
+            try:
+                index = names.index(column)
+            except ValueError:
+                raise ValueError(f"Column {column!r} not found in the header.") from None
+    return _column(rows, index, column)
+
+def _column(rows, index: int, column: Union[int, str]) -> Iterator[str]:
+    for row in rows:
+        if not row:
+            continue
+        try:
+            yield row[index]
+        except IndexError:
+            raise ValueError(f"Line {rows.line_num}: no column {column!r}, the row has {len(row)} fields.") from None
+
+
+def _parsed(fields: Iterator[str]):
+    for lineNumber, text in enumerate(fields, 1):
+        try:
+            value, exp10, unitText = splitQuantity(text)
+            yield parseValue(value), exp10, unitText, parseUnit(unitText)
+        except ValueError as exc:
+            raise ValueError(f"Entry {lineNumber}: {exc}") from None
+
+def readQuantities(source, *, column: Union[int, str, None]=None, delimiter: str=",", header: bool=False) -> Iterator[Union[ValueUnits, Number_t]]:
+    fields = _fields(_openLines(source), column, delimiter, header)
+    for value, exp10, _, unit in _parsed(fields):
+        yield ValueUnits(value, unit, exp10)
+
+def readQuantityBatches(source, *, batchSize: int=65536, column: Union[int, str, None]=None, delimiter: str=",", header: bool=False) -> Iterator[QuantityBatch]:
+    if not isinstance(batchSize, int) or batchSize <= 0:
+        raise ValueError("Parameter `batchSize` must be a positive int.")
+
+    fields = _fields(_openLines(source), column, delimiter, header)
+    # (unit string, exp10) -> (unit, values). At most `batchSize` values are
+    # pending in total: reaching it flushes every batch, so mixed units and
+    # exponents can't grow it without bound.
+    pending = dict()
+    count = 0
+    for value, exp10, unitText, unit in _parsed(fields):
+        key = (unitText, exp10)
+        batch = pending.get(key)
+        if batch is None:
+            batch = (unit, list())
+            pending[key] = batch
+        batch[1].append(value)
+        count += 1
+        if count >= batchSize:
+            yield from _flush(pending)
+            count = 0
+    yield from _flush(pending)
+
+def _flush(pending: dict) -> Iterator[QuantityBatch]:
+    for (_, exp10), (unit, values) in pending.items():
+        yield QuantityBatch(unit, exp10, values)
+    pending.clear()
@@ -0,0 +1,413 @@
+from __future__ import annotations
+
+import pickle
+import struct
+from fractions import Fraction
+from numbers import Integral
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..TypesHelper import Number_t
+from .Units import RepresentableUnit, Unit, UnitsFraction, ValueUnits, FloatValueUnits
+from .Units import typeKind, KIND_NUMBER, KIND_VALUE, _restoreFraction
+from .Dimensions import Dimension, dimensionsCount
+from .Parser import baseUnit
+
+
+# Binary layout, all little-endian:
+#   magic b"PYUQ", u8 version (2: unit strings have a u16 length)
+#   u32 unit count, then each unit (see encodeUnit)
+#   u32 run count, then each run: u32 unit id, i32 exp10, u8 value code, u8 mode, u32 length
+#   u64 payload size, then the payload: the values of every run, packed back to back
+# A run is a stretch of consecutive quantities sharing unit, exp10, value
+# type and numeric mode, so a homogeneous column costs one run header plus
+# 8 bytes per value.
+
+_magic = b"PYUQ"
+_version = 2
+
+_runHeader = struct.Struct("<IiBBI")
+_u8 = struct.Struct("<B")
+_u16 = struct.Struct("<H")
+_u32 = struct.Struct("<I")
+_i32 = struct.Struct("<i")
+_u64 = struct.Struct("<Q")
+
+# value type -> struct code. "D" is complex (two doubles), "n" an int
+# that doesn't fit in 64 bits (u16 length + signed bytes) and "F" a Fraction
+# (numerator and denominator, each like "n").
+_valueCodes = {float: "d", int: "q", bool: "?", complex: "D", Fraction: "F"}
+_itemSizes = {"d": 8, "q": 8, "?": 1, "D": 16}
+_int64Range = (-2**63, 2**63)
+
+_modes = {ValueUnits: 0, FloatValueUnits: 1}
+_modeClasses = (ValueUnits, FloatValueUnits)
+
+_tagUnit = 0
+_tagFraction = 1
+_tagDimension = 2
+_tagNone = 3
+
+
+def _encodeString(text: str) -> bytes:
+    data = text.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError(f"Can't serialize an unit symbol of {len(data)} bytes, the limit is 65535.")
+    return _u16.pack(len(data)) + data
+
+def _encodeNumber(number: Number_t) -> bytes:
+    if type(number) is int and _int64Range[0] <= number < _int64Range[1]:
+        return b"q" + struct.pack("<q", number)
+    if type(number) is float:
+        return b"d" + struct.pack("<d", number)
+    raise TypeError("Can't serialize a power of type " + type(number).__name__ + ".")
+
+def _encodeAtom(unit: Unit) -> bytes:
+    return _encodeString(unit.unit) + _encodeString(unit.defaultPrefix) + _encodeNumber(unit.power)
+
+def encodeUnit(unit: Optional[RepresentableUnit]) -> bytes:
+    if unit is None:
+        return _u8.pack(_tagNone)
+    if isinstance(unit, Unit):
+        return _u8.pack(_tagUnit) + _encodeAtom(unit)
+    if isinstance(unit, UnitsFraction):
+        num = unit.numeratorUnits
+        den = unit.denominatorUnits
+        return _u8.pack(_tagFraction) + _u16.pack(len(num)) + _u16.pack(len(den)) + b"".join(map(_encodeAtom, num + den))
+    if isinstance(unit, Dimension):
+        return _u8.pack(_tagDimension) + _i32.pack(unit.exp10) + b"".join(map(_encodeNumber, unit.exponents))
+    raise TypeError("Can't serialize an unit of type " + type(unit).__name__ + ".")
+
+
+class _Reader:
+
+    # attributes:
+    # self._data: memoryview
+    # self.pos: int
+
+    def __init__(self, data, pos: int=0):
+        self._data = memoryview(data)
+        self.pos: int = pos
+
+    def unpack(self, fmt: struct.Struct):
+        values = fmt.unpack_from(self._data, self.pos)
+        self.pos += fmt.size
+        return values[0] if len(values) == 1 else values
+
+    def bytes(self, size: int) -> memoryview:
+        if self.pos + size > len(self._data):
+            raise ValueError("Truncated quantity data.")
+        data = self._data[self.pos:self.pos+size]
+        self.pos += size
+        return data
+
+    def string(self) -> str:
+        return str(self.bytes(self.unpack(_u16)), "utf-8")
+
+    def number(self) -> Number_t:
+        code = bytes(self.bytes(1))
+        if code == b"q":
+            return struct.unpack("<q", self.bytes(8))[0]
+        if code == b"d":
+            return struct.unpack("<d", self.bytes(8))[0]
+        raise ValueError(f"Unknown number code: {code!r}.")
+
+    def atom(self) -> Unit:
+        symbol = self.string()
+        prefix = self.string()
+        return baseUnit(symbol, prefix, self.number())
+
+    def unit(self) -> Optional[RepresentableUnit]:
+        tag = self.unpack(_u8)
+        if tag == _tagNone:
+            return None
+        if tag == _tagUnit:
+            return self.atom()
+        if tag == _tagFraction:
+            numCount = self.unpack(_u16)
+            denCount = self.unpack(_u16)
+            num = tuple(self.atom() for _ in range(numCount))
+            den = tuple(self.atom() for _ in range(denCount))
+            return _restoreFraction(UnitsFraction, num, den)
+        if tag == _tagDimension:
+            exp10 = self.unpack(_i32)
+            return Dimension(tuple(self.number() for _ in range(dimensionsCount)), exp10)
+        raise ValueError(f"Unknown unit tag: {tag}.")
+
+
+def decodeUnit(data) -> Optional[RepresentableUnit]:
+    return _Reader(data).unit()
+
+
+class UnitTable:
+
+    # attributes:
+    # self._ids: Dict[Optional[tuple], int]
+    # self._units: List[Optional[RepresentableUnit]]
+
+    # Units keyed by type and string, like the algebra cache, so equal
+    # units built separately share one id. A table can be shared by several
+    # PackedQuantities, which then only need to ship it once.
+
+    def __init__(self, units: Iterable[Optional[RepresentableUnit]]=()):
+        self._ids: Dict[Optional[tuple], int] = dict()
+        self._units: List[Optional[RepresentableUnit]] = list()
+        for unit in units:
+            self.idOf(unit)
+
+    def idOf(self, unit: Optional[RepresentableUnit]) -> int:
+        key = (type(unit), str(unit)) if unit is not None else None
+        unitId = self._ids.get(key)
+        if unitId is None:
+            unitId = len(self._units)
+            self._ids[key] = unitId
+            self._units.append(unit)
+        return unitId
+
+    @property
+    def units(self) -> Tuple[Optional[RepresentableUnit], ...]:
+        return tuple(self._units)
+
+    def __len__(self) -> int:
+        return len(self._units)
+
+    def tobytes(self) -> bytes:
+        return _u32.pack(len(self._units)) + b"".join(map(encodeUnit, self._units))
+
+    @classmethod
+    def frombytes(cls, data) -> UnitTable:
+        return cls(_readUnits(_Reader(data)))
+
+
+def _readUnits(reader: _Reader) -> Tuple[Optional[RepresentableUnit], ...]:
+    return tuple(reader.unit() for _ in range(reader.unpack(_u32)))
+
+
+def _quantity(cls: type, value: Number_t, unit: RepresentableUnit, exp10: int) -> ValueUnits:
+    # The values were checked when they were packed, so the checks of
+    # ValueUnits.__new__ are skipped.
+    self = object.__new__(cls)
+    self._value = value
+    self._unit = unit
+    self._exp10 = exp10
+    self._magnitude = None
+    self._str = None
+    self._hash = None
+    return self
+
+
+class PackedQuantities:
+    __slots__ = ("_units", "_runs", "_payload", "_count")
+
+    # attributes:
+    # self._units: Tuple[Optional[RepresentableUnit], ...]
+    # self._runs: Tuple[Tuple[int, int, str, int, int], ...]
+    # self._payload: memoryview
+    # self._count: int
+
+    # inmutable
+
+    def __init__(self, units: Tuple[Optional[RepresentableUnit], ...], runs: Tuple[Tuple[int, int, str, int, int], ...], payload):
+        self._units = tuple(units)
+        self._runs = tuple(runs)
+        self._payload = memoryview(payload).cast("B")
+        self._count = sum(run[4] for run in self._runs)
+
+    @classmethod
+    def pack(cls, quantities: Iterable, table: Optional[UnitTable]=None) -> PackedQuantities:
+        if table is None:
+            table = UnitTable()
+        runs: List[Tuple[int, int, str, int, int]] = list()
+        chunks: List[bytes] = list()
+
+        def flush(key, values):
+            unitId, exp10, code, mode = key
+            if code == "n":
+                chunks.append(b"".join(_encodeBigInt(value) for value in values))
+            elif code == "F":
+                chunks.append(b"".join(_encodeBigInt(value.numerator) + _encodeBigInt(value.denominator) for value in values))
+            elif code == "D":
+                flat = [part for value in values for part in (value.real, value.imag)]
+                chunks.append(struct.pack(f"<{len(flat)}d", *flat))
+            else:
+                chunks.append(struct.pack(f"<{len(values)}{code}", *values))
+            runs.append((unitId, exp10, code, mode, len(values)))
+
+        key = None
+        values: List[Number_t] = list()
+        lastUnit = object()
+        unitId = -1
+        for quantity in quantities:
+            quantityType = type(quantity)
+            mode = _modes.get(quantityType)
+            if mode is not None:
+                unit, exp10, value = quantity._unit, quantity._exp10, quantity._value
+            else:
+                kind = typeKind(quantity)
+                if kind & KIND_VALUE:
+                    unit, exp10, value, mode = quantity.unit, quantity.exp10, quantity.value, 0
+                elif kind & KIND_NUMBER:
+                    unit, exp10, value, mode = None, 0, quantity, 0
+                else:
+                    raise TypeError("Expected a quantity or a number, not an " + quantityType.__name__ + ".")
+
+            code = _valueCodes.get(type(value))
+            if code is None:
+                value = _plainValue(value)
+                code = _valueCodes[type(value)]
+            if code == "q" and not _int64Range[0] <= value < _int64Range[1]:
+                code = "n"
+
+            if unit is not lastUnit:
+                unitId = table.idOf(unit)
+                lastUnit = unit
+
+            runKey = (unitId, exp10, code, mode)
+            if runKey != key:
+                if key is not None:
+                    flush(key, values)
+                key = runKey
+                values = list()
+            values.append(value)
+        if key is not None:
+            flush(key, values)
+
+        return cls(table.units, runs, b"".join(chunks))
+
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[Union[ValueUnits, Number_t]]:
+        for run, values in self._decodedRuns():
+            unitId, exp10, _, mode, _ = run
+            unit = self._units[unitId]
+            if unit is None:
+                yield from values
+                continue
+            cls = _modeClasses[mode]
+            for value in values:
+                yield _quantity(cls, value, unit, exp10)
+
+    def unpack(self) -> List[Union[ValueUnits, Number_t]]:
+        return list(self)
+
+    @property
+    def units(self) -> Tuple[Optional[RepresentableUnit], ...]:
+        return self._units
+    @property
+    def runs(self) -> Tuple[Tuple[int, int, str, int, int], ...]:
+        return self._runs
+    @property
+    def payload(self) -> memoryview:
+        return self._payload
+
+    def _decodedRuns(self):
+        payload = self._payload
+        pos = 0
+        for run in self._runs:
+            code, count = run[2], run[4]
+            if code == "n":
+                values = list()
+                for _ in range(count):
+                    value, pos = _readBigInt(payload, pos)
+                    values.append(value)
+            elif code == "F":
+                values = list()
+                for _ in range(count):
+                    numerator, pos = _readBigInt(payload, pos)
+                    denominator, pos = _readBigInt(payload, pos)
+                    values.append(Fraction(numerator, denominator))
+            elif code == "D":
+                flat = struct.unpack_from(f"<{2*count}d", payload, pos)
+                values = [complex(flat[i], flat[i+1]) for i in range(0, 2*count, 2)]
+                pos += 16*count
+            else:
+                values = struct.unpack_from(f"<{count}{code}", payload, pos)
+                pos += _itemSizes[code]*count
+            yield run, values
+
+
+    def header(self) -> bytes:
+        parts = [_magic, _u8.pack(_version), _u32.pack(len(self._units))]
+        parts.extend(map(encodeUnit, self._units))
+        parts.append(_u32.pack(len(self._runs)))
+        for unitId, exp10, code, mode, count in self._runs:
+            parts.append(_runHeader.pack(unitId, exp10, ord(code), mode, count))
+        return b"".join(parts)
+
+    def tobytes(self) -> bytes:
+        return self.header() + _u64.pack(len(self._payload)) + bytes(self._payload)
+
+    @classmethod
+    def frombytes(cls, data) -> PackedQuantities:
+        reader = _Reader(data)
+        units, runs = _readHeader(reader)
+        size = reader.unpack(_u64)
+        return cls(units, runs, reader.bytes(size))
+
+    def __reduce_ex__(self, protocol: int):
+        # With protocol 5 the payload travels as an out-of-band buffer when
+        # the pickler is given a buffer_callback.
+        if protocol >= 5:
+            return _fromParts, (self.header(), pickle.PickleBuffer(self._payload))
+        return _fromParts, (self.header(), bytes(self._payload))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._count} quantities, {len(self._units)} units, {len(self._runs)} runs)"
+
+
+def _plainValue(value: Number_t) -> Number_t:
+    # numpy scalars (np.float64, np.int64, ...) become the builtin number
+    item = getattr(value, "item", None)
+    if callable(item):
+        value = item()
+    if type(value) not in _valueCodes:
+        if isinstance(value, Integral):
+            value = int(value)
+        elif isinstance(value, Fraction):
+            value = Fraction(value)
+        else:
+            raise TypeError("Can't serialize a value of type " + type(value).__name__ + "; convert it to an int, float, complex or Fraction.")
+    return value
+
+def _encodeBigInt(value: int) -> bytes:
+    data = value.to_bytes((value.bit_length() + 8) // 8, "little", signed=True)
+    return _u16.pack(len(data)) + data
+
+def _readBigInt(payload: memoryview, pos: int) -> Tuple[int, int]:
+    size = _u16.unpack_from(payload, pos)[0]
+    pos += 2
+    return int.from_bytes(payload[pos:pos+size], "little", signed=True), pos + size
+
+def _readHeader(reader: _Reader):
+    if bytes(reader.bytes(len(_magic))) != _magic:
+        raise ValueError("Not a packed quantities stream.")
+    version = reader.unpack(_u8)
+    if version != _version:
+        raise ValueError(f"Unsupported packed quantities version: {version}.")
+    units = _readUnits(reader)
+    runs = list()
+    for _ in range(reader.unpack(_u32)):
+        unitId, exp10, code, mode, count = reader.unpack(_runHeader)
+        runs.append((unitId, exp10, chr(code), mode, count))
+    return units, tuple(runs)
+
+def _fromParts(header: bytes, payload) -> PackedQuantities:
+    units, runs = _readHeader(_Reader(header))
+    return PackedQuantities(units, runs, payload)
+
+
+def packQuantities(quantities: Iterable, table: Optional[UnitTable]=None) -> PackedQuantities:
+    return PackedQuantities.pack(quantities, table)
+
+def dumps(quantities: Iterable) -> bytes:
+    return PackedQuantities.pack(quantities).tobytes()
+
+def loads(data) -> List[Union[ValueUnits, Number_t]]:
+    return PackedQuantities.frombytes(data).unpack()
+
+def dump(quantities: Iterable, file: BinaryIO):
+    file.write(dumps(quantities))
+
+def load(file: BinaryIO) -> List[Union[ValueUnits, Number_t]]:
+    return loads(file.read())
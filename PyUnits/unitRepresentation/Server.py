@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from numbers import Number
+from typing import Dict, List, Optional, Tuple
+
+from ..quantities import Conversions
+from .AlgebraCache import AlgebraCache
+from .Parser import parseUnit, parseQuantity
+from ..prefixes import SIPrefixes
+from .Units import RepresentableUnit, RepresentableValueUnit
+from .Dimensions import Dimension, dimensionsCount, toDimension
+
+
+# Line-delimited JSON over TCP or a Unix socket. Each request line is an
+# object with an "op" and an optional "id" that is echoed back:
+#   {"op": "convert", "value": 3 or [..], "from": "ft", "to": "m"}  -> {"value": ..}
+#   {"op": "check", "from": "kg*m/(s^2)", "to": "N"}                 -> {"compatible": ..}
+#   {"op": "parse", "quantity": "3e2 [m]"}                          -> {"value", "exp10", "unit", "si", "siUnit"}
+#   {"op": "parse", "quantity": "3 [ft]", "to": "m"}                 -> {.., "converted": ..}
+#   {"op": "stats"}                                                  -> throughput and latency percentiles
+# Errors come back as {"error": message}. Responses on a connection keep
+# the order of its requests.
+#
+# Requests from every connection go through one queue. The batcher waits
+# `window` seconds after the first request (or until `maxBatch` requests)
+# and evaluates the batch together, resolving each distinct unit pair once.
+
+_lineLimit = 1 << 20
+
+# Longest prefixes first, so "da" is tried before "d".
+_prefixes = sorted(SIPrefixes.si_prefixes, key=len, reverse=True)
+
+
+def percentile(sortedValues: List[float], fraction: float) -> float:
+    if not sortedValues:
+        return 0.0
+    index = min(len(sortedValues) - 1, int(fraction * len(sortedValues)))
+    return sortedValues[index]
+
+
+class ServerStats:
+
+    # attributes:
+    # self._start: float
+    # self._requests: int
+    # self._errors: int
+    # self._batches: int
+    # self._latencies: deque
+
+    def __init__(self, keep: int=100_000):
+        self._start: float = time.perf_counter()
+        self._requests: int = 0
+        self._errors: int = 0
+        self._batches: int = 0
+        self._latencies: deque = deque(maxlen=keep)
+
+    def record(self, latency: float, error: bool):
+        self._requests += 1
+        self._errors += error
+        self._latencies.append(latency)
+
+    def recordBatch(self):
+        self._batches += 1
+
+    def report(self) -> Dict[str, float]:
+        elapsed = time.perf_counter() - self._start
+        latencies = sorted(self._latencies)
+        return {
+            "requests": self._requests,
+            "errors": self._errors,
+            "batches": self._batches,
+            "meanBatch": self._requests / self._batches if self._batches else 0.0,
+            "uptime": elapsed,
+            "throughput": self._requests / elapsed if elapsed > 0 else 0.0,
+            "p50Ms": percentile(latencies, 0.50) * 1e3,
+            "p90Ms": percentile(latencies, 0.90) * 1e3,
+            "p99Ms": percentile(latencies, 0.99) * 1e3,
+            "maxMs": (latencies[-1] if latencies else 0.0) * 1e3,
+        }
+
+
+def resolveConversion(text: str) -> Conversions.Conversion:
+    # table symbols ("ft", "°C", "N") first, then unit expressions
+    conversion = Conversions.conversionTable.get(text)
+    if conversion is not None:
+        return conversion
+    unit = parseUnit(text)
+    if not isinstance(unit, RepresentableUnit):
+        raise ValueError(f"{text!r} is dimensionless.")
+    return unitConversion(unit)
+
+def unitConversion(unit: RepresentableUnit) -> Conversions.Conversion:
+    # pieces that are not SI base units ("km/h", "N*m") are looked up in
+    # the conversion table one by one
+    if toDimension(unit) is not None:
+        return Conversions.getConversion(unit)
+
+    exponents = [0] * dimensionsCount
+    factor = 1.0
+    for pieces, sign in ((unit.numeratorUnits, 1), (unit.denominatorUnits, -1)):
+        for piece in pieces:
+            conversion = symbolConversion(piece.defaultPrefix + piece.unit)
+            if conversion is None or conversion.offset != 0:
+                raise ValueError(f"{unit} can't be expressed in SI base quantities.")
+            power = sign * piece.power
+            exponents = [exp + power*other for exp, other in zip(exponents, conversion.unit.exponents)]
+            factor *= conversion.factor ** power
+    return Conversions.Conversion(Dimension(exponents), factor, 0)
+
+def symbolConversion(symbol: str) -> Optional[Conversions.Conversion]:
+    # The parser only splits prefixes off base units, so derived units come
+    # whole ("kN", "MPa"). Whole symbols win ("min" is a minute, "ft" a
+    # foot); otherwise the longest SI prefix before a table symbol is used.
+    conversion = Conversions.conversionTable.get(symbol)
+    if conversion is not None:
+        return conversion
+    for prefix in _prefixes:
+        if symbol.startswith(prefix) and len(symbol) > len(prefix):
+            conversion = Conversions.conversionTable.get(symbol[len(prefix):])
+            if conversion is not None and conversion.offset == 0:
+                scale = SIPrefixes.pow10(SIPrefixes.getExponentFromSIPrefix(prefix))
+                return Conversions.Conversion(conversion.unit, conversion.factor * scale, 0)
+    return None
+
+
+def _factorBetween(source: Conversions.Conversion, target: Conversions.Conversion) -> Tuple[float, float]:
+    if source.unit != target.unit:
+        raise ValueError(f"Can't convert from [{source.unit}] to [{target.unit}].")
+    return source.factor / target.factor, (source.offset - target.offset) / target.factor
+
+
+class ConversionServer:
+
+    # attributes:
+    # self._window: float
+    # self._maxBatch: int
+    # self._queue: Optional[asyncio.Queue]
+    # self._conversions: AlgebraCache
+    # self._stats: ServerStats
+    # self._server: Optional[asyncio.AbstractServer]
+    # self._batcher: Optional[asyncio.Task]
+    # self._connections: set
+
+    def __init__(self, *, window: float=0.002, maxBatch: int=1024):
+        if window < 0:
+            raise ValueError("Parameter `window` must not be negative.")
+        if not isinstance(maxBatch, int) or maxBatch <= 0:
+            raise ValueError("Parameter `maxBatch` must be a positive int.")
+        self._window: float = window
+        self._maxBatch: int = maxBatch
+        self._queue: Optional[asyncio.Queue] = None
+        self._conversions: AlgebraCache = AlgebraCache(maxsize=4096)
+        self._stats: ServerStats = ServerStats()
+        self._server = None
+        self._batcher = None
+        self._connections: set = set()
+
+    @property
+    def stats(self) -> ServerStats:
+        return self._stats
+
+    @property
+    def sockets(self):
+        return self._server.sockets if self._server is not None else ()
+
+    async def start(self, host: str="127.0.0.1", port: int=0, *, path: Optional[str]=None):
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.get_running_loop().create_task(self._runBatches())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path, limit=_lineLimit)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=_lineLimit)
+        return self
+
+    async def serveForever(self):
+        await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+        tasks = list(self._connections)
+        if self._batcher is not None:
+            tasks.append(self._batcher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+        pending: asyncio.Queue = asyncio.Queue()
+        sender = loop.create_task(self._send(pending, writer))
+        self._connections.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = loop.create_future()
+                await self._queue.put((line, future, time.perf_counter()))
+                await pending.put(future)
+        except (ConnectionError, asyncio.CancelledError):
+            sender.cancel()
+        finally:
+            self._connections.discard(asyncio.current_task())
+            pending.put_nowait(None)
+            await asyncio.gather(sender, return_exceptions=True)
+
+    async def _send(self, pending: asyncio.Queue, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                future = await pending.get()
+                if future is None:
+                    break
+                writer.write(await future)
+                if pending.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _runBatches(self):
+        queue = self._queue
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self._window
+            while len(batch) < self._maxBatch:
+                if queue.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+            try:
+                self._evaluate(batch)
+            except Exception as exc:
+                # _evaluate answers each request on its own, so this is a
+                # bug; still answer what is left rather than stop serving
+                response = json.dumps({"error": f"Internal error: {exc}"}).encode("utf-8") + b"\n"
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_result(response)
+
+
+    def _evaluate(self, batch: List[Tuple[bytes, asyncio.Future, float]]):
+        self._stats.recordBatch()
+        # unit pair -> (scale, shift) or the error, for this batch
+        pairs: Dict[Tuple[str, str], object] = dict()
+        for line, future, received in batch:
+            error = False
+            request = None
+            try:
+                request = json.loads(line)
+                if not isinstance(request, dict):
+                    raise ValueError("A request must be a JSON object.")
+                response = self._answer(request, pairs)
+            except KeyError as exc:
+                response = {"error": f"Missing field: {exc}."}
+                error = True
+            except RecursionError:
+                response = {"error": "Request is nested too deeply."}
+                error = True
+            except Exception as exc:
+                # any failure is that request's error, never the batch's
+                response = {"error": str(exc) or type(exc).__name__}
+                error = True
+            if not isinstance(request, dict):
+                request = {}
+            if "id" in request:
+                response["id"] = request["id"]
+            try:
+                # no NaN or Infinity: they are not JSON
+                data = json.dumps(response, allow_nan=False)
+            except Exception as exc:
+                response = {"error": f"Can't encode the response: {exc}"}
+                try:
+                    data = json.dumps(dict(response, id=request.get("id")), allow_nan=False)
+                except ValueError:
+                    data = json.dumps(response)
+                error = True
+            self._stats.record(time.perf_counter() - received, error)
+            if not future.done():
+                future.set_result(data.encode("utf-8") + b"\n")
+
+    def _conversion(self, text: str) -> Conversions.Conversion:
+        return self._conversions.get(text, lambda: resolveConversion(text))
+
+    def _factor(self, source: str, target: str, pairs: Dict[Tuple[str, str], object]) -> Tuple[float, float]:
+        key = (source, target)
+        found = pairs.get(key)
+        if found is None:
+            try:
+                found = _factorBetween(self._conversion(source), self._conversion(target))
+            except ValueError as exc:
+                found = exc
+            pairs[key] = found
+        if isinstance(found, Exception):
+            raise found
+        return found
+
+    def _answer(self, request: dict, pairs) -> dict:
+        op = request.get("op")
+        if op == "convert":
+            scale, shift = self._factor(request["from"], request["to"], pairs)
+            value = request["value"]
+            if isinstance(value, list):
+                if not all(isinstance(item, Number) for item in value):
+                    raise ValueError("Field `value` must hold numbers.")
+                return {"value": [item*scale + shift for item in value]}
+            if not isinstance(value, Number) or isinstance(value, bool):
+                raise ValueError("Field `value` must be a number or a list of numbers.")
+            return {"value": value*scale + shift}
+        if op == "check":
+            try:
+                self._factor(request["from"], request["to"], pairs)
+            except ValueError:
+                return {"compatible": False}
+            return {"compatible": True}
+        if op == "parse":
+            quantity = parseQuantity(request["quantity"])
+            if not isinstance(quantity, RepresentableValueUnit):
+                return {"value": quantity, "exp10": 0, "unit": "", "si": quantity, "siUnit": ""}
+            conversion = unitConversion(quantity.unit)
+            response = {
+                "value": _jsonNumber(quantity.value),
+                "exp10": quantity.exp10,
+                "unit": str(quantity.unit),
+                "si": _jsonNumber(quantity.magnitude * conversion.factor),
+                "siUnit": str(conversion.unit),
+            }
+            if "to" in request:
+                scale, shift = _factorBetween(conversion, self._conversion(request["to"]))
+                response["converted"] = _jsonNumber(quantity.magnitude*scale + shift)
+            return response
+        if op == "stats":
+            return self._stats.report()
+        raise ValueError(f"Unknown op: {op!r}.")
+
+
+def _jsonNumber(value):
+    if isinstance(value, complex):
+        raise ValueError("Complex values can't be sent as JSON.")
+    return value
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Line-delimited JSON unit conversion server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--window", type=float, default=0.002, help="batching window in seconds")
+    parser.add_argument("--max-batch", type=int, default=1024)
+    args = parser.parse_args(argv)
+
+    async def run():
+        server = ConversionServer(window=args.window, maxBatch=args.max_batch)
+        await server.start(args.host, args.port, path=args.unix)
+        print("listening on", ", ".join(str(sock.getsockname()) for sock in server.sockets), flush=True)
+        try:
+            await server.serveForever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
@@ -3,22 +3,93 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from numbers import Number, Complex, Real, Integral
 from math import trunc, floor, ceil
-from collections import Counter, Iterable
-from typing import List, Tuple, Optional, Union, overload
+from operator import itemgetter
+from collections.abc import Iterable
+from typing import Dict, List, Tuple, Optional, Union, overload
 from typing import SupportsInt, SupportsFloat, SupportsComplex
+from weakref import WeakValueDictionary
+from functools import lru_cache
 
 from ..TypesHelper import Number_t
 from ..prefixes import SIPrefixes
+from .AlgebraCache import unitAlgebraCache
+
+
+@lru_cache(maxsize=None)
+def slotNames(cls: type) -> Tuple[str, ...]:
+    names = list()
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        for name in slots:
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return tuple(names)
+
+
+# Operand kinds, keyed by concrete type. Operators look the kind of their
+# operand up here instead of running isinstance against the numbers ABCs
+# and the Representable classes on every call; a type is classified with
+# issubclass the first time it is seen.
+KIND_NONE = 1
+KIND_NUMBER = 2
+KIND_REAL = 4
+KIND_INTEGRAL = 8
+KIND_UNIT = 16
+KIND_SINGLEUNIT = 32
+KIND_VALUE = 64
+KIND_DIMENSION = 128
+
+_typeKinds: Dict[type, int] = dict()
+
+def _classify(cls: type) -> int:
+    kind = 0
+    if cls is type(None):
+        kind |= KIND_NONE
+    if issubclass(cls, Number):
+        kind |= KIND_NUMBER
+    if issubclass(cls, Real):
+        kind |= KIND_REAL
+    if issubclass(cls, Integral):
+        kind |= KIND_INTEGRAL
+    if issubclass(cls, RepresentableUnit):
+        kind |= KIND_UNIT
+    if issubclass(cls, Unit):
+        kind |= KIND_SINGLEUNIT
+    if issubclass(cls, RepresentableValueUnit):
+        kind |= KIND_VALUE
+    if kind & KIND_UNIT and cls._exponentAlgebra:
+        kind |= KIND_DIMENSION
+    _typeKinds[cls] = kind
+    return kind
+
+def typeKind(value) -> int:
+    kind = _typeKinds.get(type(value))
+    if kind is None:
+        return _classify(type(value))
+    return kind
+
+def clearTypeKinds():
+    # Needed only if a type is registered on a numbers ABC after it was
+    # already used as an operand.
+    _typeKinds.clear()
 
 
 class Representable(ABC):
+    __slots__ = ()
+
     def copy(self):
-        obj = super().__new__(self.getClass())
-        for key, value in self.__dict__.items():
+        obj = object.__new__(self.__class__)
+        for key in slotNames(self.__class__):
+            try:
+                value = getattr(self, key)
+            except AttributeError:
+                continue
             if isinstance(value, list):
-                obj.__dict__[key] = list(value)
+                setattr(obj, key, list(value))
             else:
-                obj.__dict__[key] = value
+                setattr(obj, key, value)
         return obj
 
     def className(self) -> str:
@@ -52,7 +123,10 @@ class Representable(ABC):
     def __eq__(self, other) -> bool:
         return False
     def __ne__(self, other) -> bool:
-        return not self.__eq__(other)
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
 
 
     @abstractmethod
@@ -82,6 +156,18 @@ class Representable(ABC):
 
 
 class RepresentableUnit(Representable):
+    __slots__ = ()
+
+    # Units that combine as exponent vectors (Dimension) may carry a power of
+    # ten that unit lists can't hold, so list-based units leave products and
+    # quotients with them to the other operand.
+    _exponentAlgebra = False
+
+    @property
+    def canonicalKey(self) -> tuple:
+        # the same for every order of the same units; equal units have equal keys
+        return fractionKey(self.numeratorUnits, self.denominatorUnits)
+
     @overload
     def __mul__(self, other: RepresentableUnit) -> UnitsFraction: ...
     @overload
@@ -89,11 +175,15 @@ class RepresentableUnit(Representable):
     @overload
     def __mul__(self, other: None) -> RepresentableUnit: ...
     def __mul__(self, other):
-        if isinstance(other, RepresentableUnit):
-            return UnitsFraction(self, other, divide=False)
-        if isinstance(other, Number):
+        kind = typeKind(other)
+        if kind & KIND_UNIT:
+            if kind & KIND_DIMENSION:
+                return NotImplemented
+            key = ("*", type(self), str(self), type(other), str(other))
+            return unitAlgebraCache.get(key, lambda: UnitsFraction(self, other, divide=False))
+        if kind & KIND_NUMBER:
             return ValueUnits(self, other)
-        if other is None:
+        if kind & KIND_NONE:
             return self
         return super().__mul__(other)
 
@@ -104,11 +194,14 @@ class RepresentableUnit(Representable):
     @overload
     def __rmul__(self, other: None) -> RepresentableUnit: ...
     def __rmul__(self, other):
-        if isinstance(other, RepresentableUnit):
+        kind = typeKind(other)
+        if kind & KIND_UNIT:
+            if kind & KIND_DIMENSION:
+                return NotImplemented
             return UnitsFraction(other, self, divide=False)
-        if isinstance(other, Number):
+        if kind & KIND_NUMBER:
             return ValueUnits(other, self)
-        if other is None:
+        if kind & KIND_NONE:
             return self
         return super().__rmul__(other)
 
@@ -120,11 +213,15 @@ class RepresentableUnit(Representable):
     @overload
     def __truediv__(self, other: None) -> RepresentableUnit: ...
     def __truediv__(self, other):
-        if isinstance(other, RepresentableUnit):
-            return UnitsFraction(self, other, divide=True)
-        if isinstance(other, Number):
+        kind = typeKind(other)
+        if kind & KIND_UNIT:
+            if kind & KIND_DIMENSION:
+                return NotImplemented
+            key = ("/", type(self), str(self), type(other), str(other))
+            return unitAlgebraCache.get(key, lambda: UnitsFraction(self, other, divide=True))
+        if kind & KIND_NUMBER:
             return ValueUnits(1/other, self)
-        if other is None:
+        if kind & KIND_NONE:
             return self
         return super().__truediv__(other)
 
@@ -135,11 +232,14 @@ class RepresentableUnit(Representable):
     @overload
     def __rtruediv__(self, other: None) -> RepresentableUnit: ...
     def __rtruediv__(self, other):
-        if isinstance(other, RepresentableUnit):
+        kind = typeKind(other)
+        if kind & KIND_UNIT:
+            if kind & KIND_DIMENSION:
+                return NotImplemented
             return UnitsFraction(other, self, divide=True)
-        if isinstance(other, Number):
+        if kind & KIND_NUMBER:
             return ValueUnits(other, UnitsFraction(None, self, divide=True))
-        if other is None:
+        if kind & KIND_NONE:
             return UnitsFraction(None, self, divide=True)
         return super().__rtruediv__(other)
 
@@ -150,16 +250,31 @@ class RepresentableUnit(Representable):
 
 
 class Unit(RepresentableUnit):
+    __slots__ = ("_unit", "_defaultPrefix", "_power", "_str", "_key", "_hash", "__weakref__")
 
     # attributes:
     # self._unit: str
     # self._defaultPrefix: str
     # self._power: Number_t
+    # self._str: str
+    # self._key: tuple
+    # self._hash: int
 
     # inmutable
 
+    # interned instances, keyed by (class, unit, defaultPrefix, type(power), power).
+    # Entries go away once the last strong reference to the unit is dropped.
+    _interned: WeakValueDictionary = WeakValueDictionary()
+
     def __new__(cls, unit: str, defaultPrefix: str="", *, power: Number_t=1):
-        self = super(Unit, cls).__new__(cls)
+        try:
+            key = (cls, unit, defaultPrefix, type(power), power)
+            self = Unit._interned.get(key)
+        except TypeError:
+            key = None
+            self = None
+        if self is not None:
+            return self
 
         if not isinstance(unit, str):
             raise TypeError(f"Expected type str for 'unit', not {type(unit).__name__}.")
@@ -167,17 +282,28 @@ class Unit(RepresentableUnit):
             raise TypeError(f"Expected type str for 'defaultPrefix', not {type(defaultPrefix).__name__}.")
         if not SIPrefixes.isValidPrefix(defaultPrefix):
             raise TypeError(f"Invalid prefix: {defaultPrefix}.")
-        if not isinstance(power, Number):
+        powerKind = typeKind(power)
+        if not powerKind & KIND_NUMBER:
             raise TypeError(f"Expected a numeral type for power, not {type(power).__name__}.")
 
         if power == 0:
             return 1
-        elif isinstance(power, Real) and power < 0:
+        elif powerKind & KIND_REAL and power < 0:
             return UnitsFraction(None, Unit(unit, defaultPrefix, power=-power), divide=True)
 
+        self = super(Unit, cls).__new__(cls)
         self._unit = unit
         self._defaultPrefix = defaultPrefix
         self._power = power
+        if power != 1:
+            self._str = f"({defaultPrefix}{unit}^{power})"
+        else:
+            self._str = defaultPrefix + unit
+        self._key = (((unit, defaultPrefix, power),), ())
+        self._hash = hash(self._key)
+
+        if key is not None:
+            Unit._interned[key] = self
 
         return self
 
@@ -186,15 +312,22 @@ class Unit(RepresentableUnit):
         self._defaultPrefix: str = self.defaultPrefix
         self._power: Number_t = self.power
 
+    def copy(self) -> Unit:
+        return self
+
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
 
     def __str__(self) -> str:
-        if self.power != 1:
-            return f"({self.defaultPrefix}{self.unit}^{self.power})"
-        return self.defaultPrefix + self.unit
+        return self._str
+
+    def __reduce__(self):
+        return _restoreUnit, (self.__class__, self._unit, self._defaultPrefix, self._power)
 
 
+    @property
+    def canonicalKey(self) -> tuple:
+        return self._key
     @property
     def numeratorUnits(self) -> List[Unit]:
         return [self]
@@ -213,17 +346,15 @@ class Unit(RepresentableUnit):
 
 
     def hasSameUnit(self, other: Representable) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, Representable):
             return super.hasSameUnit(other)
-        otherNum = other.numeratorUnits
-        otherDen = other.denominatorUnits
-        if len(otherDen) != 0:
-            return False
-        if len(otherNum) != 1:
-            return False
-        return self.unit == otherNum[0].unit and self.defaultPrefix == otherNum[0].defaultPrefix and self.power == otherNum[0].power
+        return self._key == unitKey(other)
 
     def hasSameBaseUnit(self, other: RepresentableUnit) -> bool:
+        if other is self:
+            return True
         otherNum = other.numeratorUnits
         otherDen = other.denominatorUnits
         if len(otherDen) != 0:
@@ -234,47 +365,37 @@ class Unit(RepresentableUnit):
 
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, RepresentableUnit):
+        if other is self:
+            return True
+        if not typeKind(other) & KIND_UNIT:
             return super().__eq__(other)
-        otherNum = other.numeratorUnits
-        otherDen = other.denominatorUnits
-        if len(otherDen) != 0:
-            return False
-        if len(otherNum) != 1:
-            return False
-        if self.unit != otherNum[0].unit:
-            return False
-        if self.defaultPrefix != otherNum[0].defaultPrefix:
-            return False
-        if self.power != otherNum[0].power:
-            return False
-        return True
+        return self._key == other.canonicalKey
 
 
     def __mul__(self, other):
-        if isinstance(other, Unit) and self.hasSameBaseUnit(other):
+        if typeKind(other) & KIND_SINGLEUNIT and self.hasSameBaseUnit(other):
             return Unit(self.unit, self.defaultPrefix, power=self.power+other.power)
         return super().__mul__(other)
 
     def __rmul__(self, other):
-        if isinstance(other, Unit) and self.hasSameBaseUnit(other):
+        if typeKind(other) & KIND_SINGLEUNIT and self.hasSameBaseUnit(other):
             return Unit(self.unit, self.defaultPrefix, power=other.power+self.power)
         return super().__rmul__(other)
 
 
     def __truediv__(self, other):
-        if isinstance(other, Unit) and self.hasSameBaseUnit(other):
+        if typeKind(other) & KIND_SINGLEUNIT and self.hasSameBaseUnit(other):
             return Unit(self.unit, self.defaultPrefix, power=self.power-other.power)
         return super().__truediv__(other)
 
     def __rtruediv__(self, other):
-        if isinstance(other, Unit) and self.hasSameBaseUnit(other):
+        if typeKind(other) & KIND_SINGLEUNIT and self.hasSameBaseUnit(other):
             return Unit(self.unit, self.defaultPrefix, power=other.power-self.power)
         return super().__rtruediv__(other)
 
 
     def __pow__(self, other: Number_t) -> RepresentableUnit:
-        if isinstance(other, Number):
+        if typeKind(other) & KIND_NUMBER:
             if other == 1:
                 return self
             return Unit(self.unit, self.defaultPrefix, power=self.power*other)
@@ -282,13 +403,21 @@ class Unit(RepresentableUnit):
 
 
 class UnitsFraction(RepresentableUnit):
+    __slots__ = ("_numerator", "_denominator", "_str", "_key", "_hash")
 
     # attributes:
     # self._numerator: UnitsList_t
     # self._denominator: UnitsList_t
+    # self._str: Optional[str]
+    # self._key: tuple
+    # self._hash: Optional[int]
 
     # inmutable
 
+    # The lists keep the order the units came in, which is the order they
+    # are printed in. `_key` is the canonical form, both lists sorted, and
+    # is what equality, hashing and hasSameUnit compare.
+
     def __new__(cls, left: Union[RepresentableUnit, Iterable, None], right: Optional[RepresentableUnit]=None, *, divide: bool):
         self = super(UnitsFraction, cls).__new__(cls)
 
@@ -356,6 +485,10 @@ class UnitsFraction(RepresentableUnit):
         if len(self._numerator) == 0 and len(self._denominator) == 0:
             return 1
 
+        self._str = None
+        self._key = fractionKey(self._numerator, self._denominator)
+        self._hash = None
+
         return self
 
     def __init__(self, left: Union[RepresentableUnit, Iterable, None], right: Union[RepresentableUnit, Iterable, None]=None, *, divide: bool):
@@ -363,25 +496,22 @@ class UnitsFraction(RepresentableUnit):
         self._denominator: List[Unit] = self.denominatorUnits
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        if self._hash is None:
+            self._hash = hash(self._key)
+        return self._hash
 
     def __str__(self) -> str:
-        numList = list(map(str, self.numeratorUnits))
-        aux = ""
-        if len(self.numeratorUnits) != 0:
-            aux = "*".join(numList)
-        else:
-            aux = "1"
-        if len(self.denominatorUnits) != 0:
-            aux += "/"
-            if len(self.denominatorUnits) == 1:
-                aux += str(self.denominatorUnits[0])
-            else:
-                denList = list(map(str, self.denominatorUnits))
-                aux += "(" + "*".join(denList) + ")"
-        return aux
+        if self._str is None:
+            self._str = fractionToString(self._numerator, self._denominator)
+        return self._str
 
+    def __reduce__(self):
+        return _restoreFraction, (self.__class__, tuple(self._numerator), tuple(self._denominator))
 
+
+    @property
+    def canonicalKey(self) -> tuple:
+        return self._key
     @property
     def numeratorUnits(self) -> List[Unit]:
         return list(self._numerator)
@@ -391,19 +521,19 @@ class UnitsFraction(RepresentableUnit):
 
 
     def hasSameUnit(self, other) -> bool:
+        if other is self:
+            return True
         if not isinstance(other, Representable):
             return super().hasSameUnit(other)
-        otherNum = other.numeratorUnits
-        otherDen = other.denominatorUnits
-        return Counter(self.numeratorUnits) == Counter(otherNum) and Counter(self.denominatorUnits) == Counter(otherDen)
+        return self._key == unitKey(other)
 
 
     def __eq__(self, other) -> bool:
-        if not isinstance(other, RepresentableUnit):
+        if other is self:
+            return True
+        if not typeKind(other) & KIND_UNIT:
             return super().__eq__(other)
-        otherNum = other.numeratorUnits
-        otherDen = other.denominatorUnits
-        return self.numeratorUnits == otherNum and self.denominatorUnits == otherDen
+        return self._key == other.canonicalKey
 
 
     def unitInNumerator(self, unit: Unit) -> Optional[Unit]:
@@ -420,19 +550,89 @@ class UnitsFraction(RepresentableUnit):
 
 
     def __pow__(self, other: Number_t) -> RepresentableUnit:
-        if isinstance(other, Number):
-            numerator = list()
-            denominator = list()
-            for num in self.numeratorUnits:
-                numerator.append(num**other)
-            for den in self.denominatorUnits:
-                denominator.append(den**other)
-            return UnitsFraction(numerator, divide=False) / UnitsFraction(denominator, divide=False)
+        if typeKind(other) & KIND_NUMBER:
+            key = ("**", type(self), str(self), type(other), other)
+            return unitAlgebraCache.get(key, lambda: self._pow(other))
         return super().__pow__(other)
 
+    def _pow(self, other: Number_t) -> RepresentableUnit:
+        if other == 0:
+            return 1
+        result = None
+        for num in self.numeratorUnits:
+            result = UnitsFraction(result, num**other, divide=False)
+        for den in self.denominatorUnits:
+            result = UnitsFraction(result, den**other, divide=True)
+        return result
+
+
+# Pickle support: the constructors have keyword-only or required arguments
+# that the default protocol can't supply, and UnitsFraction must come back
+# with its units in the same order, without simplifying again.
+
+def _restoreUnit(cls: type, unit: str, defaultPrefix: str, power: Number_t) -> Unit:
+    return Unit.__new__(cls, unit, defaultPrefix, power=power)
+
+def _restoreFraction(cls: type, numerator: Tuple[Unit, ...], denominator: Tuple[Unit, ...]) -> UnitsFraction:
+    self = object.__new__(cls)
+    self._numerator = list(numerator)
+    self._denominator = list(denominator)
+    self._str = None
+    self._key = fractionKey(self._numerator, self._denominator)
+    self._hash = None
+    return self
+
+def _restoreValueUnits(cls: type, value: Number_t, unit: RepresentableUnit, exp10: int) -> ValueUnits:
+    if cls is ValueUnits:
+        # keep the mode it was saved with, whatever the current default is
+        return ValueUnits.__new__(cls, value, unit, exp10, numeric="exact")
+    return ValueUnits.__new__(cls, value, unit, exp10)
+
+def fractionToString(numerator: List[Unit], denominator: List[Unit]) -> str:
+    aux = ""
+    if len(numerator) != 0:
+        aux = "*".join(map(str, numerator))
+    else:
+        aux = "1"
+    if len(denominator) != 0:
+        aux += "/"
+        if len(denominator) == 1:
+            aux += str(denominator[0])
+        else:
+            aux += "(" + "*".join(map(str, denominator)) + ")"
+    return aux
+
+# The powers of a symbol and prefix are merged first, so the entries are
+# sorted by symbol and prefix only and powers of different types are never
+# compared.
+_unitOrder = itemgetter(0, 1)
+
+def _mergedKey(units: List[Unit]) -> tuple:
+    if len(units) == 1:
+        unit = units[0]
+        return ((unit.unit, unit.defaultPrefix, unit.power),)
+    powers = dict()
+    for unit in units:
+        key = (unit.unit, unit.defaultPrefix)
+        power = powers.get(key)
+        powers[key] = unit.power if power is None else power + unit.power
+    return tuple(sorted([(symbol, prefix, power) for (symbol, prefix), power in powers.items()], key=_unitOrder))
+
+def fractionKey(numerator: List[Unit], denominator: List[Unit]) -> tuple:
+    return (_mergedKey(numerator), _mergedKey(denominator))
+
+def fractionHash(numerator: List[Unit], denominator: List[Unit]) -> int:
+    return hash(fractionKey(numerator, denominator))
+
+def unitKey(other: Representable) -> tuple:
+    if typeKind(other) & KIND_UNIT:
+        return other.canonicalKey
+    return fractionKey(other.numeratorUnits, other.denominatorUnits)
 
 
 class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, SupportsComplex):
+    __slots__ = ()
+
     @property
     @abstractmethod
     def value(self) -> Number_t:
@@ -445,6 +645,9 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
     @abstractmethod
     def exp10(self) -> int:
         raise NotImplementedError()
+    @property
+    def magnitude(self) -> Number_t:
+        return self.value*SIPrefixes.pow10(self.exp10)
 
 
     @abstractmethod
@@ -485,21 +688,21 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
 
     @abstractmethod
     def __lt__(self, other) -> bool:
-        if not isinstance(other, RepresentableValueUnit):
+        if not typeKind(other) & KIND_VALUE:
             return NotImplemented
         return False
     @abstractmethod
     def __gt__(self, other) -> bool:
-        if not isinstance(other, RepresentableValueUnit):
+        if not typeKind(other) & KIND_VALUE:
             return NotImplemented
         return False
 
     def __le__(self, other) -> bool:
-        if not isinstance(other, RepresentableValueUnit):
+        if not typeKind(other) & KIND_VALUE:
             return NotImplemented
         return not self.__gt__(other)
     def __ge__(self, other) -> bool:
-        if not isinstance(other, RepresentableValueUnit):
+        if not typeKind(other) & KIND_VALUE:
             return NotImplemented
         return not self.__lt__(other)
 
@@ -524,14 +727,14 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
 
     @abstractmethod
     def __mul__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Number):
+        if typeKind(other) & KIND_NUMBER:
             value = self.value * other
             return ValueUnits(value, self.unit, self.exp10)
         return super().__mul__(other)
 
     @abstractmethod
     def __rmul__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Number):
+        if typeKind(other) & KIND_NUMBER:
             value = other * self.value
             return ValueUnits(value, self.unit, self.exp10)
         return super().__rmul__(other)
@@ -539,14 +742,14 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
 
     @abstractmethod
     def __truediv__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Number):
+        if typeKind(other) & KIND_NUMBER:
             value = self.value / other
             return ValueUnits(value, self.unit, self.exp10)
         return super().__truediv__(other)
 
     @abstractmethod
     def __rtruediv__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Number):
+        if typeKind(other) & KIND_NUMBER:
             value = other / self.value
             unit = None / self.unit
             exp10 = 0 - self.exp10
@@ -556,14 +759,14 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
 
     @abstractmethod
     def __floordiv__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Real):
+        if typeKind(other) & KIND_REAL:
             value = self.value // other
             return ValueUnits(value, self.unit, self.exp10)
         return super().__floordiv__(other)
 
     @abstractmethod
     def __rfloordiv__(self, other: Union[RepresentableValueUnit, Number_t]) -> Union[RepresentableValueUnit, Number_t]:
-        if isinstance(other, Real):
+        if typeKind(other) & KIND_REAL:
             value = other // self.value
             unit = None // self.unit
             exp10 = 0 - self.exp10
@@ -577,49 +780,87 @@ class RepresentableValueUnit(Representable, SupportsInt, SupportsFloat, Supports
 
 
 
+def _scaled(value: Number_t, unit, exp10: int) -> Union[ValueUnits, Number_t]:
+    # Dimension algebra returns the power of ten left by the scales when every
+    # exponent cancels (1e3*m / m -> 1000): the result is that plain number,
+    # as a cancelled UnitsFraction gives 1.
+    if typeKind(unit) & KIND_NUMBER and unit != 1:
+        return value*unit*SIPrefixes.pow10(exp10)
+    return ValueUnits(value, unit, exp10, numeric="exact")
+
+
 class ValueUnits(RepresentableValueUnit):
+    __slots__ = ("_value", "_unit", "_exp10", "_magnitude", "_str", "_hash")
 
     # attributes:
     # self._value: Number_t
     # self._unit: RepresentableUnit
     # self._exp10: int
+    # self._magnitude: Optional[Number_t]
+    # self._str: Optional[str]
+    # self._hash: Optional[int]
 
     # inmutable
 
-    def __new__(cls, value: Number_t, unit: RepresentableUnit, exp10: int=0):
+    def __new__(cls, value: Number_t, unit: RepresentableUnit, exp10: int=0, *, numeric: Optional[str]=None):
+        if cls is ValueUnits:
+            if numeric is None:
+                numeric = _numericMode
+            if numeric != "exact":
+                cls = _numericClass(numeric)
+        elif numeric is not None and _numericClass(numeric) is not cls:
+            raise ValueError(f"{cls.__name__} can not be built in {numeric!r} mode.")
         self = super(ValueUnits, cls).__new__(cls)
 
-        if not isinstance(value, Number):
+        if not typeKind(value) & KIND_NUMBER:
             raise TypeError("Parameter `value` must be a Number, not an " + type(value).__name__ + ".")
         if not isinstance(exp10, int):
             raise TypeError("Parameter `exp10` must be an int, not an " + type(exp10).__name__ + ".")
 
-        if not isinstance(unit, RepresentableUnit):
-            if (isinstance(unit, Number) and unit == 1) or unit is None:
-                return value*(10**exp10)
+        unitKind = typeKind(unit)
+        if not unitKind & KIND_UNIT:
+            if (unitKind & KIND_NUMBER and unit == 1) or unit is None:
+                return value*SIPrefixes.pow10(exp10)
             else:
                 raise TypeError("Parameter `unit` must be an unit type, not an " + type(unit).__name__ + ".")
 
+        if cls is FloatValueUnits:
+            value = _toDouble(value*SIPrefixes.pow10(exp10))
+            exp10 = 0
+
         self._value = value
         self._unit = unit
         self._exp10 = exp10
+        self._magnitude = None
+        self._str = None
+        self._hash = None
 
         return self
 
-    def __init__(self, value: Number_t, unit: RepresentableUnit, exp10: int=0):
+    def __init__(self, value: Number_t, unit: RepresentableUnit, exp10: int=0, *, numeric: Optional[str]=None):
         self._value: Number_t = self.value
         self._unit: RepresentableUnit = self.unit
         self._exp10: int = self.exp10
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        # Equal quantities may use different exp10, or a Dimension and the
+        # units it stands for, so only the normalized magnitude takes part
+        # in the hash.
+        if self._hash is None:
+            self._hash = hash(self.magnitude)
+        return self._hash
 
     def __str__(self) -> str:
-        result = str(self.value)
-        if self.exp10 != 0:
-            result += "e"+str(self.exp10)
-        result += " ["+str(self.unit)+"]"
-        return result
+        if self._str is None:
+            result = str(self.value)
+            if self.exp10 != 0:
+                result += "e"+str(self.exp10)
+            result += " ["+str(self.unit)+"]"
+            self._str = result
+        return self._str
+
+    def __reduce__(self):
+        return _restoreValueUnits, (self.__class__, self._value, self._unit, self._exp10)
 
 
     @property
@@ -637,189 +878,408 @@ class ValueUnits(RepresentableValueUnit):
     @property
     def exp10(self) -> int:
         return self._exp10
+    @property
+    def magnitude(self) -> Number_t:
+        if self._magnitude is None:
+            self._magnitude = self._value*SIPrefixes.pow10(self._exp10)
+        return self._magnitude
+
+
+    @property
+    def numeric(self) -> str:
+        return "exact"
+
+    def toFloat(self) -> FloatValueUnits:
+        return FloatValueUnits(self.value, self.unit, self.exp10)
+    def toExact(self) -> ValueUnits:
+        return self
 
 
     def hasSameUnit(self, other: Representable) -> bool:
-        if isinstance(other, RepresentableUnit):
+        kind = typeKind(other)
+        if kind & KIND_UNIT:
             return self.unit.hasSameUnit(other)
-        if isinstance(other, RepresentableValueUnit):
+        if kind & KIND_VALUE:
             return self.unit.hasSameUnit(other.unit)
         return super().hasSameUnit(other)
 
 
     def __neg__(self) -> RepresentableValueUnit:
-        return ValueUnits(-self.value, self.unit, self.exp10)
+        return ValueUnits(-self.value, self.unit, self.exp10, numeric="exact")
     def __pos__(self) -> RepresentableValueUnit:
-        return ValueUnits(self.value, self.unit, self.exp10)
+        return ValueUnits(self.value, self.unit, self.exp10, numeric="exact")
     def __abs__(self) -> RepresentableValueUnit:
-        return ValueUnits(abs(self.value), self.unit, self.exp10)
+        return ValueUnits(abs(self.value), self.unit, self.exp10, numeric="exact")
 
 
     def __int__(self) -> int:
-        return int(self.value*(10**self.exp10))
+        return int(self.magnitude)
     def __float__(self) -> float:
-        return float(self.value*(10**self.exp10))
+        return float(self.magnitude)
     def __complex__(self) -> complex:
-        return complex(self.value*(10**self.exp10))
+        return complex(self.magnitude)
 
 
     def __round__(self, ndigits: int=0) -> RepresentableValueUnit:
-        if isinstance(self.value, Real):
-            return ValueUnits(round(self.value, ndigits), self.unit, self.exp10)
+        if typeKind(self.value) & KIND_REAL:
+            return ValueUnits(round(self.value, ndigits), self.unit, self.exp10, numeric="exact")
         return super().__round__(ndigits)
     def __trunc__(self) -> RepresentableValueUnit:
-        if isinstance(self.value, Real):
-            return ValueUnits(trunc(self.value), self.unit, self.exp10)
+        if typeKind(self.value) & KIND_REAL:
+            return ValueUnits(trunc(self.value), self.unit, self.exp10, numeric="exact")
         return super().__trunc__()
     def __floor__(self) -> RepresentableValueUnit:
-        if isinstance(self.value, Real):
-            return ValueUnits(floor(self.value), self.unit, self.exp10)
+        if typeKind(self.value) & KIND_REAL:
+            return ValueUnits(floor(self.value), self.unit, self.exp10, numeric="exact")
         return super().__floor__()
     def __ceil__(self) -> RepresentableValueUnit:
-        if isinstance(self.value, Real):
-            return ValueUnits(ceil(self.value), self.unit, self.exp10)
+        if typeKind(self.value) & KIND_REAL:
+            return ValueUnits(ceil(self.value), self.unit, self.exp10, numeric="exact")
         return super().__ceil__()
 
 
     def __eq__(self, other) -> bool:
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
-                if self.value*(10**self.exp10) == other.value*(10**other.exp10):
+                if self.magnitude == other.magnitude:
                     return True
+        elif not typeKind(other) & (KIND_NUMBER | KIND_UNIT | KIND_NONE):
+            # lets the other type compare, e.g. QuantityArray elementwise
+            return NotImplemented
         return super().__eq__(other)
     def __lt__(self, other) -> bool:
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
-                if self.value*(10**self.exp10) < other.value*(10**other.exp10):
+                if self.magnitude < other.magnitude:
                     return True
         return super().__lt__(other)
     def __gt__(self, other) -> bool:
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
-                if self.value*(10**self.exp10) > other.value*(10**other.exp10):
+                if self.magnitude > other.magnitude:
                     return True
         return super().__gt__(other)
 
 
     def __add__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
                 unit = self.unit
                 exp10 = self.exp10
                 if self.exp10 == other.exp10:
                     value = self.value + other.value
                 else:
-                    value = self.value + other.value*10**(other.exp10-self.exp10)
-                return ValueUnits(value, unit, exp10)
+                    value = self.value + other.value*SIPrefixes.pow10(other.exp10-self.exp10)
+                return ValueUnits(value, unit, exp10, numeric="exact")
         return super().__add__(other)
 
     def __radd__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
                 unit = self.unit
                 exp10 = self.exp10
                 if self.exp10 == other.exp10:
                     value = self.value + other.value
                 else:
-                    value = self.value + other.value*10**(other.exp10-self.exp10)
-                return ValueUnits(value, unit, exp10)
+                    value = self.value + other.value*SIPrefixes.pow10(other.exp10-self.exp10)
+                return ValueUnits(value, unit, exp10, numeric="exact")
         return super().__radd__(other)
 
 
     def __sub__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
                 unit = self.unit
                 exp10 = self.exp10
                 if self.exp10 == other.exp10:
                     value = self.value - other.value
                 else:
-                    value = self.value - other.value*10**(other.exp10-self.exp10)
-                return ValueUnits(value, unit, exp10)
+                    value = self.value - other.value*SIPrefixes.pow10(other.exp10-self.exp10)
+                return ValueUnits(value, unit, exp10, numeric="exact")
         return super().__sub__(other)
 
     def __rsub__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        if typeKind(other) & KIND_VALUE:
             if self.hasSameUnit(other):
                 unit = self.unit
                 exp10 = self.exp10
                 if self.exp10 == other.exp10:
                     value = other.value - self.value
                 else:
-                    value = other.value*10**(other.exp10-self.exp10) - self.value
-                return ValueUnits(value, unit, exp10)
+                    value = other.value*SIPrefixes.pow10(other.exp10-self.exp10) - self.value
+                return ValueUnits(value, unit, exp10, numeric="exact")
         return super().__rsub__(other)
 
 
     def __mul__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = self.value * other.value
             unit = self.unit * other.unit
             exp10 = self.exp10 + other.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_NUMBER:
+            return ValueUnits(self.value * other, self.unit, self.exp10, numeric="exact")
         return super().__mul__(other)
 
     def __rmul__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = self.value * other.value
             unit = self.unit * other.unit
             exp10 = self.exp10 + other.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_NUMBER:
+            return ValueUnits(other * self.value, self.unit, self.exp10, numeric="exact")
         return super().__rmul__(other)
 
 
     def __truediv__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = self.value / other.value
             unit = self.unit / other.unit
             exp10 = self.exp10 - other.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_NUMBER:
+            return ValueUnits(self.value / other, self.unit, self.exp10, numeric="exact")
         return super().__truediv__(other)
 
     def __rtruediv__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = other.value / self.value
             unit = other.unit / self.unit
             exp10 = other.exp10 - self.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_NUMBER:
+            return ValueUnits(other / self.value, None / self.unit, 0 - self.exp10, numeric="exact")
         return super().__rtruediv__(other)
 
 
     def __floordiv__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = self.value // other.value
             unit = self.unit // other.unit
             exp10 = self.exp10 - other.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_REAL:
+            return ValueUnits(self.value // other, self.unit, self.exp10, numeric="exact")
         return super().__floordiv__(other)
 
     def __rfloordiv__(self, other):
-        if isinstance(other, RepresentableValueUnit):
+        kind = typeKind(other)
+        if kind & KIND_VALUE:
             value = other.value // self.value
             unit = other.unit // self.unit
             exp10 = other.exp10 - self.exp10
-            return ValueUnits(value, unit, exp10)
+            return _scaled(value, unit, exp10)
+        if kind & KIND_REAL:
+            return ValueUnits(other // self.value, None // self.unit, 0 - self.exp10, numeric="exact")
         return super().__rfloordiv__(other)
 
 
     def __pow__(self, other: Number_t):
-        if isinstance(other, Number):
+        kind = typeKind(other)
+        if kind & KIND_NUMBER:
             unit = self.unit ** other
-            if isinstance(other, (Integral, int)):
+            if kind & KIND_INTEGRAL:
                 value = self.value ** other
                 exp = self.exp10*other
             else:
-                value = (self.value*(10**self.exp10)) ** other
+                value = self.magnitude ** other
                 exp = 0
-            return ValueUnits(value, unit, exp)
+            return ValueUnits(value, unit, exp, numeric="exact")
         return super().__pow__(other)
 
 
     def __mod__(self, other):
-        if isinstance(other, Number):
-            value = (self.value*(10**self.exp10)) % other
+        if typeKind(other) & KIND_NUMBER:
+            value = self.magnitude % other
             unit = self.unit
             exp = 0
-            return ValueUnits(value, unit, exp)
+            return ValueUnits(value, unit, exp, numeric="exact")
         return super().__mod__(other)
 
+
+# Numeric backends of ValueUnits:
+# "exact" keeps the value and exp10 apart and accepts any Number, so ints
+#   and Fractions stay exact.
+# "float" folds exp10 into the value on construction and keeps a single
+#   double (or complex of doubles), so arithmetic never rescales.
+# Quantities of different modes do not mix in arithmetic; use toFloat()
+# and toExact() to convert.
+numericModes = ("exact", "float")
+_numericMode: str = "exact"
+
+def getNumericMode() -> str:
+    return _numericMode
+
+def setNumericMode(mode: str) -> str:
+    # Mode used by ValueUnits(...) when `numeric` is not given. Returns the
+    # previous mode.
+    global _numericMode
+    _numericClass(mode)
+    previous = _numericMode
+    _numericMode = mode
+    return previous
+
+def _numericClass(mode: str) -> type:
+    if mode == "exact":
+        return ValueUnits
+    if mode == "float":
+        return FloatValueUnits
+    raise ValueError(f"Unknown numeric mode: {mode!r}. Expected one of {numericModes}.")
+
+def _toDouble(value: Number_t) -> Union[float, complex]:
+    if typeKind(value) & KIND_REAL:
+        return float(value)
+    return complex(value)
+
+
+class FloatValueUnits(ValueUnits):
+    __slots__ = ()
+
+    # exp10 is always 0 and value is a float or a complex.
+
+    # inmutable
+
+    @property
+    def numeric(self) -> str:
+        return "float"
+    @property
+    def magnitude(self) -> Number_t:
+        return self._value
+
+    def toFloat(self) -> FloatValueUnits:
+        return self
+    def toExact(self) -> ValueUnits:
+        return ValueUnits(self.value, self.unit, 0, numeric="exact")
+
+
+    def _float(self, value: Number_t, unit) -> Union[FloatValueUnits, Number_t]:
+        # builds a result without the checks of __new__; the value is
+        # already a double and the unit comes from unit algebra.
+        kind = typeKind(unit)
+        if not kind & KIND_UNIT:
+            if kind & KIND_NUMBER and unit != 1:
+                # a Dimension scale, see _scaled
+                return _toDouble(value*unit)
+            return FloatValueUnits(value, unit)
+        result = object.__new__(FloatValueUnits)
+        result._value = value
+        result._unit = unit
+        result._exp10 = 0
+        result._magnitude = None
+        result._str = None
+        result._hash = None
+        return result
+
+    def _operand(self, other) -> int:
+        kind = typeKind(other)
+        if kind & KIND_VALUE and type(other) is not FloatValueUnits:
+            raise TypeError("Can not mix quantities in 'exact' and 'float' modes; convert them with toFloat() or toExact().")
+        return kind
+
+
+    def __neg__(self) -> FloatValueUnits:
+        return self._float(-self._value, self._unit)
+    def __pos__(self) -> FloatValueUnits:
+        return self
+    def __abs__(self) -> FloatValueUnits:
+        return self._float(abs(self._value), self._unit)
+
+
+    def __round__(self, ndigits: int=0) -> FloatValueUnits:
+        if typeKind(self._value) & KIND_REAL:
+            return FloatValueUnits(round(self._value, ndigits), self._unit)
+        return super(ValueUnits, self).__round__(ndigits)
+    def __trunc__(self) -> FloatValueUnits:
+        if typeKind(self._value) & KIND_REAL:
+            return FloatValueUnits(trunc(self._value), self._unit)
+        return super(ValueUnits, self).__trunc__()
+    def __floor__(self) -> FloatValueUnits:
+        if typeKind(self._value) & KIND_REAL:
+            return FloatValueUnits(floor(self._value), self._unit)
+        return super(ValueUnits, self).__floor__()
+    def __ceil__(self) -> FloatValueUnits:
+        if typeKind(self._value) & KIND_REAL:
+            return FloatValueUnits(ceil(self._value), self._unit)
+        return super(ValueUnits, self).__ceil__()
+
+
+    def __add__(self, other):
+        if self._operand(other) & KIND_VALUE and self.hasSameUnit(other):
+            return self._float(self._value + other._value, self._unit)
+        return NotImplemented
+    def __radd__(self, other):
+        if self._operand(other) & KIND_VALUE and self.hasSameUnit(other):
+            return self._float(other._value + self._value, self._unit)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if self._operand(other) & KIND_VALUE and self.hasSameUnit(other):
+            return self._float(self._value - other._value, self._unit)
+        return NotImplemented
+    def __rsub__(self, other):
+        if self._operand(other) & KIND_VALUE and self.hasSameUnit(other):
+            return self._float(other._value - self._value, self._unit)
+        return NotImplemented
+
+
+    def __mul__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(self._value * other._value, self._unit * other._unit)
+        if kind & KIND_NUMBER:
+            return self._float(_toDouble(self._value * other), self._unit)
+        return NotImplemented
+    def __rmul__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(other._value * self._value, other._unit * self._unit)
+        if kind & KIND_NUMBER:
+            return self._float(_toDouble(other * self._value), self._unit)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(self._value / other._value, self._unit / other._unit)
+        if kind & KIND_NUMBER:
+            return self._float(_toDouble(self._value / other), self._unit)
+        return NotImplemented
+    def __rtruediv__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(other._value / self._value, other._unit / self._unit)
+        if kind & KIND_NUMBER:
+            return self._float(_toDouble(other / self._value), None / self._unit)
+        return NotImplemented
+
+    def __floordiv__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(self._value // other._value, self._unit // other._unit)
+        if kind & KIND_REAL:
+            return self._float(_toDouble(self._value // other), self._unit)
+        return NotImplemented
+    def __rfloordiv__(self, other):
+        kind = self._operand(other)
+        if kind & KIND_VALUE:
+            return self._float(other._value // self._value, other._unit // self._unit)
+        if kind & KIND_REAL:
+            return self._float(_toDouble(other // self._value), None // self._unit)
+        return NotImplemented
+
+
+    def __pow__(self, other: Number_t):
+        if typeKind(other) & KIND_NUMBER:
+            return self._float(_toDouble(self._value ** other), self._unit ** other)
+        return NotImplemented
+
+    def __mod__(self, other):
+        if typeKind(other) & KIND_NUMBER:
+            return self._float(_toDouble(self._value % other), self._unit)
+        return NotImplemented
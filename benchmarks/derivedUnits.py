@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+import timeit
+
+from PyUnits.quantities import SIUnits, SIDerivedUnits
+
+
+# The formulas SIDerivedUnits used before the per-power unit templates:
+# every call chains several ValueUnits operations.
+
+def _hertz(value):
+    return value/SIUnits.secondUnit(1)
+def _newton(value):
+    result = SIUnits.kilogramUnit(value) * SIUnits.meterUnit(1)
+    result /= SIUnits.secondUnit(1, power=2)
+    return result
+def _pascal(value):
+    result = SIUnits.kilogramUnit(value) / SIUnits.meterUnit(1)
+    result /= SIUnits.secondUnit(1, power=2)
+    return result
+def _joule(value):
+    result = SIUnits.kilogramUnit(value) * SIUnits.meterUnit(1, power=2)
+    result /= SIUnits.secondUnit(1, power=2)
+    return result
+def _watt(value):
+    result = SIUnits.kilogramUnit(value) * SIUnits.meterUnit(1, power=2)
+    result /= SIUnits.secondUnit(1, power=3)
+    return result
+def _coulomb(value):
+    return SIUnits.secondUnit(value) * SIUnits.ampereUnit(1)
+def _volt(value):
+    result = SIUnits.kilogramUnit(value) * SIUnits.meterUnit(1, power=2)
+    result /= SIUnits.secondUnit(1, power=3) * SIUnits.ampereUnit(1)
+    return result
+def _farad(value):
+    return _coulomb(value) / _volt(1)
+def _ohm(value):
+    return _volt(value) / SIUnits.ampereUnit(1)
+def _siemens(value):
+    return value / _ohm(1)
+def _weber(value):
+    return _joule(value) / SIUnits.ampereUnit(1)
+def _tesla(value):
+    result = SIUnits.kilogramUnit(value) / SIUnits.ampereUnit(1)
+    result /= SIUnits.secondUnit(1, power=2)
+    return result
+def _henry(value):
+    result = _volt(value) * SIUnits.secondUnit(1)
+    result /= SIUnits.ampereUnit(1)
+    return result
+
+chainedFactories = {
+    "hertz": _hertz, "newton": _newton, "pascal": _pascal, "joule": _joule,
+    "watt": _watt, "coulomb": _coulomb, "volt": _volt, "farad": _farad,
+    "ohm": _ohm, "siemens": _siemens, "weber": _weber, "tesla": _tesla,
+    "henry": _henry,
+}
+
+
+def bestOf(func, number: int, repeat: int) -> float:
+    return min(timeit.repeat(lambda: func(3.5), number=number, repeat=repeat)) / number
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SIDerivedUnits factories against the chained formulas.")
+    parser.add_argument("-n", "--number", type=int, default=2000)
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'factory':<10} {'chained':>12} {'template':>12} {'speedup':>8}")
+    for name, chained in chainedFactories.items():
+        factory = getattr(SIDerivedUnits, name + "Unit")
+        if str(factory(3.5)) != str(chained(3.5)):
+            raise AssertionError(f"{name}: {factory(3.5)} != {chained(3.5)}")
+        old = bestOf(chained, args.number, args.repeat)
+        new = bestOf(factory, args.number, args.repeat)
+        print(f"{name:<10} {old*1e6:>10.2f}us {new*1e6:>10.2f}us {old/new:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
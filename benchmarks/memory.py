@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Units import ValueUnits
+
+
+class _DictValueUnits:
+
+    # ValueUnits without __slots__: the same attributes, kept in a __dict__.
+    # An unslotted subclass of ValueUnits would still store them in the
+    # inherited slots, so it can't stand in for the old layout.
+
+    def __init__(self, value, unit, exp10: int=0):
+        self._value = value
+        self._unit = unit
+        self._exp10 = exp10
+        self._magnitude = None
+        self._str = None
+        self._hash = None
+
+
+def bytesPerInstance(cls: type, count: int) -> float:
+    unit = SIUnits.meterUnit(1).unit
+    values = [float(i) for i in range(count)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    readings = [cls(value, unit, 3) for value in values]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The list holding the readings is not part of the per-instance cost.
+    listSize = sys.getsizeof(readings)
+    return (after - before - listSize) / count
+
+def bytesPerValueUnits(count: int) -> float:
+    return bytesPerInstance(ValueUnits, count)
+
+def bytesPerDictValueUnits(count: int) -> float:
+    return bytesPerInstance(_DictValueUnits, count)
+
+def bytesPerFloat(count: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    values = [float(i) + 0.5 for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before - sys.getsizeof(values)) / count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Memory used per ValueUnits instance.")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    perValue = bytesPerValueUnits(args.count)
+    perDict = bytesPerDictValueUnits(args.count)
+    perFloat = bytesPerFloat(args.count)
+    sample = ValueUnits(1.0, SIUnits.meterUnit(1).unit, 3)
+    print(f"instances:              {args.count}")
+    print(f"has __dict__:           {hasattr(sample, '__dict__')}")
+    print(f"bytes per ValueUnits:   {perValue:.1f}")
+    print(f"bytes with a __dict__:  {perDict:.1f}")
+    print(f"saved by __slots__:     {perDict - perValue:.1f}")
+    print(f"bytes per raw float:    {perFloat:.1f}")
+    print(f"overhead vs raw float:  {perValue / perFloat:.2f}x")
+
+if __name__ == "__main__":
+    main()
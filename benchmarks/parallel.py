@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import argparse
+import os
+import time
+
+from PyUnits.quantities import SIDerivedUnits
+from PyUnits.unitRepresentation.Parallel import parallelMap
+
+
+# Speedup of parallelMap over a single in-process worker, for
+# dissipatedPower over 200000 voltages (python -m benchmarks.parallel):
+#
+#   workers   seconds   speedup
+#         1     2.65      1.00x
+#         2     2.80      0.95x
+#         4     3.28      0.81x
+#
+# Measured on a 1-core container, so this curve shows only the pool
+# overhead (worker start-up and shipping the packed chunks). Rerun the
+# benchmark on the target machine to get its real curve.
+
+_load = SIDerivedUnits.ohmUnit(50)
+
+def dissipatedPower(voltage):
+    return voltage * voltage / _load
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Speedup curve of parallelMap against the number of workers.")
+    parser.add_argument("-n", "--count", type=int, default=200_000)
+    parser.add_argument("-w", "--max-workers", type=int, default=max(os.cpu_count() or 1, 4))
+    args = parser.parse_args(argv)
+
+    voltages = [SIDerivedUnits.voltUnit(i * 0.001) for i in range(args.count)]
+    expected = None
+    base = None
+    print(f"{'workers':>8} {'seconds':>9} {'speedup':>9}")
+    workers = 1
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        results = parallelMap(dissipatedPower, voltages, workers=workers)
+        elapsed = time.perf_counter() - start
+        if expected is None:
+            expected = results
+            base = elapsed
+        elif list(map(str, results)) != list(map(str, expected)):
+            raise AssertionError(f"{workers} workers returned different results.")
+        print(f"{workers:>8} {elapsed:>9.2f} {base/elapsed:>8.2f}x")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import argparse
+import pickle
+import time
+
+from PyUnits.quantities import SIUnits, SIDerivedUnits
+from PyUnits.unitRepresentation import Serialization
+
+
+def makeQuantities(count: int, units: int):
+    # `units` distinct units, interleaved in runs of 1000 quantities
+    factories = [SIUnits.meterUnit, SIUnits.secondUnit, SIDerivedUnits.newtonUnit, SIDerivedUnits.voltUnit]
+    result = list()
+    for i in range(count):
+        factory = factories[(i // 1000) % min(units, len(factories))]
+        result.append(factory(i * 0.5))
+    return result
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def pickleList(quantities):
+    data, dumpTime = timed(lambda: pickle.dumps(quantities, protocol=5))
+    _, loadTime = timed(lambda: pickle.loads(data))
+    return len(data), dumpTime, loadTime
+
+def packedBytes(quantities):
+    data, dumpTime = timed(lambda: Serialization.dumps(quantities))
+    _, loadTime = timed(lambda: Serialization.loads(data))
+    return len(data), dumpTime, loadTime
+
+def packedOutOfBand(quantities):
+    buffers = list()
+    def dump():
+        packed = Serialization.packQuantities(quantities)
+        return pickle.dumps(packed, protocol=5, buffer_callback=buffers.append)
+    data, dumpTime = timed(dump)
+    size = len(data) + sum(len(buffer.raw()) for buffer in buffers)
+    _, loadTime = timed(lambda: pickle.loads(data, buffers=buffers).unpack())
+    return size, dumpTime, loadTime
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bytes and time per million quantities for each serialization.")
+    parser.add_argument("-n", "--count", type=int, default=1_000_000)
+    parser.add_argument("-u", "--units", type=int, default=4, help="distinct units in the data (1-4)")
+    args = parser.parse_args(argv)
+
+    quantities = makeQuantities(args.count, args.units)
+    scale = 1_000_000 / args.count
+    print(f"{args.count} quantities, {args.units} units; figures per million quantities")
+    print(f"{'format':<28} {'MB':>8} {'B/qty':>7} {'dump s':>8} {'load s':>8}")
+    for name, func in (("pickle list (protocol 5)", pickleList),
+                       ("packed bytes", packedBytes),
+                       ("packed, out-of-band pickle", packedOutOfBand)):
+        size, dumpTime, loadTime = func(quantities)
+        print(f"{name:<28} {size*scale/1e6:>8.2f} {size/args.count:>7.1f} {dumpTime*scale:>8.3f} {loadTime*scale:>8.3f}")
+
+if __name__ == "__main__":
+    main()
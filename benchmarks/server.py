@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import time
+
+from PyUnits.unitRepresentation.Server import ConversionServer, percentile
+
+
+# Load test for the conversion server (python -m benchmarks.server). Without
+# --port or --unix the server runs in-process on an ephemeral port.
+
+_requests = (
+    {"op": "convert", "from": "ft", "to": "m"},
+    {"op": "convert", "from": "mi", "to": "km"},
+    {"op": "convert", "from": "°F", "to": "°C"},
+    {"op": "convert", "from": "lb", "to": "kg"},
+    {"op": "convert", "from": "km/h", "to": "m/s"},
+    {"op": "check", "from": "kg*m/(s^2)", "to": "N"},
+    {"op": "parse", "quantity": "3e2 [km/h]", "to": "m/s"},
+)
+
+def makeRequest(index: int, rng: random.Random) -> bytes:
+    request = dict(rng.choice(_requests), id=index)
+    if request["op"] == "convert":
+        request["value"] = rng.uniform(-100, 100)
+    return json.dumps(request).encode("utf-8") + b"\n"
+
+
+async def client(open_, count: int, inflight: int, seed: int, latencies: list):
+    reader, writer = await open_()
+    rng = random.Random(seed)
+    sent = dict()
+    window = asyncio.Semaphore(inflight)
+
+    async def receive():
+        for _ in range(count):
+            response = json.loads(await reader.readline())
+            latencies.append(time.perf_counter() - sent.pop(response["id"]))
+            if "error" in response:
+                raise RuntimeError(response["error"])
+            window.release()
+
+    receiver = asyncio.get_running_loop().create_task(receive())
+    for index in range(count):
+        await window.acquire()
+        sent[index] = time.perf_counter()
+        writer.write(makeRequest(index, rng))
+        await writer.drain()
+    await receiver
+    writer.close()
+
+
+async def run(args):
+    server = None
+    if args.port is None and args.unix is None:
+        server = await ConversionServer(window=args.window, maxBatch=args.max_batch).start()
+        host, port = server.sockets[0].getsockname()[:2]
+    else:
+        host, port = args.host, args.port
+    if args.unix is not None:
+        open_ = lambda: asyncio.open_unix_connection(args.unix)
+    else:
+        open_ = lambda: asyncio.open_connection(host, port)
+
+    latencies = list()
+    start = time.perf_counter()
+    await asyncio.gather(*(client(open_, args.count, args.inflight, seed, latencies) for seed in range(args.clients)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    total = args.clients * args.count
+    print(f"{total} requests from {args.clients} clients ({args.inflight} in flight each) in {elapsed:.2f} s")
+    print(f"throughput {total/elapsed:,.0f} req/s")
+    print("client latency ms: " + "  ".join(f"p{int(q*100)} {percentile(latencies, q)*1e3:.2f}" for q in (0.5, 0.9, 0.99)))
+
+    reader, writer = await open_()
+    writer.write(b'{"op": "stats"}\n')
+    stats = json.loads(await reader.readline())
+    writer.close()
+    print(f"server: {stats['batches']} batches, {stats['meanBatch']:.1f} requests per batch, "
+          f"p50 {stats['p50Ms']:.2f} ms, p99 {stats['p99Ms']:.2f} ms")
+    if server is not None:
+        await server.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Throughput and latency of the unit conversion server.")
+    parser.add_argument("-c", "--clients", type=int, default=16)
+    parser.add_argument("-n", "--count", type=int, default=2000, help="requests per client")
+    parser.add_argument("-i", "--inflight", type=int, default=32, help="pipelined requests per client")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, help="connect to a running server instead of starting one")
+    parser.add_argument("--unix", help="connect to a running server on this Unix socket")
+    parser.add_argument("--window", type=float, default=0.002, help="batching window of the in-process server")
+    parser.add_argument("--max-batch", type=int, default=1024)
+    args = parser.parse_args(argv)
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
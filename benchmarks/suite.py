@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from typing import Callable, Dict
+
+from PyUnits.quantities import BaseQuantities, SIUnits, SIDerivedUnits, ImperialUnits
+from PyUnits.unitRepresentation.Units import Unit, UnitsFraction, ValueUnits
+
+
+# name -> setup function; each setup returns the zero-argument callable
+# that gets timed, so building the operands is not part of the measurement.
+benchmarks: Dict[str, Callable[[], Callable[[], object]]] = dict()
+
+def benchmark(name: str):
+    def register(setup):
+        benchmarks[name] = setup
+        return setup
+    return register
+
+
+@benchmark("unit.construct")
+def _unitConstruct():
+    return lambda: Unit("m", power=2)
+
+@benchmark("unit.constructNew")
+def _unitConstructNew():
+    # a different power every call, so the interning table always misses
+    powers = iter(range(10**9))
+    return lambda: Unit("m", power=next(powers))
+
+@benchmark("fraction.short")
+def _fractionShort():
+    left = BaseQuantities.MassUnit() * BaseQuantities.LengthUnit()
+    right = BaseQuantities.TimeUnit(power=2)
+    return lambda: UnitsFraction(left, right, divide=True)
+
+@benchmark("fraction.long")
+def _fractionLong():
+    # every unit of `right` cancels or merges with one of `left`
+    classes = (BaseQuantities.MassUnit, BaseQuantities.LengthUnit, BaseQuantities.TimeUnit,
+               BaseQuantities.ElectricCurrentUnit, BaseQuantities.TemperatureUnit,
+               BaseQuantities.SubstanceUnit, BaseQuantities.LuminousIntensityUnit)
+    left = UnitsFraction([cls(power=2) for cls in classes[:4]], None, divide=False)
+    for cls in classes[4:]:
+        left = left / cls(power=3)
+    right = UnitsFraction([cls(power=1) for cls in classes[:4]], None, divide=False)
+    for cls in classes[4:]:
+        right = right / cls(power=1)
+    return lambda: UnitsFraction(left, right, divide=True)
+
+
+def _meters():
+    return SIUnits.meterUnit(3.5), SIUnits.meterUnit(2, prefix="c")
+
+@benchmark("value.add")
+def _valueAdd():
+    a, b = _meters()
+    return lambda: a + b
+
+@benchmark("value.sub")
+def _valueSub():
+    a, b = _meters()
+    return lambda: a - b
+
+@benchmark("value.mul")
+def _valueMul():
+    a, b = SIUnits.meterUnit(3.5), SIUnits.secondUnit(2)
+    return lambda: a * b
+
+@benchmark("value.div")
+def _valueDiv():
+    a, b = SIUnits.meterUnit(3.5), SIUnits.secondUnit(2)
+    return lambda: a / b
+
+@benchmark("value.mulNumber")
+def _valueMulNumber():
+    a = SIUnits.meterUnit(3.5)
+    return lambda: a * 2.0
+
+@benchmark("value.addFloat")
+def _valueAddFloat():
+    a, b = (value.toFloat() for value in _meters())
+    return lambda: a + b
+
+@benchmark("value.mulFloat")
+def _valueMulFloat():
+    a, b = SIUnits.meterUnit(3.5).toFloat(), SIUnits.secondUnit(2).toFloat()
+    return lambda: a * b
+
+@benchmark("value.pow")
+def _valuePow():
+    a = SIUnits.meterUnit(3.5)
+    return lambda: a ** 2
+
+@benchmark("value.lt")
+def _valueLt():
+    a, b = _meters()
+    return lambda: a < b
+
+@benchmark("value.eq")
+def _valueEq():
+    a, b = _meters()
+    return lambda: a == b
+
+@benchmark("hash.unit")
+def _hashUnit():
+    unit = Unit("m", power=2)
+    return lambda: hash(unit)
+
+@benchmark("hash.fraction")
+def _hashFraction():
+    unit = SIDerivedUnits.voltUnit(1).unit
+    return lambda: hash(unit)
+
+@benchmark("hash.value")
+def _hashValue():
+    value = SIDerivedUnits.voltUnit(1.5)
+    return lambda: hash(value)
+
+@benchmark("str.unit")
+def _strUnit():
+    unit = Unit("m", power=2)
+    return lambda: str(unit)
+
+@benchmark("str.fraction")
+def _strFraction():
+    unit = SIDerivedUnits.voltUnit(1).unit
+    return lambda: str(unit)
+
+@benchmark("str.value")
+def _strValue():
+    value = SIDerivedUnits.voltUnit(1.5)
+    return lambda: str(value)
+
+
+def _registerFactories(module):
+    shortName = module.__name__.rsplit(".", 1)[-1]
+    for name, factory in inspect.getmembers(module, inspect.isfunction):
+        if not name.endswith("Unit") or factory.__module__ != module.__name__:
+            continue
+        benchmark(f"factory.{shortName}.{name}")(lambda factory=factory: lambda: factory(3.5))
+
+for _module in (SIUnits, SIDerivedUnits, ImperialUnits):
+    _registerFactories(_module)
+
+
+def measure(setup, number: int, repeat: int) -> Dict[str, float]:
+    timer = timeit.Timer(setup())
+    if number <= 0:
+        number, _ = timer.autorange()
+    times = [t / number for t in timer.repeat(repeat=repeat, number=number)]
+    return {"best": min(times), "median": statistics.median(times), "number": number, "repeat": repeat}
+
+def _commit():
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+def run(pattern: str, number: int, repeat: int, verbose: bool=True) -> dict:
+    results = dict()
+    for name in sorted(benchmarks):
+        if not fnmatch.fnmatchcase(name, pattern):
+            continue
+        results[name] = measure(benchmarks[name], number, repeat)
+        if verbose:
+            print(f"{name:<45} {results[name]['best']*1e9:>10.0f} ns", file=sys.stderr)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "commit": _commit(),
+        },
+        "results": results,
+    }
+
+def compare(baseline: dict, current: dict, threshold: float) -> int:
+    regressions = 0
+    old, new = baseline["results"], current["results"]
+    print(f"{'benchmark':<45} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for name in sorted(set(old) | set(new)):
+        if name not in old or name not in new:
+            where = "baseline" if name not in old else "current"
+            print(f"{name:<45} {'missing in ' + where:>29}")
+            continue
+        ratio = new[name]["best"] / old[name]["best"]
+        mark = ""
+        if ratio > threshold:
+            mark = "  slower"
+            regressions += 1
+        elif ratio < 1/threshold:
+            mark = "  faster"
+        print(f"{name:<45} {old[name]['best']*1e9:>8.0f}ns {new[name]['best']*1e9:>8.0f}ns {ratio:>6.2f}x{mark}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Timings of the core unit engine, stored as JSON baselines.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    runParser = commands.add_parser("run", help="run the benchmarks and write the results as JSON")
+    runParser.add_argument("-o", "--output", help="JSON file to write (default: stdout)")
+    runParser.add_argument("-k", "--filter", default="*", help="glob over benchmark names")
+    runParser.add_argument("-n", "--number", type=int, default=0, help="calls per repeat (default: calibrated)")
+    runParser.add_argument("-r", "--repeat", type=int, default=5)
+
+    compareParser = commands.add_parser("compare", help="compare two JSON results")
+    compareParser.add_argument("baseline")
+    compareParser.add_argument("current")
+    compareParser.add_argument("-t", "--threshold", type=float, default=1.10,
+                               help="ratio above which a benchmark counts as a regression")
+
+    commands.add_parser("list", help="list the benchmark names")
+
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        for name in sorted(benchmarks):
+            print(name)
+        return 0
+
+    if args.command == "run":
+        results = run(args.filter, args.number, args.repeat)
+        text = json.dumps(results, indent=2, sort_keys=True)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(text + "\n")
+        else:
+            print(text)
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    regressions = compare(baseline, current, args.threshold)
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
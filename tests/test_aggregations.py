@@ -0,0 +1,65 @@
+import unittest
+from fractions import Fraction
+
+from PyUnits.unitRepresentation import Aggregations
+from PyUnits.unitRepresentation.Units import FloatValueUnits, Unit, ValueUnits
+
+
+def _readings():
+    meter = Unit("m")
+    return [ValueUnits(1, meter, 3), ValueUnits(500, meter), ValueUnits(2, meter, 3)]
+
+
+class AggregationsTest(unittest.TestCase):
+
+    def testResultsKeepTheFirstScale(self):
+        total = Aggregations.sum(_readings())
+        self.assertEqual((total.value, total.exp10, total.unit), (3.5, 3, Unit("m")))
+        self.assertEqual(Aggregations.sum(reading for reading in _readings()), total)
+        self.assertEqual(Aggregations.min(_readings()), ValueUnits(500, Unit("m")))
+        self.assertEqual(Aggregations.max(_readings()), ValueUnits(2, Unit("m"), 3))
+        self.assertAlmostEqual(float(Aggregations.mean(_readings())), 3500/3)
+
+    def testMatchesBuiltinSum(self):
+        meter = Unit("m")
+        readings = [ValueUnits(Fraction(value, 7), meter) for value in range(20)]
+        self.assertEqual(Aggregations.sum(readings), sum(readings[1:], readings[0]))
+        self.assertEqual(Aggregations.fsum([ValueUnits(0.1, meter)] * 10).value, 1.0)
+
+    def testVariance(self):
+        variance = Aggregations.variance(_readings())
+        self.assertEqual(variance.unit, Unit("m")**2)
+        self.assertAlmostEqual(float(variance), 583333.3333333334)
+        self.assertAlmostEqual(float(Aggregations.variance(_readings(), ddof=0)), 388888.8888888889)
+        with self.assertRaises(ValueError):
+            Aggregations.variance(_readings()[:1])
+        with self.assertRaises(ValueError):
+            Aggregations.variance(_readings(), ddof=-1)
+
+    def testEmpty(self):
+        self.assertEqual(Aggregations.sum([]), 0)
+        self.assertEqual(Aggregations.fsum([]), 0.0)
+        for reduction in (Aggregations.mean, Aggregations.min, Aggregations.max):
+            with self.assertRaises(ValueError):
+                reduction([])
+
+    def testModes(self):
+        readings = [reading.toFloat() for reading in _readings()]
+        self.assertIs(type(Aggregations.sum(readings)), FloatValueUnits)
+        self.assertAlmostEqual(float(Aggregations.sum(readings)), 3500)
+        with self.assertRaises(TypeError):
+            Aggregations.sum(_readings() + readings)
+
+    def testMismatches(self):
+        with self.assertRaises(ValueError):
+            Aggregations.sum(_readings() + [ValueUnits(1, Unit("s"))])
+        with self.assertRaises(ValueError):
+            Aggregations.sum(_readings() + [ValueUnits(1, Unit("m", "k"))])
+        with self.assertRaises(TypeError):
+            Aggregations.sum(_readings() + [3])
+        with self.assertRaises(TypeError):
+            Aggregations.sum([3])
+
+
+if __name__ == "__main__":
+    unittest.main()
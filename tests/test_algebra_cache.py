@@ -0,0 +1,73 @@
+import unittest
+
+from PyUnits.unitRepresentation.AlgebraCache import AlgebraCache, unitAlgebraCache
+from PyUnits.unitRepresentation.Units import Unit, UnitsFraction
+
+
+class AlgebraCacheTest(unittest.TestCase):
+
+    def testHitsAndMisses(self):
+        cache = AlgebraCache(4)
+        calls = []
+        compute = lambda: calls.append(1) or len(calls)
+        self.assertEqual(cache.get("a", compute), 1)
+        self.assertEqual(cache.get("a", compute), 1)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(cache.info(), (1, 1, 4, 1))
+
+    def testLeastRecentlyUsedIsEvicted(self):
+        cache = AlgebraCache(2)
+        cache.get("a", lambda: 1)
+        cache.get("b", lambda: 2)
+        cache.get("a", lambda: 0)
+        cache.get("c", lambda: 3)
+        self.assertEqual(cache.get("a", lambda: 0), 1)
+        self.assertEqual(cache.get("b", lambda: 0), 0)
+
+    def testResizeAndClear(self):
+        cache = AlgebraCache(3)
+        for key in "abc":
+            cache.get(key, lambda: key)
+        cache.resize(1)
+        self.assertEqual(cache.info().currsize, 1)
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 1, 0))
+        cache.resize(0)
+        cache.get("a", lambda: 1)
+        self.assertEqual(cache.info().currsize, 0)
+        with self.assertRaises(TypeError):
+            AlgebraCache(1.5)
+
+
+class UnitAlgebraTest(unittest.TestCase):
+
+    def setUp(self):
+        unitAlgebraCache.clear()
+
+    def tearDown(self):
+        unitAlgebraCache.clear()
+
+    def testRepeatedProductsHitTheCache(self):
+        meter, second = Unit("m"), Unit("s")
+        first = meter / second
+        self.assertEqual(unitAlgebraCache.info().misses, 1)
+        self.assertIs(meter / second, first)
+        self.assertEqual(unitAlgebraCache.info().hits, 1)
+        self.assertEqual(meter * second, UnitsFraction([meter, second], divide=False))
+        self.assertEqual(meter / second // second, UnitsFraction(meter, second**2, divide=True))
+
+    def testPowersAreCached(self):
+        speed = Unit("m") / Unit("s")
+        self.assertIs(speed**2, speed**2)
+        self.assertEqual(speed**2, UnitsFraction(Unit("m", power=2), Unit("s", power=2), divide=True))
+
+    def testEqualUnitsThatPrintApartStayApart(self):
+        second = Unit("s")
+        integral = Unit("m", power=2) / second
+        real = Unit("m", power=2.0) / second
+        self.assertEqual(integral, real)
+        self.assertNotEqual(str(integral), str(real))
+
+
+if __name__ == "__main__":
+    unittest.main()
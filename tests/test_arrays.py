@@ -0,0 +1,38 @@
+import unittest
+
+import numpy as np
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Arrays import QuantityArray
+
+
+class QuantityArrayTest(unittest.TestCase):
+
+    def setUp(self):
+        self.meter = SIUnits.meterUnit(1).unit
+
+    def testZeroDimensional(self):
+        scalar = QuantityArray(np.float64(3), self.meter)
+        self.assertEqual(scalar[()], SIUnits.meterUnit(3))
+        with self.assertRaises(TypeError):
+            len(scalar)
+        with self.assertRaises(TypeError):
+            iter(scalar)
+
+    def testQuantityComparesElementwise(self):
+        array = QuantityArray([1, 2, 3], self.meter)
+        quantity = SIUnits.meterUnit(2)
+        self.assertEqual((quantity == array).tolist(), [False, True, False])
+        self.assertEqual((quantity != array).tolist(), [True, False, True])
+        self.assertEqual((array == quantity).tolist(), [False, True, False])
+
+    def testQuantityEqualityWithOtherTypes(self):
+        quantity = SIUnits.meterUnit(2)
+        self.assertFalse(quantity == object())
+        self.assertTrue(quantity != object())
+        self.assertFalse(quantity == 2)
+        self.assertTrue(quantity != None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Checked import checkUnits
+
+
+@checkUnits("m", "s", output="m/s")
+def speed(distance, time=SIUnits.secondUnit(2)):
+    return distance / time
+
+@checkUnits("m", scale="s")
+def scaled(distance, scale=None, count=3):
+    return distance if scale is None else distance / scale
+
+
+class CheckUnitsTest(unittest.TestCase):
+
+    def testQuantityDefaultIsChecked(self):
+        self.assertEqual(str(speed(SIUnits.meterUnit(10))), "5.0 [m/s]")
+
+    def testKeywordsAndPrefixes(self):
+        result = speed(time=SIUnits.secondUnit(5, exp10=-3), distance=SIUnits.meterUnit(1, exp10=3))
+        self.assertAlmostEqual(float(result), 200000)
+
+    def testPlainDefaultIsPassedThrough(self):
+        self.assertEqual(scaled(SIUnits.meterUnit(4)), 4)
+        self.assertEqual(scaled(SIUnits.meterUnit(4), SIUnits.secondUnit(2)), 2)
+
+    def testErrors(self):
+        with self.assertRaises(TypeError):
+            scaled(SIUnits.meterUnit(4), 2)
+        with self.assertRaises(TypeError):
+            speed(SIUnits.secondUnit(1))
+        with self.assertRaises(TypeError):
+            speed()
+
+
+if __name__ == "__main__":
+    unittest.main()
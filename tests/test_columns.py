@@ -0,0 +1,48 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Columns import ColumnWriter, openColumn
+from PyUnits.unitRepresentation.Units import ValueUnits
+
+
+class ColumnWriterTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "column")
+        self.meter = SIUnits.meterUnit(1).unit
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def testExactCastsAreWritten(self):
+        with ColumnWriter(self.path, self.meter, 0, "<i8") as column:
+            column.append([1, 2])
+            column.append(ValueUnits(3, self.meter, 2))
+            column.append(np.array([4.0]))
+        self.assertEqual(openColumn(self.path).values.tolist(), [1, 2, 300, 4])
+
+    def testLossyCastsRaise(self):
+        with ColumnWriter(self.path, self.meter, 0, "<i8") as column:
+            for values in (ValueUnits(15, self.meter, -2), [1.5], [np.nan], [2**63], [1+1j]):
+                with self.assertRaises(ValueError):
+                    column.append(values)
+            self.assertEqual(column.count, 0)
+        with ColumnWriter(self.path, self.meter, 0, "<i1") as column:
+            with self.assertRaises(ValueError):
+                column.append([300])
+
+    def testFloatColumns(self):
+        with ColumnWriter(self.path, self.meter, 0, "<f4") as column:
+            column.append([0.1, 1e30])
+            with self.assertRaises(ValueError):
+                column.append([1e300])
+        self.assertEqual(len(openColumn(self.path)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,34 @@
+import unittest
+
+import numpy as np
+
+from PyUnits.quantities import SIUnits
+from PyUnits.quantities.Conversions import convert, conversionFactor
+from PyUnits.unitRepresentation.Arrays import QuantityArray
+
+
+class ConvertTest(unittest.TestCase):
+
+    def testPlainValues(self):
+        self.assertAlmostEqual(convert(3, "ft", "m"), 0.9144)
+        np.testing.assert_allclose(convert([0, 100], "°C", "°F"), [32, 212])
+        np.testing.assert_allclose(convert(np.array([1.0, 2.0]), "mi", "m"), [1609.344, 3218.688])
+        with self.assertRaises(ValueError):
+            conversionFactor("m", "s")
+
+    def testQuantityArraysAreChecked(self):
+        meter = SIUnits.meterUnit(1).unit
+        np.testing.assert_allclose(convert(QuantityArray([1, 2], meter, 3), "m", "km"), [1, 2])
+        with self.assertRaises(ValueError):
+            convert(QuantityArray([1, 2], meter), "s", "s")
+        with self.assertRaises(ValueError):
+            convert(QuantityArray([1, 2], meter), "ft", "m")
+
+    def testQuantities(self):
+        self.assertAlmostEqual(convert(SIUnits.kilometerUnit(2), "m", "mi"), 2000 / 1609.344)
+        with self.assertRaises(ValueError):
+            convert(SIUnits.secondUnit(2), "m", "ft")
+
+
+if __name__ == "__main__":
+    unittest.main()
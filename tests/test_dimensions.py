@@ -0,0 +1,65 @@
+import unittest
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Dimensions import Dimension, dimensionalize
+from PyUnits.unitRepresentation.Units import Unit, ValueUnits
+
+
+length = (1, 0, 0, 0, 0, 0, 0)
+
+
+class DimensionTest(unittest.TestCase):
+
+    def setUp(self):
+        self.meter = Unit("m")
+        self.scaled = Dimension.fromUnit(Unit("m", "k"))
+        self.plain = Dimension.fromUnit(self.meter)
+
+    def testEqualityInBothOrders(self):
+        self.assertTrue(self.plain == self.meter)
+        self.assertTrue(self.meter == self.plain)
+        self.assertEqual(hash(self.plain), hash(self.meter))
+        self.assertFalse(self.scaled == self.meter)
+        self.assertFalse(self.meter == self.scaled)
+        self.assertFalse(self.scaled.hasSameUnit(self.meter))
+        self.assertFalse(self.meter.hasSameUnit(self.scaled))
+
+    def testScaleKeptInBothOrders(self):
+        self.assertEqual(self.meter * self.scaled, Dimension((2, 0, 0, 0, 0, 0, 0), 3))
+        self.assertEqual(self.scaled * self.meter, Dimension((2, 0, 0, 0, 0, 0, 0), 3))
+        product = ValueUnits(1, self.meter) * ValueUnits(1, self.scaled)
+        self.assertEqual(float(dimensionalize(product)), 1000)
+        self.assertEqual(ValueUnits(1, self.scaled) * ValueUnits(1, self.meter), product)
+
+    def testScaledDimensionsDontMixWithOtherUnits(self):
+        foot = Unit("ft")
+        with self.assertRaises(TypeError):
+            foot * self.scaled
+        with self.assertRaises(TypeError):
+            self.scaled * foot
+        with self.assertRaises(TypeError):
+            ValueUnits(1, self.meter) + ValueUnits(1, self.scaled)
+        with self.assertRaises(TypeError):
+            ValueUnits(1, self.scaled) + ValueUnits(1, self.meter)
+
+    def testCancelledScalesFoldIntoTheValue(self):
+        meter = Dimension(length)
+        self.assertEqual(ValueUnits(3, self.scaled) / ValueUnits(2, meter), 1500)
+        self.assertEqual(ValueUnits(3, meter) / ValueUnits(2, self.scaled), 1.5e-3)
+        self.assertEqual(ValueUnits(3, self.scaled, 2) / ValueUnits(2, self.meter), 150000)
+        self.assertEqual(ValueUnits(3, self.meter) / ValueUnits(2, self.scaled), 1.5e-3)
+        result = ValueUnits(3, self.scaled, numeric="float") / ValueUnits(2, meter, numeric="float")
+        self.assertEqual(result, 1500)
+
+    def testDimensionalizedQuantities(self):
+        result = dimensionalize(SIUnits.kilometerUnit(3)) / dimensionalize(SIUnits.meterUnit(2))
+        self.assertEqual(result, 1500)
+
+    def testNumbersAreNotUnits(self):
+        for unit in (2, 10, 1e-3):
+            with self.assertRaises(TypeError):
+                ValueUnits(3, unit)
+
+
+if __name__ == "__main__":
+    unittest.main()
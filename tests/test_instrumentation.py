@@ -0,0 +1,68 @@
+import unittest
+
+from PyUnits.unitRepresentation import Instrumentation
+from PyUnits.unitRepresentation.AlgebraCache import unitAlgebraCache
+from PyUnits.unitRepresentation.Instrumentation import instrument, isEnabled
+from PyUnits.unitRepresentation.Units import Unit, UnitsFraction, ValueUnits
+
+
+class InstrumentTest(unittest.TestCase):
+
+    def testCountsOperations(self):
+        meter = Unit("m")
+        with instrument() as session:
+            for value in range(3):
+                str(ValueUnits(value, meter))
+        counts = session.report.counts
+        self.assertEqual(counts["ValueUnits.new"], 3)
+        self.assertEqual(counts["ValueUnits.str"], 3)
+        self.assertNotIn("UnitsFraction.new", counts)
+        self.assertEqual(set(session.report.times), set(counts))
+        self.assertGreater(session.report.elapsed, 0)
+
+    def testCacheDeltas(self):
+        meter, second = Unit("m"), Unit("s")
+        unitAlgebraCache.clear()
+        meter / second
+        with instrument() as session:
+            meter / second
+            meter / second
+        self.assertEqual(session.report.caches["algebra"], (2, 0))
+
+    def testMethodsAreRestored(self):
+        original = ValueUnits.__str__
+        originalNew = UnitsFraction.__dict__["__new__"]
+        self.assertFalse(isEnabled())
+        with instrument():
+            with instrument() as inner:
+                self.assertTrue(isEnabled())
+                self.assertIsNot(ValueUnits.__str__, original)
+                str(ValueUnits(1, Unit("m")))
+            self.assertTrue(isEnabled())
+        self.assertFalse(isEnabled())
+        self.assertIs(ValueUnits.__str__, original)
+        self.assertIs(UnitsFraction.__dict__["__new__"], originalNew)
+        self.assertEqual(inner.report.counts["ValueUnits.str"], 1)
+        self.assertEqual(Instrumentation._originals, dict())
+
+    def testRestoredOnError(self):
+        original = Unit.__hash__
+        with self.assertRaises(ZeroDivisionError):
+            with instrument():
+                1/0
+        self.assertIs(Unit.__hash__, original)
+        self.assertFalse(isEnabled())
+
+    def testExport(self):
+        metrics = []
+        with instrument(lambda name, value: metrics.append((name, value))) as session:
+            hash(ValueUnits(1, Unit("m")))
+        self.assertEqual(metrics, list(session.report.metrics()))
+        names = dict(metrics)
+        self.assertEqual(names["ValueUnits.hash.count"], 1)
+        self.assertIn("elapsed_ns", names)
+        self.assertIn("cache.parser.hits", names)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import gc
+import unittest
+
+from PyUnits.unitRepresentation.Units import Unit, UnitsFraction
+
+
+class InterningTest(unittest.TestCase):
+
+    def testEqualUnitsAreShared(self):
+        self.assertIs(Unit("m"), Unit("m"))
+        self.assertIs(Unit("g", "k", power=2), Unit("g", "k", power=2))
+        self.assertIs(Unit("m").copy(), Unit("m"))
+
+    def testDifferentUnitsAreNot(self):
+        self.assertIsNot(Unit("m"), Unit("m", "k"))
+        self.assertIsNot(Unit("m"), Unit("m", power=2))
+        # the power's type is part of the key, so m^2 and m^2.0 keep printing apart
+        self.assertIsNot(Unit("m", power=2), Unit("m", power=2.0))
+        self.assertEqual(Unit("m", power=2), Unit("m", power=2.0))
+
+    def testNegativePowersAreFractions(self):
+        self.assertIsInstance(Unit("m", power=-1), UnitsFraction)
+
+    def testUnreferencedUnitsAreDropped(self):
+        unit = Unit("interned_test_unit")
+        self.assertIn(unit, Unit._interned.values())
+        del unit
+        gc.collect()
+        self.assertNotIn("interned_test_unit", [unit.unit for unit in Unit._interned.values()])
+
+    def testInvalidArgumentsStillRaise(self):
+        with self.assertRaises(TypeError):
+            Unit(1)
+        with self.assertRaises(TypeError):
+            Unit("m", power=[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
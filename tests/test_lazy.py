@@ -0,0 +1,30 @@
+import unittest
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Lazy import lazy, variable
+
+
+class LazyTest(unittest.TestCase):
+
+    def testDimensionlessAddition(self):
+        x = variable("x")
+        self.assertEqual((lazy(1) + lazy(2)).evaluate(), 3)
+        self.assertEqual(((x/x) + 1).evaluate(x=SIUnits.meterUnit(3)), 2)
+        with self.assertRaises(TypeError):
+            (lazy(1) + x).evaluate(x=SIUnits.meterUnit(1))
+
+    def testPowersMatchEagerResults(self):
+        x = variable("x")
+        value = SIUnits.meterUnit(-3)
+        self.assertEqual(str(((x**2)**0.5).evaluate(x=value)), str((value**2)**0.5))
+        self.assertEqual(str(((x**2)**3).evaluate(x=value)), str((value**2)**3))
+
+    def testDivisionByZeroIsKept(self):
+        x = variable("x")
+        for expression in (x/x, (x**-1)**-1):
+            with self.assertRaises(ZeroDivisionError):
+                expression.evaluate(x=SIUnits.meterUnit(0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from fractions import Fraction
+
+from PyUnits.unitRepresentation.Units import Unit, ValueUnits, FloatValueUnits, setNumericMode
+
+
+class NumericModeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.meter = Unit("m")
+        self.previous = setNumericMode("float")
+
+    def tearDown(self):
+        setNumericMode(self.previous)
+
+    def testExactQuantitiesStayExact(self):
+        quantity = ValueUnits(10**20 + 1, self.meter, numeric="exact")
+        results = [quantity + quantity, quantity - quantity, quantity * 2, 2 * quantity, quantity / 1,
+                   quantity // 2, -quantity, abs(quantity), round(quantity), quantity ** 2,
+                   quantity * quantity, quantity / ValueUnits(1, Unit("s"), numeric="exact")]
+        for result in results:
+            self.assertIs(type(result), ValueUnits, str(result))
+        self.assertEqual((quantity + quantity).value, 2*10**20 + 2)
+        self.assertEqual((quantity * Fraction(1, 3)).value, Fraction(10**20 + 1, 3))
+
+    def testGlobalModeAppliesToNewQuantities(self):
+        self.assertIs(type(ValueUnits(1, self.meter)), FloatValueUnits)
+        quantity = ValueUnits(1, self.meter)
+        self.assertIs(type(quantity + quantity), FloatValueUnits)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Parallel import parallelApply, parallelMap
+
+
+def _double(quantity):
+    return quantity * 2
+
+def _magnitude(quantity):
+    return float(quantity.value) * 10**quantity.exp10
+
+def _totals(chunk):
+    total = sum(float(quantity.value) for quantity in chunk)
+    return [total] * len(chunk)
+
+
+def _inputs():
+    return [SIUnits.meterUnit(value) if value % 3 else SIUnits.secondUnit(value, exp10=1) for value in range(40)]
+
+
+class ParallelMapTest(unittest.TestCase):
+
+    def testMatchesSerialMap(self):
+        inputs = _inputs()
+        expected = [_double(quantity) for quantity in inputs]
+        for workers in (1, 2):
+            results = parallelMap(_double, inputs, workers=workers, chunkSize=7)
+            self.assertEqual(results, expected)
+            self.assertEqual([str(result) for result in results], [str(quantity) for quantity in expected])
+
+    def testPlainResults(self):
+        inputs = _inputs()
+        self.assertEqual(parallelMap(_magnitude, inputs, workers=2), [_magnitude(quantity) for quantity in inputs])
+        self.assertEqual(parallelMap(_magnitude, [], workers=2), [])
+
+    def testApplyRunsPerChunk(self):
+        inputs = [SIUnits.meterUnit(value) for value in range(6)]
+        self.assertEqual(parallelApply(_totals, inputs, workers=2, chunkSize=3), [3.0]*3 + [12.0]*3)
+
+    def testInvalidArguments(self):
+        with self.assertRaises(ValueError):
+            parallelMap(_double, _inputs(), workers=0)
+        with self.assertRaises(ValueError):
+            parallelMap(_double, _inputs(), chunkSize=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import random
+import unittest
+
+from PyUnits.quantities import SIDerivedUnits, SIUnits
+from PyUnits.unitRepresentation.Parser import parseQuantity, parseUnit, splitQuantity
+from PyUnits.unitRepresentation.Units import Unit, ValueUnits
+
+
+class ParseQuantityTest(unittest.TestCase):
+
+    def testFloatsRoundTrip(self):
+        meter = Unit("m")
+        generator = random.Random(0)
+        for _ in range(2000):
+            value = generator.uniform(-1, 1) * 10.0**generator.randint(-300, 300)
+            parsed = parseQuantity(str(ValueUnits(value, meter)))
+            self.assertIs(type(parsed.value), float)
+            self.assertEqual(parsed.value, value)
+            self.assertEqual(parsed.exp10, 0)
+
+    def testFloatExponents(self):
+        self.assertEqual(splitQuantity("1e+20 [m]"), ("1e+20", 0, "m"))
+        self.assertEqual(splitQuantity("1.5e-05 [m]"), ("1.5e-05", 0, "m"))
+        self.assertEqual(splitQuantity("6.617833750096048e-28 [m]"), ("6.617833750096048e-28", 0, "m"))
+
+    def testQuantityExponents(self):
+        meter = Unit("m")
+        for quantity in (ValueUnits(3, meter, 2), ValueUnits(3, meter, -2), ValueUnits(15, meter, 21), ValueUnits(1.5, meter, 3)):
+            parsed = parseQuantity(str(quantity))
+            self.assertEqual((parsed.value, parsed.exp10), (quantity.value, quantity.exp10))
+            self.assertIs(type(parsed.value), type(quantity.value))
+
+
+class ParseUnitTest(unittest.TestCase):
+
+    def testPrintedUnitsRoundTrip(self):
+        for quantity in (SIDerivedUnits.newtonUnit(1), SIDerivedUnits.ohmUnit(1), SIUnits.kilogramUnit(1), SIUnits.centimeterUnit(1)**2):
+            self.assertEqual(parseUnit(str(quantity.unit)), quantity.unit)
+
+    def testSymbolsAndPrefixes(self):
+        self.assertEqual(parseUnit("km"), Unit("m", "k"))
+        self.assertEqual(parseUnit("mol"), SIUnits.molUnit(1).unit)
+        self.assertEqual(parseUnit("cd"), SIUnits.candelaUnit(1).unit)
+        self.assertEqual(parseUnit("foo"), Unit("foo"))
+        self.assertEqual(parseUnit("1/((s^3)*A)"), None / (Unit("s", power=3) * Unit("A")))
+        self.assertEqual(parseUnit("(m*s)^2"), Unit("m", power=2) * Unit("s", power=2))
+        self.assertEqual(parseUnit("1"), 1)
+
+    def testInvalidExpressions(self):
+        for text in ("m*", "(m^x)", "2", "m)"):
+            with self.assertRaises(ValueError):
+                parseUnit(text)
+        with self.assertRaises(TypeError):
+            parseUnit(1)
+
+    def testResultsAreCached(self):
+        parseUnit.cache_clear()
+        first = parseUnit("kg*m/(s^2)")
+        self.assertIs(parseUnit("kg*m/(s^2)"), first)
+        self.assertEqual(parseUnit.cache_info().hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
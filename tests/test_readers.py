@@ -0,0 +1,43 @@
+import unittest
+
+from PyUnits.unitRepresentation.Readers import readQuantities, readQuantityBatches
+
+
+class ReadQuantityBatchesTest(unittest.TestCase):
+
+    def testOneUnit(self):
+        lines = [f"{i} [m]\n" for i in range(5)]
+        batches = list(readQuantityBatches(lines, batchSize=2))
+        self.assertEqual([batch.values for batch in batches], [[0, 1], [2, 3], [4]])
+
+    def testPendingValuesAreBounded(self):
+        read = list()
+        def lines():
+            for i in range(10):
+                read.append(i)
+                yield f"{i}e{i} [m]\n"
+        batches = readQuantityBatches(lines(), batchSize=3)
+        first = next(batches)
+        self.assertEqual(len(read), 3)
+        self.assertEqual((first.exp10, first.values), (0, [0]))
+        self.assertEqual(sum(len(batch.values) for batch in batches), 9)
+
+    def testMixedUnitsKeepTheirOrder(self):
+        lines = ["1 [m]", "2 [s]", "3 [m]", "4 [s]", "5 [m]"]
+        batches = list(readQuantityBatches(lines, batchSize=4))
+        self.assertEqual([(str(batch.unit), batch.values) for batch in batches],
+                         [("m", [1, 3]), ("s", [2, 4]), ("m", [5])])
+
+
+class ReadQuantitiesTest(unittest.TestCase):
+
+    def testShortRow(self):
+        lines = ["a,b", "1 [m],2 [s]", "3 [m]"]
+        with self.assertRaisesRegex(ValueError, "Line 3: no column 'b'"):
+            list(readQuantities(lines, column="b"))
+        with self.assertRaisesRegex(ValueError, "Line 2: no column 1"):
+            list(readQuantities(lines[1:], column=1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+from PyUnits.quantities import Conversions, ImperialUnits, SIDerivedUnits, SIUnits
+from PyUnits.quantities.Registry import UnitRegistry, registry
+from PyUnits.unitRepresentation.Units import ValueUnits
+
+
+class RegistryLookupTest(unittest.TestCase):
+
+    def testBySymbolNameAndDimension(self):
+        newton = SIDerivedUnits.newtonUnit(1).unit
+        self.assertEqual(registry["N"].name, "newton")
+        self.assertIs(registry["newton"], registry["N"])
+        self.assertIn("N", registry)
+        self.assertIsNone(registry.bySymbol("not_a_unit"))
+        with self.assertRaises(KeyError):
+            registry["not_a_unit"]
+        self.assertEqual([entry.symbol for entry in registry.byDimension(newton)], ["N"])
+        self.assertEqual(registry["°C"].offset, 273.15)
+
+    def testReverseLookup(self):
+        newton = SIDerivedUnits.newtonUnit(1).unit
+        self.assertEqual(registry.displayUnit(newton), "N")
+        self.assertEqual(registry.lookup(newton, -3)[1:], ("m", 0))
+        self.assertEqual(registry.lookup(newton, -4)[1:], ("", -4))
+        self.assertEqual(registry.displayUnit(SIUnits.secondUnit(1).unit**-1), "Hz")
+        self.assertIsNone(registry.lookup(SIUnits.meterUnit(1).unit * SIUnits.candelaUnit(1).unit))
+        with self.assertRaises(TypeError):
+            registry.lookup(3)
+
+    def testDisplayQuantity(self):
+        cubicMeter = (SIUnits.meterUnit(1)**3).unit
+        self.assertEqual(registry.displayQuantity(ValueUnits(2, cubicMeter, -3)), "2 [L]")
+        self.assertEqual(registry.displayQuantity(ValueUnits(3, SIDerivedUnits.newtonUnit(1).unit, -3)), "3 [mN]")
+        self.assertEqual(registry.displayQuantity(5), "5")
+
+
+class RegisterTest(unittest.TestCase):
+
+    def testRegisteredUnitsAreFound(self):
+        units = UnitRegistry()
+        product = SIUnits.meterUnit(1) * SIUnits.secondUnit(1)
+        entry = units.register("msreg", "meterSecondRegistered", product, prefixable=True)
+        self.assertIs(units["msreg"], entry)
+        self.assertEqual(units.displayUnit(product.unit), "msreg")
+        self.assertEqual(units.displayQuantity(ValueUnits(5, product.unit, 3)), "5 [kmsreg]")
+        self.assertIn("msreg", Conversions.conversionTable)
+
+    def testFactorsAreKept(self):
+        units = UnitRegistry()
+        entry = units.register("ftlbreg", "footPoundRegistered", ImperialUnits.footUnit(1) * ImperialUnits.poundUnit(1))
+        self.assertAlmostEqual(entry.factor, 0.3048 * 0.45359237)
+        # not a power of ten of its dimension, so reverse lookups skip it
+        self.assertEqual(units.byDimension(entry.dimension), (entry,))
+        self.assertIsNone(units.lookup(entry.dimension))
+        self.assertEqual(units.displayUnit(entry.dimension), str(entry.dimension))
+
+    def testDuplicatesAndBadArguments(self):
+        units = UnitRegistry()
+        units.register("dupreg", "duplicateRegistered", SIUnits.meterUnit(1))
+        with self.assertRaises(ValueError):
+            units.register("dupreg", "other", SIUnits.meterUnit(1))
+        with self.assertRaises(ValueError):
+            units.register("dupreg2", "duplicateRegistered", SIUnits.meterUnit(1))
+        with self.assertRaises(TypeError):
+            units.register("badreg", "badRegistered", 3)
+        with self.assertRaises(TypeError):
+            units.register("", "emptyRegistered", SIUnits.meterUnit(1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+import unittest
+from decimal import Decimal
+from fractions import Fraction
+
+import numpy as np
+
+from PyUnits.quantities import SIUnits
+from PyUnits.unitRepresentation.Serialization import dumps, loads, encodeUnit, decodeUnit
+from PyUnits.unitRepresentation.Units import Unit
+
+
+class SerializationTest(unittest.TestCase):
+
+    def testNumpyScalars(self):
+        quantities = [SIUnits.meterUnit(np.float64(1.5)), SIUnits.meterUnit(np.int64(3)), np.float32(2)]
+        result = loads(dumps(quantities))
+        self.assertEqual(result, [SIUnits.meterUnit(1.5), SIUnits.meterUnit(3), 2.0])
+        self.assertIs(type(result[1].value), int)
+
+    def testFractions(self):
+        quantities = [SIUnits.meterUnit(Fraction(1, 3)), SIUnits.meterUnit(Fraction(-10**30, 7)), Fraction(5, 2)]
+        result = loads(dumps(quantities))
+        self.assertEqual(result, quantities)
+        self.assertIs(type(result[0].value), Fraction)
+
+    def testUnsupportedValues(self):
+        with self.assertRaises(TypeError):
+            dumps([SIUnits.meterUnit(Decimal(1))])
+
+    def testLongUnitSymbols(self):
+        unit = Unit("x"*300)
+        self.assertEqual(decodeUnit(encodeUnit(unit)).unit, "x"*300)
+        with self.assertRaises(ValueError):
+            encodeUnit(Unit("x"*70000))
+
+
+if __name__ == "__main__":
+    unittest.main()
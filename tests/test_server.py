@@ -0,0 +1,104 @@
+import asyncio
+import json
+import unittest
+
+from PyUnits.unitRepresentation.Server import ConversionServer
+
+
+class ServerTest(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.server = await ConversionServer(window=0.01).start()
+        host, port = self.server.sockets[0].getsockname()[:2]
+        self.reader, self.writer = await asyncio.open_connection(host, port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        await self.server.close()
+
+    async def send(self, *lines):
+        for line in lines:
+            if not isinstance(line, bytes):
+                line = json.dumps(line).encode("utf-8")
+            self.writer.write(line + b"\n")
+        await self.writer.drain()
+        return [json.loads(await asyncio.wait_for(self.reader.readline(), 5)) for _ in lines]
+
+    async def testConvert(self):
+        responses = await self.send(
+            {"id": 1, "op": "convert", "value": 3, "from": "ft", "to": "m"},
+            {"id": 2, "op": "convert", "value": [0, 100], "from": "°C", "to": "°F"},
+            {"id": 3, "op": "check", "from": "kg*m/(s^2)", "to": "N"},
+            {"id": 4, "op": "check", "from": "m", "to": "s"},
+            {"id": 5, "op": "parse", "quantity": "3e2 [km/h]", "to": "m/s"},
+        )
+        self.assertEqual([response["id"] for response in responses], [1, 2, 3, 4, 5])
+        self.assertAlmostEqual(responses[0]["value"], 0.9144)
+        self.assertAlmostEqual(responses[1]["value"][1], 212)
+        self.assertTrue(responses[2]["compatible"])
+        self.assertFalse(responses[3]["compatible"])
+        self.assertAlmostEqual(responses[4]["converted"], 83.333333333)
+
+    async def testPrefixedDerivedUnits(self):
+        responses = await self.send(
+            {"op": "convert", "value": 2, "from": "kN", "to": "N"},
+            {"op": "convert", "value": 1, "from": "kW", "to": "W"},
+            {"op": "convert", "value": 1, "from": "MPa", "to": "kPa"},
+            {"op": "convert", "value": 500, "from": "mV", "to": "V"},
+            {"op": "convert", "value": 1, "from": "kHz", "to": "Hz"},
+            {"op": "convert", "value": 1, "from": "min", "to": "s"},
+        )
+        values = [response["value"] for response in responses]
+        for value, expected in zip(values, [2000, 1000, 1000, 0.5, 1000, 60]):
+            self.assertAlmostEqual(value, expected)
+
+    async def testBatching(self):
+        requests = [{"id": i, "op": "convert", "value": i, "from": "mi", "to": "km"} for i in range(200)]
+        responses = await self.send(*requests)
+        self.assertEqual([response["id"] for response in responses], list(range(200)))
+        self.assertAlmostEqual(responses[10]["value"], 16.09344)
+        stats = self.server.stats.report()
+        self.assertEqual(stats["requests"], 200)
+        self.assertLess(stats["batches"], 200)
+
+    async def testMalformedRequests(self):
+        responses = await self.send(
+            b"garbage",
+            b"[1, 2]",
+            {"id": 1, "op": "nope"},
+            {"id": 2, "op": "convert", "value": 1},
+            {"id": 3, "op": "convert", "value": "x", "from": "m", "to": "ft"},
+            {"id": 4, "op": "convert", "value": 1, "from": "zz", "to": "m"},
+        )
+        for response in responses:
+            self.assertIn("error", response)
+        self.assertEqual([response.get("id") for response in responses], [None, None, 1, 2, 3, 4])
+
+    async def testNonFiniteResults(self):
+        responses = await self.send(
+            {"id": 1, "op": "convert", "value": 1e308, "from": "km", "to": "m"},
+            {"id": 2, "op": "convert", "value": [1, float("nan")], "from": "km", "to": "m"},
+            b'{"id": NaN, "op": "convert", "value": 1e308, "from": "km", "to": "m"}',
+        )
+        for response in responses:
+            self.assertIn("error", response)
+        self.assertEqual([response.get("id") for response in responses], [1, 2, None])
+
+    async def testServerSurvivesBadRequests(self):
+        overflow = b'{"id": 1, "op": "convert", "value": 1' + b"0"*400 + b', "from": "km", "to": "m"}'
+        nested = b"[" * 100000 + b"]" * 100000
+        responses = await self.send(overflow, nested, {"id": 3, "op": "convert", "value": 1, "from": "km", "to": "m"})
+        self.assertIn("error", responses[0])
+        self.assertEqual(responses[0]["id"], 1)
+        self.assertIn("error", responses[1])
+        self.assertEqual(responses[2], {"id": 3, "value": 1000.0})
+        # and for a new connection, in a later batch
+        host, port = self.server.sockets[0].getsockname()[:2]
+        reader, writer = await asyncio.open_connection(host, port)
+        writer.write(b'{"op": "check", "from": "J", "to": "N*m"}\n')
+        self.assertEqual(json.loads(await asyncio.wait_for(reader.readline(), 5)), {"compatible": True})
+        writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from PyUnits.unitRepresentation.Units import Unit, UnitsFraction
+
+
+class CanonicalKeyTest(unittest.TestCase):
+
+    def testOrderDoesNotMatter(self):
+        meter, kilogram, second = Unit("m"), Unit("g", "k"), Unit("s")
+        first = UnitsFraction(meter * kilogram, second, divide=True)
+        second = UnitsFraction(kilogram * meter, second, divide=True)
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+
+    def testPowersOfTheSameUnitAreMerged(self):
+        meter, squared = Unit("m"), Unit("m", power=2)
+        first = UnitsFraction([squared, meter], divide=False)
+        second = UnitsFraction([meter, squared], divide=False)
+        self.assertTrue(first.hasSameUnit(second))
+        self.assertTrue(second.hasSameUnit(first))
+        self.assertEqual(first, second)
+        self.assertEqual(hash(first), hash(second))
+        self.assertEqual(first.canonicalKey, Unit("m", power=3).canonicalKey)
+
+    def testPrefixesStayApart(self):
+        self.assertNotEqual(Unit("m") * Unit("m", "k"), Unit("m", power=2))
+
+
+if __name__ == "__main__":
+    unittest.main()